@@ -25,7 +25,7 @@ import {
   SelectValue,
 } from "@/components/ui/select"
 import { Tabs, TabsContent, TabsList, TabsTrigger } from "@/components/ui/tabs"
-import { requestApi } from "@/lib/api"
+import { requestApi, requestJobResult } from "@/lib/api"
 
 type AnyMap = Record<string, unknown>
 
@@ -555,7 +555,7 @@ export default function CampaignsPage() {
     }
     setEnrichmentBusy(true)
     try {
-      const result = await requestApi<AnyMap>("/api/v1/admin/enrichment/run", {
+      const result = await requestJobResult<AnyMap>("/api/v1/admin/enrichment/run", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({
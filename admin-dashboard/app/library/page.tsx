@@ -33,7 +33,7 @@ import {
   SidebarInset,
   SidebarProvider,
 } from "@/components/ui/sidebar"
-import { requestApi } from "@/lib/api"
+import { requestApi, requestJobResult } from "@/lib/api"
 import { formatNumberFr, formatDateTimeFr } from "@/lib/format"
 import { cn } from "@/lib/utils"
 
@@ -90,7 +90,7 @@ export default function LibraryPage() {
     setIsIngesting(true)
     const toastId = toast.loading("Analyse des documents en cours...")
     try {
-      const res = await requestApi<{ ingested: number, failed: number }>("/api/v1/admin/rag/ingest", { method: "POST" })
+      const res = await requestJobResult<{ ingested: number, failed: number }>("/api/v1/admin/rag/ingest", { method: "POST" })
       toast.dismiss(toastId)
       if (res.ingested > 0) {
         toast.success(`${res.ingested} nouveaux documents indexés !`, {
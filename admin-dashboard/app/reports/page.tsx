@@ -36,7 +36,7 @@ import {
   SidebarProvider,
 } from "@/components/ui/sidebar"
 import { useLoadingTimeout } from "@/hooks/use-loading-timeout"
-import { fetchApi, requestApi, requestApiBlob } from "@/lib/api"
+import { fetchApi, requestApi, requestApiBlob, requestJobResult } from "@/lib/api"
 import { formatDateFr, formatDateTimeFr, formatNumberFr } from "@/lib/format"
 
 type ReportSchedule = {
@@ -227,7 +227,7 @@ export default function ReportsPage() {
   async function runDueSchedules() {
     try {
       setRunningDueSchedules(true)
-      const result = await requestApi<{ executed: number }>("/api/v1/admin/reports/schedules/run-due", {
+      const result = await requestJobResult<{ executed: number }>("/api/v1/admin/reports/schedules/run-due", {
         method: "POST",
       })
       toast.success(`Execution terminee (${result.executed} planification(s)).`)
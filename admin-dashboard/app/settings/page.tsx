@@ -31,7 +31,7 @@ type SettingsPayload = {
   dashboard_refresh_seconds: number
   support_email: string
   theme: "light" | "dark" | "system"
-  default_refresh_mode: "manual" | "polling"
+  default_refresh_mode: "manual" | "polling" | "push"
   notifications: {
     email: boolean
     in_app: boolean
@@ -82,7 +82,7 @@ export default function SettingsPage() {
     dashboard_refresh_seconds: 30,
     support_email: "",
     theme: "system",
-    default_refresh_mode: "polling",
+    default_refresh_mode: "push",
     notifications: {
       email: true,
       in_app: true,
@@ -409,6 +409,7 @@ export default function SettingsPage() {
                     <SelectValue />
                   </SelectTrigger>
                   <SelectContent>
+                    <SelectItem value="push">Temps reel</SelectItem>
                     <SelectItem value="polling">Automatique</SelectItem>
                     <SelectItem value="manual">Manuel</SelectItem>
                   </SelectContent>
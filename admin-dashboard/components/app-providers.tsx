@@ -10,7 +10,7 @@ import { OnboardingManager } from "@/components/onboarding/onboarding-manager"
 import { SessionGuard } from "@/components/session-guard"
 import { ThemeProvider } from "@/components/theme-provider"
 import { Toaster } from "@/components/ui/sonner"
-import { requestApi } from "@/lib/api"
+import { getApiBaseUrl, isMockEnabled, requestApi } from "@/lib/api"
 import {
   getLatestApiMeta,
   subscribeApiMeta,
@@ -21,9 +21,20 @@ import { I18nProvider, useI18n } from "@/lib/i18n"
 
 type AdminSettingsResponse = {
   dashboard_refresh_seconds?: number
+  default_refresh_mode?: "manual" | "polling" | "push"
   theme?: "light" | "dark" | "system"
 }
 
+// Server-pushed change topics and the SWR keys they invalidate.
+const EVENT_TOPIC_PREFIXES: Record<string, string[]> = {
+  leads: ["/api/v1/admin/leads", "/api/v1/admin/stats", "/api/v1/admin/analytics", "/api/v1/admin/funnel"],
+  tasks: ["/api/v1/admin/tasks", "/api/v1/admin/stats", "/api/v1/admin/workload"],
+  notifications: ["/api/v1/admin/notifications"],
+  jobs: ["/api/v1/admin/jobs"],
+}
+// While the push channel is up, polling only runs as a slow safety net.
+const PUSH_FALLBACK_REFRESH_SECONDS = 300
+
 type SyncSettingsContextValue = {
   refreshSeconds: number
 }
@@ -65,12 +76,53 @@ export function useApiSource(): ApiSourceContextValue {
   return React.useContext(ApiSourceContext)
 }
 
+function LiveEventsSyncer({
+  enabled,
+  onConnectedChange,
+}: {
+  enabled: boolean
+  onConnectedChange: (connected: boolean) => void
+}) {
+  const { mutate } = useSWRConfig()
+
+  React.useEffect(() => {
+    if (!enabled || isMockEnabled() || typeof EventSource === "undefined") {
+      onConnectedChange(false)
+      return
+    }
+    // EventSource reconnects by itself and resends Last-Event-ID, so missed events are replayed.
+    const source = new EventSource(`${getApiBaseUrl()}/api/v1/admin/events/stream`, { withCredentials: true })
+    const listeners = Object.entries(EVENT_TOPIC_PREFIXES).map(([topic, prefixes]) => {
+      const listener = () => {
+        void mutate(
+          (key) => typeof key === "string" && prefixes.some((prefix) => key.startsWith(prefix)),
+          undefined,
+          { revalidate: true },
+        )
+      }
+      source.addEventListener(topic, listener)
+      return [topic, listener] as const
+    })
+    source.onopen = () => onConnectedChange(true)
+    source.onerror = () => onConnectedChange(false)
+    return () => {
+      listeners.forEach(([topic, listener]) => source.removeEventListener(topic, listener))
+      source.close()
+      onConnectedChange(false)
+    }
+  }, [enabled, mutate, onConnectedChange])
+
+  return null
+}
+
 function SettingsSyncer({
   children,
   setRefreshSeconds,
+  setPushEnabled,
 }: {
   children: React.ReactNode
   setRefreshSeconds: (s: number) => void
+  setPushEnabled: (enabled: boolean) => void
 }) {
   const { setTheme } = useTheme()
 
@@ -87,6 +139,7 @@ function SettingsSyncer({
 
         const seconds = Number(payload.dashboard_refresh_seconds || 30)
         setRefreshSeconds(Math.max(10, Math.min(seconds, 3600)))
+        setPushEnabled(payload.default_refresh_mode === "push")
 
         if (payload.theme) {
           setTheme(payload.theme)
@@ -102,7 +155,7 @@ function SettingsSyncer({
     return () => {
       active = false
     }
-  }, [setRefreshSeconds, setTheme])
+  }, [setPushEnabled, setRefreshSeconds, setTheme])
 
   return <>{children}</>
 }
@@ -158,6 +211,8 @@ function DataSourceSyncer({
 
 export function AppProviders({ children }: { children: React.ReactNode }) {
   const [refreshSeconds, setRefreshSeconds] = React.useState(30)
+  const [pushEnabled, setPushEnabled] = React.useState(false)
+  const [pushConnected, setPushConnected] = React.useState(false)
   const [statusAnnouncement, setStatusAnnouncement] = React.useState("")
   const [apiSource, setApiSource] = React.useState<ApiSourceContextValue>(() => {
     const latestMeta = getLatestApiMeta()
@@ -194,7 +249,7 @@ export function AppProviders({ children }: { children: React.ReactNode }) {
           <ApiSourceContext.Provider value={apiSource}>
             <SWRConfig
               value={{
-                refreshInterval: refreshSeconds * 1000,
+                refreshInterval: (pushConnected ? PUSH_FALLBACK_REFRESH_SECONDS : refreshSeconds) * 1000,
                 revalidateOnFocus: false,
                 dedupingInterval: 8_000,
                 errorRetryCount: 1,
@@ -203,7 +258,8 @@ export function AppProviders({ children }: { children: React.ReactNode }) {
               }}
             >
               <DataSourceSyncer onMeta={handleMeta}>
-                <SettingsSyncer setRefreshSeconds={setRefreshSeconds}>
+                <SettingsSyncer setRefreshSeconds={setRefreshSeconds} setPushEnabled={setPushEnabled}>
+                  <LiveEventsSyncer enabled={pushEnabled} onConnectedChange={setPushConnected} />
                   <p className="sr-only" role="status" aria-live="polite">
                     {statusAnnouncement}
                   </p>
@@ -13,7 +13,7 @@ import {
     IconSparkles,
     IconArrowLeft,
 } from "@tabler/icons-react"
-import { fetchApi, requestApi } from "@/lib/api"
+import { fetchApi, requestApi, waitForJob, type AdminJob } from "@/lib/api"
 import { AssistantActionPlan } from "./assistant-action-plan"
 import { AssistantRunResult } from "./assistant-run-result"
 
@@ -39,6 +39,7 @@ type RunDetail = {
     created_at?: string | null
     finished_at?: string | null
     actions: ActionItem[]
+    job?: AdminJob
 }
 
 type RunsResponse = {
@@ -115,6 +116,12 @@ export function AssistantProspectPanel() {
             setCurrentRun(result)
             setSelectedRunId(result.id)
             void mutate("/api/v1/admin/assistant/prospect/runs?limit=10")
+            if (result.job) {
+                // The run executes in the background; refresh it once its job settles.
+                await waitForJob(result.job).catch(() => undefined)
+                setCurrentRun(await fetchApi<RunDetail>(`/api/v1/admin/assistant/prospect/runs/${result.id}`))
+                void mutate("/api/v1/admin/assistant/prospect/runs?limit=10")
+            }
         } catch (err) {
             console.error("Execute failed:", err)
         } finally {
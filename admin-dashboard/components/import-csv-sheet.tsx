@@ -4,7 +4,7 @@ import * as React from "react"
 import { IconFileImport } from "@tabler/icons-react"
 import { toast } from "sonner"
 
-import { requestApi } from "@/lib/api"
+import { requestApi, requestJobResult } from "@/lib/api"
 import { Badge } from "@/components/ui/badge"
 import { Button } from "@/components/ui/button"
 import { Input } from "@/components/ui/input"
@@ -141,7 +141,7 @@ export function ImportCsvSheet({ onImported }: { onImported?: () => void }) {
     }
     try {
       setCommitting(true)
-      const payload = await requestApi<CommitResponse>("/api/v1/admin/import/csv/commit", {
+      const payload = await requestJobResult<CommitResponse>("/api/v1/admin/import/csv/commit", {
         method: "POST",
         body: buildFormData(file, selectedTable, mapping),
       })
@@ -2,6 +2,7 @@
 
 import * as React from "react"
 import Link from "next/link"
+import useSWR from "swr"
 import {
   IconCreditCard,
   IconDotsVertical,
@@ -30,6 +31,7 @@ import {
   SidebarMenuItem,
   useSidebar,
 } from "@/components/ui/sidebar"
+import { requestApi } from "@/lib/api"
 import { useI18n } from "@/lib/i18n"
 
 function initialsFromName(name: string): string {
@@ -58,6 +60,12 @@ export function NavUser({
   const { isMobile } = useSidebar()
   const { messages } = useI18n()
   const userInitials = React.useMemo(() => initialsFromName(user.name), [user.name])
+  // Served from maintained counters (no table scan); refreshed by push events on the notifications topic.
+  const { data: unread } = useSWR<{ unread_count: number }>(
+    "/api/v1/admin/notifications/unread-count",
+    (path: string) => requestApi<{ unread_count: number }>(path),
+  )
+  const unreadCount = unread?.unread_count || 0
   const safeAvatar = user.avatar && user.avatar.trim().length > 0 ? user.avatar : undefined
 
   return (
@@ -120,6 +128,11 @@ export function NavUser({
                 <Link href="/notifications">
                   <IconNotification />
                   {messages.userMenu.notifications}
+                  {unreadCount > 0 ? (
+                    <span className="ml-auto rounded-full bg-primary px-1.5 text-xs text-primary-foreground">
+                      {unreadCount > 99 ? "99+" : unreadCount}
+                    </span>
+                  ) : null}
                 </Link>
               </DropdownMenuItem>
             </DropdownMenuGroup>
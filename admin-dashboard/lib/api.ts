@@ -38,7 +38,7 @@ function isRuntimeMockEnabled(): boolean {
   }
 }
 
-function isMockEnabled(): boolean {
+export function isMockEnabled(): boolean {
   if (process.env.NEXT_PUBLIC_USE_MOCK === "true") return true
   return isRuntimeMockEnabled()
 }
@@ -297,6 +297,56 @@ export async function requestApi<T>(
   return payload.data
 }
 
+export type AdminJob<T = unknown> = {
+  id: string
+  kind: string
+  status: "queued" | "running" | "succeeded" | "failed" | "cancelled"
+  progress: number
+  progress_message: string | null
+  result: T | null
+  error_message: string | null
+}
+
+const JOB_POLL_INTERVAL_MS = 1000
+const JOB_POLL_TIMEOUT_MS = 15 * 60 * 1000
+
+function isAdminJob(payload: unknown): payload is AdminJob {
+  if (!payload || typeof payload !== "object") return false
+  const candidate = payload as Record<string, unknown>
+  return typeof candidate.id === "string" && typeof candidate.kind === "string" && "progress" in candidate
+}
+
+export async function waitForJob<T>(
+  job: AdminJob<T>,
+  onProgress?: (job: AdminJob<T>) => void,
+): Promise<T> {
+  const deadline = Date.now() + JOB_POLL_TIMEOUT_MS
+  let current = job
+  while (current.status === "queued" || current.status === "running") {
+    if (Date.now() > deadline) {
+      throw new Error("Tache toujours en cours, consultez la liste des taches.")
+    }
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL_MS))
+    current = await requestApi<AdminJob<T>>(`/api/v1/admin/jobs/${current.id}`)
+    onProgress?.(current)
+  }
+  if (current.status !== "succeeded") {
+    throw new Error(current.error_message || `Tache ${current.status === "cancelled" ? "annulee" : "en echec"}.`)
+  }
+  return current.result as T
+}
+
+/** Start a long-running admin operation (answered with 202 + job) and resolve with the job result. */
+export async function requestJobResult<T>(
+  path: string,
+  init?: RequestInit,
+  onProgress?: (job: AdminJob<T>) => void,
+): Promise<T> {
+  const payload = await requestApi<AdminJob<T> | T>(path, init)
+  // Mocks (and older backends) answer synchronously with the result itself.
+  return isAdminJob(payload) ? waitForJob(payload as AdminJob<T>, onProgress) : (payload as T)
+}
+
 export async function fetchApi<T>(path: string): Promise<T> {
   return requestApi<T>(path)
 }
@@ -2224,6 +2224,16 @@ function handleJson(path: string, init?: RequestInit): unknown {
     state.notification_preferences = { channels: { ...state.notification_preferences.channels, ...((body.channels as JsonObj) || {}) } }
     return clone(state.notification_preferences)
   }
+  if (pathname === "/api/v1/admin/notifications/unread-count" && method === "GET") {
+    const unread = (state.notifications as any[]).filter((n) => !n.is_read)
+    const countBy = (field: string) =>
+      unread.reduce<Record<string, number>>((acc, item) => {
+        const key = String(item[field])
+        acc[key] = (acc[key] || 0) + 1
+        return acc
+      }, {})
+    return { unread_count: unread.length, by_channel: countBy("channel"), by_event_key: countBy("event_key") }
+  }
   if (pathname === "/api/v1/admin/notifications" && method === "GET") {
     const unreadOnly = parseBool(url.searchParams.get("unread_only")) === true
     const channel = String(url.searchParams.get("channel") || "").trim()
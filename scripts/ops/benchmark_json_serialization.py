@@ -0,0 +1,129 @@
+"""Compare the default FastAPI JSON path with FastJSONResponse on hot admin payloads.
+
+Usage:
+    python scripts/ops/benchmark_json_serialization.py --iterations 200 --documents 200
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.admin.stats_service import list_leads
+from src.core.database import Base
+from src.core.db_models import DBCompany, DBLead
+from src.core.models import LeadStage, LeadStatus
+from src.core.serialization import FastJSONResponse, orjson
+
+
+def _seed_leads(session, count: int) -> None:
+    now = datetime.now()
+    company = DBCompany(name="Bench Corp", domain="bench.example", industry="SaaS", location="Paris")
+    session.add(company)
+    session.flush()
+    for index in range(count):
+        created = now - timedelta(minutes=index)
+        session.add(
+            DBLead(
+                id=f"bench-{index}@example.com",
+                email=f"bench-{index}@example.com",
+                first_name="Bench",
+                last_name=str(index),
+                company_id=company.id,
+                status=LeadStatus.NEW,
+                stage=LeadStage.NEW,
+                total_score=float(index % 100),
+                tags=["saas", "paris", f"batch-{index % 7}"],
+                last_scored_at=created,
+                stage_entered_at=created,
+                next_action_at=created + timedelta(days=2),
+                created_at=created,
+                updated_at=created,
+            )
+        )
+    session.commit()
+
+
+def _rag_documents(count: int, dimensions: int) -> dict[str, Any]:
+    rng = random.Random(7)
+    items = [
+        {
+            "id": f"doc-{index}",
+            "source": f"docs/doc-{index}.pdf",
+            "content": "Lorem ipsum dolor sit amet. " * 20,
+            "embedding": [rng.uniform(-1.0, 1.0) for _ in range(dimensions)],
+        }
+        for index in range(count)
+    ]
+    return {"items": items, "total": len(items)}
+
+
+def _time(label: str, func: Callable[[], Any], iterations: int) -> float:
+    func()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed_ms = (time.perf_counter() - started) * 1000 / iterations
+    print(f"  {label:<42} {elapsed_ms:8.3f} ms/op")
+    return elapsed_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--dimensions", type=int, default=768)
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    _seed_leads(session, 250)
+
+    print(f"backend: {'orjson' if orjson is not None else 'stdlib json'}")
+
+    iso_payload = list_leads(session, page=1, page_size=100)
+    native_payload = list_leads(session, page=1, page_size=100, native_datetimes=True)
+    print("list_leads page_size=100 (serialization only)")
+    baseline = _time(
+        "jsonable_encoder + JSONResponse",
+        lambda: JSONResponse(jsonable_encoder(iso_payload)).body,
+        args.iterations,
+    )
+    fast = _time(
+        "FastJSONResponse (native datetimes)",
+        lambda: FastJSONResponse(native_payload).body,
+        args.iterations,
+    )
+    print(f"  speedup x{baseline / fast:.1f}")
+
+    documents = _rag_documents(args.documents, args.dimensions)
+    print(f"/rag/documents ({args.documents} docs x {args.dimensions} dims)")
+    baseline = _time(
+        "jsonable_encoder + JSONResponse",
+        lambda: JSONResponse(jsonable_encoder(documents)).body,
+        max(1, args.iterations // 20),
+    )
+    fast = _time(
+        "FastJSONResponse",
+        lambda: FastJSONResponse(documents).body,
+        max(1, args.iterations // 20),
+    )
+    print(f"  speedup x{baseline / fast:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import sys
+
+# Ensure project root is importable when running as a script.
+ROOT_DIR = Path(__file__).resolve().parents[2]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+
+def main() -> int:
+    # Imported here, not at module level: spawned import-validation workers re-run this script as
+    # __mp_main__ and must not boot the admin app (src.admin's __init__ imports it).
+    import src.admin.app  # noqa: F401 - registers the job handlers
+    from src.admin.job_queue import JobWorker, registered_job_kinds
+    from src.core.database import engine
+
+    parser = argparse.ArgumentParser(description="Run queued admin jobs (rescore, imports, enrichment...)")
+    parser.add_argument("--once", action="store_true", help="Run due jobs until the queue is empty, then exit")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="Seconds between polls when idle")
+    parser.add_argument("--lease-seconds", type=int, default=120, help="Lease length renewed by progress reports")
+    parser.add_argument(
+        "--kinds",
+        default="",
+        help=f"Comma-separated job kinds to run (default: all of {', '.join(registered_job_kinds())})",
+    )
+    args = parser.parse_args()
+
+    kinds = [kind.strip() for kind in args.kinds.split(",") if kind.strip()] or None
+    worker = JobWorker(
+        engine,
+        kinds=kinds,
+        poll_interval_seconds=args.poll_interval,
+        lease_seconds=args.lease_seconds,
+    )
+    if args.once:
+        ran = 0
+        while worker.run_once():
+            ran += 1
+        print(f"[OK] ran {ran} job(s)")
+        return 0
+    print(f"[OK] worker {worker.worker_id} polling every {args.poll_interval}s (Ctrl+C to stop)")
+    try:
+        worker.run_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
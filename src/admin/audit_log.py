@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+import uuid
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from ..core.database import commit_or_flush
+from ..core.db_models import DBAuditLog
+from ..core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+_audit_table = DBAuditLog.__table__
+_PENDING_AUDIT_KEY = "audit_entries_pending"
+
+# Access control, credentials and destructive bulk actions must be on disk before the response returns.
+SECURITY_CRITICAL_ACTIONS = frozenset(
+    {
+        "user_invited",
+        "user_updated",
+        "secret_upserted",
+        "secret_deleted",
+        "webhook_created",
+        "webhook_deleted",
+        "integrations_updated",
+        "settings_updated",
+        "account_updated",
+        "billing_updated",
+        "leads_bulk_deleted",
+    }
+)
+
+
+def audit_entry(
+    *,
+    actor: str,
+    action: str,
+    entity_type: str,
+    entity_id: str | None,
+    metadata: dict[str, Any] | None,
+) -> dict[str, Any]:
+    return {
+        "id": str(uuid.uuid4()),
+        "actor": actor,
+        "action": action,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "metadata_json": metadata or {},
+        "created_at": datetime.now(),
+    }
+
+
+class AuditBuffer:
+    """Queues audit entries and bulk-inserts them in batches, off the request's transaction.
+
+    With ``wal_path`` every entry is also appended to a JSONL segment next to that path before
+    ``record`` returns. Segment names carry the hostname and pid, so workers sharing the setting never
+    write to the same file. Each flush starts a new segment and deletes the previous ones once their
+    entries are in the database. ``recover`` replays segments left behind by processes that are gone.
+    Entries keep the bind of the session that recorded them, so a flush writes each entry to the
+    database its caller was using.
+    """
+
+    def __init__(
+        self,
+        bind: Engine | Connection,
+        *,
+        wal_path: str | Path | None = None,
+        batch_size: int = 200,
+        flush_interval_seconds: float = 1.0,
+        max_pending: int = 10_000,
+    ) -> None:
+        self.bind = bind
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max(self.batch_size, max_pending)
+        self._wal_path = Path(wal_path) if wal_path else None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: deque[tuple[Engine | Connection, dict[str, Any]]] = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._recorded = 0
+        self._flushed = 0
+        self._dropped = 0
+        self._flush_errors = 0
+        self._wal_token = uuid.uuid4().hex[:8]
+        self._wal_segment = 0
+        self._wal_closed: list[Path] = []
+        if self._wal_path is not None:
+            self._wal_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def _wal_segment_path(self) -> Path:
+        assert self._wal_path is not None
+        # The pid is read on every call so a buffer created before a fork gets per-worker segments.
+        owner = f"{socket.gethostname()}-{os.getpid()}-{self._wal_token}"
+        return self._wal_path.with_name(f"{self._wal_path.name}.{owner}-{self._wal_segment}")
+
+    def record(self, entry: dict[str, Any], *, bind: Engine | Connection | None = None) -> None:
+        with self._lock:
+            if self._wal_path is not None:
+                with self._wal_segment_path().open("a", encoding="utf-8") as handle:
+                    handle.write(json.dumps(entry, default=str, separators=(",", ":")) + "\n")
+            self._pending.append((bind or self.bind, entry))
+            self._recorded += 1
+            if len(self._pending) > self.max_pending:
+                # The database has been unreachable for a while: keep the newest entries.
+                self._pending.popleft()
+                self._dropped += 1
+            pending = len(self._pending)
+        if pending >= self.batch_size:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Insert everything queued so far; returns how many entries were written."""
+        with self._flush_lock:
+            with self._lock:
+                batch = list(self._pending)
+                self._pending.clear()
+                if batch and self._wal_path is not None:
+                    # Entries recorded from now on go to a new segment; the closed ones hold this batch.
+                    current = self._wal_segment_path()
+                    if current.exists():
+                        self._wal_closed.append(current)
+                    self._wal_segment += 1
+                closed = list(self._wal_closed)
+            if not batch:
+                return 0
+            by_bind: dict[int, tuple[Engine | Connection, list[dict[str, Any]]]] = {}
+            for bind, entry in batch:
+                by_bind.setdefault(id(bind), (bind, []))[1].append(entry)
+            written = 0
+            failed: list[tuple[Engine | Connection, dict[str, Any]]] = []
+            for bind, entries in by_bind.values():
+                try:
+                    with Session(bind=bind) as db:
+                        for start in range(0, len(entries), self.batch_size):
+                            db.execute(insert(_audit_table), entries[start : start + self.batch_size])
+                        db.commit()
+                    written += len(entries)
+                except Exception as exc:
+                    failed.extend((bind, entry) for entry in entries)
+                    self._flush_errors += 1
+                    logger.warning("Audit log flush failed.", extra={"count": len(entries), "error": str(exc)})
+            with self._lock:
+                self._pending.extendleft(reversed(failed))
+                self._flushed += written
+                if not failed:
+                    # Failed entries are queued again and their segments kept until a flush succeeds.
+                    for segment in closed:
+                        segment.unlink(missing_ok=True)
+                        self._wal_closed.remove(segment)
+            return written
+
+    def recover(self) -> int:
+        """Insert entries from WAL segments of processes that are gone; call before ``start``."""
+        if self._wal_path is None:
+            return 0
+        own = {self._wal_segment_path(), *self._wal_closed}
+        segments = [
+            path
+            for path in sorted(self._wal_path.parent.glob(f"{self._wal_path.name}.*"))
+            if path not in own and not _wal_owner_alive(path.name[len(self._wal_path.name) + 1 :])
+        ]
+        entries: list[dict[str, Any]] = []
+        for path in segments:
+            for line in path.read_text(encoding="utf-8").splitlines():
+                try:
+                    entry = json.loads(line)
+                    entry["created_at"] = datetime.fromisoformat(entry["created_at"])
+                except (KeyError, TypeError, ValueError):
+                    continue
+                entries.append(entry)
+        missing: list[dict[str, Any]] = []
+        if entries:
+            with Session(bind=self.bind) as db:
+                ids = [entry["id"] for entry in entries]
+                existing = set(db.scalars(select(_audit_table.c.id).where(_audit_table.c.id.in_(ids))))
+                missing = list({entry["id"]: entry for entry in entries if entry["id"] not in existing}.values())
+                for start in range(0, len(missing), self.batch_size):
+                    db.execute(insert(_audit_table), missing[start : start + self.batch_size])
+                db.commit()
+        for path in segments:
+            path.unlink(missing_ok=True)
+        if missing:
+            logger.warning("Recovered unflushed audit log entries.", extra={"count": len(missing)})
+        return len(missing)
+
+    def run_forever(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self.flush_interval_seconds)
+            self._wake.clear()
+            self.flush()
+
+    def start(self) -> threading.Thread:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="audit-log-writer", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.flush()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "recorded": self._recorded,
+                "flushed": self._flushed,
+                "dropped": self._dropped,
+                "flush_errors": self._flush_errors,
+            }
+
+
+def _wal_owner_alive(owner: str) -> bool:
+    """Whether the process that wrote a WAL segment (``<host>-<pid>-<token>-<segment>``) may still flush it."""
+    try:
+        host, pid, _token, _segment = owner.rsplit("-", 3)
+        pid_value = int(pid)
+    except ValueError:
+        return True  # not a segment name; leave the file alone
+    if host != socket.gethostname():
+        return True  # workers on other hosts recover their own segments
+    if pid_value == os.getpid():
+        return False  # an earlier buffer of this process, or a dead process whose pid was reused
+    try:
+        os.kill(pid_value, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+def _hand_off_entries(session: Session) -> None:
+    pending = session.info.pop(_PENDING_AUDIT_KEY, None)
+    if not pending:
+        return
+    for buffer, bind, entry in pending:
+        buffer.record(entry, bind=bind)
+
+
+def _discard_entries(session: Session, previous_transaction) -> None:
+    # Same rule as change events: only the outermost rollback discards.
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_AUDIT_KEY, None)
+
+
+_installed = False
+
+
+def install_audit_buffering() -> None:
+    """Hand buffered entries over only once the caller's transaction commits; safe to call twice."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Session, "after_commit", _hand_off_entries)
+    event.listen(Session, "after_soft_rollback", _discard_entries)
+    _installed = True
+
+
+def audit_buffering_enabled() -> bool:
+    return os.getenv("ADMIN_AUDIT_BUFFERED", "true").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def build_audit_buffer(bind: Engine | Connection) -> AuditBuffer:
+    """Configure from ``ADMIN_AUDIT_WAL_PATH`` (empty = memory only), ``ADMIN_AUDIT_BATCH_SIZE`` and
+    ``ADMIN_AUDIT_FLUSH_INTERVAL_SECONDS``."""
+    try:
+        batch_size = int(os.getenv("ADMIN_AUDIT_BATCH_SIZE", "200"))
+    except ValueError:
+        batch_size = 200
+    try:
+        interval = max(0.05, float(os.getenv("ADMIN_AUDIT_FLUSH_INTERVAL_SECONDS", "1")))
+    except ValueError:
+        interval = 1.0
+    return AuditBuffer(
+        bind,
+        wal_path=os.getenv("ADMIN_AUDIT_WAL_PATH", "").strip() or None,
+        batch_size=batch_size,
+        flush_interval_seconds=interval,
+    )
+
+
+def record_audit(
+    db: Session,
+    buffer: AuditBuffer,
+    *,
+    actor: str,
+    action: str,
+    entity_type: str,
+    entity_id: str | None = None,
+    metadata: dict[str, Any] | None = None,
+    sync: bool | None = None,
+    commit: bool = True,
+) -> None:
+    """Record one audit entry.
+
+    Security-critical actions (or ``sync=True``, or ``ADMIN_AUDIT_BUFFERED=false``) are inserted and
+    committed with the caller's transaction as before; everything else reaches ``buffer`` when that
+    transaction commits, so an audited change that is rolled back (atomic batches) leaves no entry.
+    ``commit=False`` only flushes; the caller commits the entry with the rest of its transaction.
+    """
+    install_audit_buffering()
+    entry = audit_entry(actor=actor, action=action, entity_type=entity_type, entity_id=entity_id, metadata=metadata)
+    if sync is None:
+        sync = action in SECURITY_CRITICAL_ACTIONS or not audit_buffering_enabled()
+    if sync:
+        db.add(DBAuditLog(**entry))
+    else:
+        db.info.setdefault(_PENDING_AUDIT_KEY, []).append((buffer, db.get_bind(), entry))
+    # Callers rely on this commit for their own pending changes; without them it is close to free.
+    commit_or_flush(db, commit=commit)
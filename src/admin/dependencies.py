@@ -6,7 +6,6 @@ import hmac
 import os
 import secrets
 import time
-from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from threading import Lock
 from typing import Any, Optional
@@ -16,8 +15,9 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from ..core.database import get_db
-import uuid
+from ..core.rate_limit import build_rate_limiter
 from ..core.db_models import DBAdminSession, DBAdminUser, DBAuditLog
+from .audit_log import audit_entry
 
 def _audit_log(
     db: Session,
@@ -28,13 +28,15 @@ def _audit_log(
     entity_id: str | None = None,
     metadata: dict[str, Any] | None = None,
 ) -> None:
+    # Synchronous: the entry is flushed in the caller's transaction (auth flows); see audit_log.record_audit.
     entry = DBAuditLog(
-        id=str(uuid.uuid4()),
-        actor=actor,
-        action=action,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        metadata_json=metadata or {},
+        **audit_entry(
+            actor=actor,
+            action=action,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            metadata=metadata,
+        )
     )
     db.add(entry)
     db.flush()
@@ -68,7 +70,7 @@ DEFAULT_ADMIN_SETTINGS: dict[str, Any] = {
     "dashboard_refresh_seconds": 30,
     "support_email": "support@example.com",
     "theme": "system",
-    "default_refresh_mode": "polling",
+    "default_refresh_mode": "push",
     "notifications": {"email": True, "in_app": True},
 }
 
@@ -166,7 +168,7 @@ OPPORTUNITY_PIPELINE_STAGE_SET = set(OPPORTUNITY_PIPELINE_STAGES)
 AUTO_TASK_DEFAULT_CHANNELS = ["email", "linkedin", "call"]
 USER_STATUSES = {"active", "invited", "disabled"}
 THEME_OPTIONS = {"light", "dark", "system"}
-REFRESH_MODES = {"manual", "polling"}
+REFRESH_MODES = {"manual", "polling", "push"}
 ROLE_LABELS = {
     "admin": "Administrateur",
     "manager": "Manager",
@@ -238,40 +240,6 @@ def _validate_security_configs() -> None:
             "Please set a secure JWT_SECRET environment variable."
         )
 
-# --- RATE LIMITER ---
-
-class InMemoryRateLimiter:
-    def __init__(self, max_buckets: int = 10000) -> None:
-        self._lock = Lock()
-        self._max_buckets = max_buckets
-        self._hits: OrderedDict[str, list[float]] = OrderedDict()
-
-    def allow(self, key: str, limit: int, window_seconds: int) -> bool:
-        now = time.time()
-        window_start = now - window_seconds
-        with self._lock:
-            entries = self._hits.get(key, [])
-            entries = [stamp for stamp in entries if stamp >= window_start]
-            if not entries:
-                if key in self._hits:
-                    del self._hits[key]
-                
-                # New key? Check capacity.
-                if len(self._hits) >= self._max_buckets:
-                    self._hits.popitem(last=False) # Evict oldest bucket
-                entries = []
-            else:
-                # Move to end (most recently used)
-                self._hits.move_to_end(key)
-
-            if len(entries) >= limit:
-                self._hits[key] = entries
-                return False
-            entries.append(now)
-            self._hits[key] = entries
-            return True
-
-
 class InMemoryRequestMetrics:
     _DYNAMIC_SEGMENT_RE = None  # Lazy-compiled regex
 
@@ -364,7 +332,7 @@ class InMemoryRequestMetrics:
             "endpoints": endpoints_payload[:50],
         }
 
-rate_limiter = InMemoryRateLimiter()
+rate_limiter = build_rate_limiter()
 
 # --- AUTH HELPERS ---
 
@@ -0,0 +1,351 @@
+from __future__ import annotations
+
+import csv
+import gzip
+import importlib.util
+import json
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from itertools import islice
+from typing import Any, Iterator
+
+from fastapi import HTTPException, status
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from ..core.db_models import DBCompany, DBExportJob, DBLead
+from ..core.logging import get_logger
+
+
+if hasattr(status, "HTTP_422_UNPROCESSABLE_CONTENT"):
+    HTTP_422_STATUS = status.HTTP_422_UNPROCESSABLE_CONTENT
+else:  # pragma: no cover
+    HTTP_422_STATUS = 422
+
+
+logger = get_logger(__name__)
+
+DEFAULT_EXPORT_ARTIFACT_DIR = "uploads/exports"
+EXPORT_JOB_BATCH_SIZE = 1000
+EXPORT_WRITE_BATCH_ROWS = 10_000
+EXPORT_JOB_ENTITIES = {"leads"}
+EXPORT_JOB_FORMATS = {
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+    "jsonl.gz": (".jsonl.gz", "application/gzip"),
+    "csv": (".csv", "text/csv; charset=utf-8"),
+}
+# Columns every snapshot row has, with the type of their values; breakdown columns follow.
+LEAD_SNAPSHOT_COLUMNS: dict[str, type] = {
+    "id": str,
+    "email": str,
+    "first_name": str,
+    "last_name": str,
+    "title": str,
+    "status": str,
+    "stage": str,
+    "segment": str,
+    "source": str,
+    "tier": str,
+    "heat_status": str,
+    "icp_score": float,
+    "heat_score": float,
+    "total_score": float,
+    "confidence_score": float,
+    "last_scored_at": str,
+    "created_at": str,
+    "updated_at": str,
+    "company_name": str,
+    "company_domain": str,
+    "company_industry": str,
+    "company_size_range": str,
+    "company_location": str,
+}
+
+
+def get_export_artifact_dir() -> Path:
+    return Path(os.getenv("ADMIN_EXPORT_ARTIFACT_DIR", DEFAULT_EXPORT_ARTIFACT_DIR))
+
+
+def parquet_engine_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def export_media_type(export_format: str) -> str:
+    return EXPORT_JOB_FORMATS[export_format][1]
+
+
+def serialize_export_job(row: DBExportJob) -> dict[str, Any]:
+    return {
+        "id": row.id,
+        "entity": row.entity,
+        "format": row.format,
+        "status": row.status,
+        "source": row.source,
+        "requested_by": row.requested_by,
+        "row_count": int(row.row_count or 0),
+        "size_bytes": int(row.size_bytes or 0),
+        "file_name": Path(row.file_path).name if row.file_path else None,
+        "error_message": row.error_message,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "started_at": row.started_at.isoformat() if row.started_at else None,
+        "finished_at": row.finished_at.isoformat() if row.finished_at else None,
+    }
+
+
+def _flatten_breakdown(prefix: str, breakdown: Any) -> dict[str, Any]:
+    if not isinstance(breakdown, dict):
+        return {}
+    flat: dict[str, Any] = {}
+    for key, value in breakdown.items():
+        if isinstance(value, (int, float, str, bool)) or value is None:
+            flat[f"{prefix}_{key}"] = value
+    return flat
+
+
+def _common_type(kinds: set[type]) -> type:
+    if kinds == {bool}:
+        return bool
+    if kinds and kinds <= {int}:
+        return int
+    if kinds and kinds <= {int, float}:
+        return float
+    return str
+
+
+def lead_snapshot_columns(db: Session) -> dict[str, type]:
+    """Every snapshot column with its value type, breakdown keys included.
+
+    Breakdown keys vary per lead, so they are collected in a first pass over the breakdown columns
+    only; the batched writers need the full column set before the first row is written.
+    """
+    kinds: dict[str, set[type]] = {}
+    query = (
+        db.query(DBLead.icp_breakdown, DBLead.heat_breakdown)
+        .order_by(DBLead.created_at.desc())
+        .yield_per(EXPORT_JOB_BATCH_SIZE)
+    )
+    for icp_breakdown, heat_breakdown in query:
+        flat = {**_flatten_breakdown("icp", icp_breakdown), **_flatten_breakdown("heat", heat_breakdown)}
+        for key, value in flat.items():
+            key_kinds = kinds.setdefault(key, set())
+            if value is not None:
+                key_kinds.add(type(value))
+    columns = dict(LEAD_SNAPSHOT_COLUMNS)
+    columns.update({key: _common_type(key_kinds) for key, key_kinds in kinds.items() if key not in columns})
+    return columns
+
+
+def _coerce_value(value: Any, kind: type) -> Any:
+    if value is None or isinstance(value, kind):
+        return value
+    return str(value) if kind is str else kind(value)
+
+
+def _batches(
+    rows: Iterator[dict[str, Any]],
+    columns: dict[str, type],
+) -> Iterator[list[dict[str, Any]]]:
+    """Rows in batches of ``EXPORT_WRITE_BATCH_ROWS``, each carrying every column with a consistent type."""
+    while batch := list(islice(rows, EXPORT_WRITE_BATCH_ROWS)):
+        yield [{name: _coerce_value(row.get(name), kind) for name, kind in columns.items()} for row in batch]
+
+
+def iter_lead_snapshot_rows(db: Session) -> Iterator[dict[str, Any]]:
+    """Leads with their scores, flattened score breakdowns and company fields."""
+    query = (
+        db.query(
+            DBLead.id,
+            DBLead.email,
+            DBLead.first_name,
+            DBLead.last_name,
+            DBLead.title,
+            DBLead.status,
+            DBLead.stage_canonical,
+            DBLead.segment,
+            DBLead.source,
+            DBLead.tier,
+            DBLead.heat_status,
+            DBLead.icp_score,
+            DBLead.heat_score,
+            DBLead.total_score,
+            DBLead.confidence_score,
+            DBLead.icp_breakdown,
+            DBLead.heat_breakdown,
+            DBLead.last_scored_at,
+            DBLead.created_at,
+            DBLead.updated_at,
+            DBCompany.name.label("company_name"),
+            DBCompany.domain.label("company_domain"),
+            DBCompany.industry.label("company_industry"),
+            DBCompany.size_range.label("company_size_range"),
+            DBCompany.location.label("company_location"),
+        )
+        .outerjoin(DBCompany, DBLead.company_id == DBCompany.id)
+        .order_by(DBLead.created_at.desc())
+        .yield_per(EXPORT_JOB_BATCH_SIZE)
+    )
+    for row in query:
+        record = {
+            "id": row.id,
+            "email": row.email,
+            "first_name": row.first_name,
+            "last_name": row.last_name,
+            "title": row.title,
+            "status": row.status.value if hasattr(row.status, "value") else row.status,
+            "stage": row.stage_canonical,
+            "segment": row.segment,
+            "source": row.source,
+            "tier": row.tier,
+            "heat_status": row.heat_status,
+            "icp_score": float(row.icp_score or 0.0),
+            "heat_score": float(row.heat_score or 0.0),
+            "total_score": float(row.total_score or 0.0),
+            "confidence_score": float(row.confidence_score or 0.0),
+            "last_scored_at": row.last_scored_at.isoformat() if row.last_scored_at else None,
+            "created_at": row.created_at.isoformat() if row.created_at else None,
+            "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+            "company_name": row.company_name,
+            "company_domain": row.company_domain,
+            "company_industry": row.company_industry,
+            "company_size_range": row.company_size_range,
+            "company_location": row.company_location,
+        }
+        record.update(_flatten_breakdown("icp", row.icp_breakdown))
+        record.update(_flatten_breakdown("heat", row.heat_breakdown))
+        yield record
+
+
+def _write_jsonl_gz(rows: Iterator[dict[str, Any]], path: Path) -> int:
+    count = 0
+    with gzip.open(path, "wt", encoding="utf-8") as handle:
+        for row in rows:
+            handle.write(json.dumps(row, ensure_ascii=False, default=str))
+            handle.write("\n")
+            count += 1
+    return count
+
+
+def _write_csv(rows: Iterator[dict[str, Any]], path: Path, columns: dict[str, type]) -> int:
+    count = 0
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(columns))
+        writer.writeheader()
+        for batch in _batches(rows, columns):
+            writer.writerows(batch)
+            count += len(batch)
+    return count
+
+
+def _write_parquet(rows: Iterator[dict[str, Any]], path: Path, columns: dict[str, type]) -> int:
+    # Imported on use: pyarrow adds noticeably to app startup and only this export needs it.
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    arrow_types = {str: pa.string(), float: pa.float64(), int: pa.int64(), bool: pa.bool_()}
+    schema = pa.schema([(name, arrow_types[kind]) for name, kind in columns.items()])
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        # One row group per batch: memory stays bounded by EXPORT_WRITE_BATCH_ROWS.
+        for batch in _batches(rows, columns):
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+def create_export_job(
+    db: Session,
+    *,
+    entity: str = "leads",
+    export_format: str = "jsonl.gz",
+    requested_by: str = "admin",
+    source: str = "api",
+) -> DBExportJob:
+    selected_entity = (entity or "").strip().lower()
+    if selected_entity not in EXPORT_JOB_ENTITIES:
+        raise HTTPException(
+            status_code=HTTP_422_STATUS,
+            detail=f"Unsupported export entity: {entity}",
+        )
+    selected_format = (export_format or "").strip().lower()
+    if selected_format not in EXPORT_JOB_FORMATS:
+        raise HTTPException(
+            status_code=HTTP_422_STATUS,
+            detail=f"Unsupported export format: {export_format}",
+        )
+    if selected_format == "parquet" and not parquet_engine_available():
+        raise HTTPException(
+            status_code=HTTP_422_STATUS,
+            detail="Parquet export requires pyarrow to be installed.",
+        )
+
+    row = DBExportJob(
+        id=str(uuid.uuid4()),
+        entity=selected_entity,
+        format=selected_format,
+        status="pending",
+        source=source,
+        requested_by=requested_by,
+    )
+    db.add(row)
+    db.commit()
+    db.refresh(row)
+    return row
+
+
+def execute_export_job(db: Session, row: DBExportJob) -> DBExportJob:
+    row.status = "running"
+    row.started_at = datetime.now()
+    db.commit()
+
+    artifact_dir = get_export_artifact_dir()
+    extension = EXPORT_JOB_FORMATS[row.format][0]
+    path = artifact_dir / f"{row.entity}-{row.id}{extension}"
+    try:
+        artifact_dir.mkdir(parents=True, exist_ok=True)
+        rows = iter_lead_snapshot_rows(db)
+        if row.format == "jsonl.gz":
+            row_count = _write_jsonl_gz(rows, path)
+        elif row.format == "parquet":
+            row_count = _write_parquet(rows, path, lead_snapshot_columns(db))
+        else:
+            row_count = _write_csv(rows, path, lead_snapshot_columns(db))
+
+        row.status = "completed"
+        row.file_path = str(path)
+        row.row_count = row_count
+        row.size_bytes = path.stat().st_size
+    except Exception as exc:
+        db.rollback()
+        path.unlink(missing_ok=True)
+        logger.error(
+            "Export job failed.",
+            extra={"job_id": row.id, "format": row.format, "error": str(exc)},
+        )
+        row.status = "failed"
+        row.error_message = str(exc)[:1000]
+    row.finished_at = datetime.now()
+    db.commit()
+    db.refresh(row)
+    return row
+
+
+def run_export_job(job_id: str, *, bind: Engine | Connection) -> None:
+    """Background entry point: runs on its own session once the response has been sent."""
+    with Session(bind=bind) as db:
+        row = db.query(DBExportJob).filter(DBExportJob.id == job_id).first()
+        if row is None or row.status != "pending":
+            return
+        execute_export_job(db, row)
+
+
+def get_export_job_or_404(db: Session, job_id: str) -> DBExportJob:
+    row = db.query(DBExportJob).filter(DBExportJob.id == job_id).first()
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Export job not found.")
+    return row
+
+
+def list_export_jobs(db: Session, *, limit: int = 50) -> list[DBExportJob]:
+    return db.query(DBExportJob).order_by(DBExportJob.created_at.desc()).limit(limit).all()
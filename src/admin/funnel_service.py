@@ -8,6 +8,7 @@ from fastapi import HTTPException, status
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from ..core.database import commit_or_flush
 from ..core.db_models import (
     DBAdminUser,
     DBLead,
@@ -305,6 +306,7 @@ def transition_lead_stage(
     reason: str | None = None,
     source: str = "manual",
     sync_legacy: bool = True,
+    commit: bool = True,
 ) -> dict[str, Any]:
     next_stage = normalize_stage(to_stage)
     previous_stage = canonical_from_lead(lead)
@@ -321,7 +323,7 @@ def transition_lead_stage(
             source=source,
             metadata={"noop": True},
         )
-        db.commit()
+        commit_or_flush(db, commit=commit)
         db.refresh(event)
         return serialize_stage_event(event)
 
@@ -349,7 +351,7 @@ def transition_lead_stage(
     )
 
     db.add(lead)
-    db.commit()
+    commit_or_flush(db, commit=commit)
     db.refresh(event)
     return serialize_stage_event(event)
 
@@ -401,6 +403,7 @@ def reassign_lead_owner(
     owner_user: DBAdminUser,
     actor: str,
     reason: str | None = None,
+    commit: bool = True,
 ) -> dict[str, Any]:
     previous_owner = lead.lead_owner_user_id
     lead.lead_owner_user_id = owner_user.id
@@ -418,7 +421,7 @@ def reassign_lead_owner(
         source="assignment",
         metadata={"from_owner_user_id": previous_owner, "to_owner_user_id": owner_user.id},
     )
-    db.commit()
+    commit_or_flush(db, commit=commit)
     db.refresh(event)
     return {
         "lead_id": lead.id,
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import codecs
 import csv
 import io
+import multiprocessing
+import os
+import shutil
 import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
 
 from fastapi import HTTPException, status
 from sqlalchemy import func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from ..core.db_models import DBCompany, DBLead, DBProject, DBTask
+from ..core.db_models import DBCompany, DBImportCheckpoint, DBLead, DBProject, DBTask
+from ..core.import_rows import validate_chunk, validate_row
 from ..core.logging import get_logger
 from ..core.models import LeadStage, LeadStatus
 
@@ -25,13 +35,19 @@ elif hasattr(status, "HTTP_422_UNPROCESSABLE_CONTENT"):
 else:  # pragma: no cover
     HTTP_422_STATUS = 422
 
+if hasattr(status, "HTTP_413_CONTENT_TOO_LARGE"):
+    HTTP_413_STATUS = status.HTTP_413_CONTENT_TOO_LARGE
+else:  # pragma: no cover
+    HTTP_413_STATUS = 413
+
 SUPPORTED_TABLES = ("leads", "tasks", "projects")
 PREVIEW_LIMIT = 50
-MAX_CSV_BYTES = 5 * 1024 * 1024
-
-PROJECT_STATUSES = {"Planning", "In Progress", "On Hold", "Completed", "Cancelled"}
-TASK_STATUSES = {"To Do", "In Progress", "Done"}
-TASK_PRIORITIES = {"Low", "Medium", "High", "Critical"}
+DEFAULT_MAX_CSV_BYTES = 1024 * 1024 * 1024
+DEFAULT_IMPORT_UPLOAD_DIR = "uploads/imports"
+IMPORT_CHUNK_ROWS = 500
+CSV_HEAD_BYTES = 64 * 1024
+UPLOAD_COPY_BYTES = 1024 * 1024
+DEFAULT_PARALLEL_MIN_BYTES = 8 * 1024 * 1024
 
 TABLE_ALIASES: dict[str, dict[str, tuple[str, ...]]] = {
     "leads": {
@@ -67,23 +83,55 @@ def _normalize_header(value: str) -> str:
     return "".join(ch for ch in value.strip().lower() if ch.isalnum() or ch in {"_", " "})
 
 
-def _decode_csv_content(content: bytes) -> str:
-    if len(content) > MAX_CSV_BYTES:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail=f"CSV too large (max {MAX_CSV_BYTES} bytes).",
-        )
-    for encoding in ("utf-8-sig", "utf-8", "latin-1"):
-        try:
-            return content.decode(encoding)
-        except UnicodeDecodeError:
-            continue
-    raise HTTPException(
-        status_code=HTTP_422_STATUS,
-        detail="Unable to decode CSV file.",
+def get_max_csv_bytes() -> int:
+    try:
+        return max(1, int(os.getenv("ADMIN_IMPORT_MAX_BYTES", str(DEFAULT_MAX_CSV_BYTES))))
+    except ValueError:
+        return DEFAULT_MAX_CSV_BYTES
+
+
+def get_import_upload_dir() -> Path:
+    return Path(os.getenv("ADMIN_IMPORT_UPLOAD_DIR", DEFAULT_IMPORT_UPLOAD_DIR))
+
+
+def _csv_too_large(limit: int) -> HTTPException:
+    return HTTPException(
+        status_code=HTTP_413_STATUS,
+        detail=f"CSV too large (max {limit} bytes).",
     )
 
 
+def save_csv_upload(source: BinaryIO, directory: Path | None = None) -> Path:
+    """Copy an upload to the import directory in 1 MB chunks, enforcing ``ADMIN_IMPORT_MAX_BYTES``."""
+    limit = get_max_csv_bytes()
+    target_dir = directory or get_import_upload_dir()
+    target_dir.mkdir(parents=True, exist_ok=True)
+    path = target_dir / f"{uuid.uuid4()}.csv"
+    written = 0
+    try:
+        with path.open("wb") as handle:
+            while chunk := source.read(UPLOAD_COPY_BYTES):
+                written += len(chunk)
+                if written > limit:
+                    raise _csv_too_large(limit)
+                handle.write(chunk)
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def _detect_encoding(head: bytes) -> str:
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    try:
+        # Not final: the head may end in the middle of a multi-byte character.
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
 def _detect_delimiter(sample: str) -> str:
     try:
         dialect = csv.Sniffer().sniff(sample, delimiters=",;\t|")
@@ -92,26 +140,52 @@ def _detect_delimiter(sample: str) -> str:
         return ","
 
 
-def _parse_csv_rows(content: bytes) -> tuple[list[str], list[dict[str, str]]]:
-    text = _decode_csv_content(content)
-    sample = text[:4096]
-    delimiter = _detect_delimiter(sample)
-    reader = csv.DictReader(io.StringIO(text), delimiter=delimiter)
-    if not reader.fieldnames:
-        raise HTTPException(
-            status_code=HTTP_422_STATUS,
-            detail="CSV headers are missing.",
-        )
-    headers = [header.strip() for header in reader.fieldnames if header and header.strip()]
-    rows: list[dict[str, str]] = []
+def _clean_rows(reader: csv.DictReader) -> Iterator[dict[str, str]]:
     for raw_row in reader:
         clean_row: dict[str, str] = {}
         for key, value in raw_row.items():
             if not key:
                 continue
-            clean_row[key.strip()] = (value or "").strip()
-        rows.append(clean_row)
-    return headers, rows
+            clean_row[key.strip()] = (value or "").strip() if isinstance(value, str) else ""
+        yield clean_row
+
+
+@contextmanager
+def open_csv_rows(content: bytes | BinaryIO) -> Iterator[tuple[list[str], Iterator[dict[str, str]]]]:
+    """Stream a CSV: encoding and delimiter come from the first 64 KB, rows are decoded as they are read.
+
+    ``content`` is the raw bytes or a seekable binary file (upload spool, saved upload); the file is
+    left open for the caller.
+    """
+    source: BinaryIO = io.BytesIO(content) if isinstance(content, (bytes, bytearray)) else content
+    limit = get_max_csv_bytes()
+    source.seek(0, io.SEEK_END)
+    if source.tell() > limit:
+        raise _csv_too_large(limit)
+    source.seek(0)
+    head = source.read(CSV_HEAD_BYTES)
+    source.seek(0)
+    encoding = _detect_encoding(head)
+    # Bytes the head check could not see are replaced rather than failing the whole file.
+    text = io.TextIOWrapper(source, encoding=encoding, errors="replace", newline="")
+    try:
+        delimiter = _detect_delimiter(head.decode(encoding, errors="ignore")[:4096])
+        reader = csv.DictReader(text, delimiter=delimiter)
+        if not reader.fieldnames:
+            raise HTTPException(
+                status_code=HTTP_422_STATUS,
+                detail="CSV headers are missing.",
+            )
+        headers = [header.strip() for header in reader.fieldnames if header and header.strip()]
+        yield headers, _clean_rows(reader)
+    finally:
+        text.detach()
+
+
+def _chunks(rows: Iterable[dict[str, str]], size: int) -> Iterator[list[dict[str, str]]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
 
 
 def _suggest_mapping(table: str, headers: list[str]) -> dict[str, str]:
@@ -145,150 +219,11 @@ def _detect_table(headers: list[str]) -> tuple[str, float]:
     return best_table, confidence
 
 
-def _pick_value(
-    row: dict[str, str],
-    field_name: str,
-    mapping: dict[str, str],
-) -> str | None:
-    header = mapping.get(field_name)
-    if not header:
-        return None
-    return (row.get(header) or "").strip() or None
-
-
-def _parse_datetime(raw_value: str | None) -> datetime | None:
-    if not raw_value:
-        return None
-    candidate = raw_value.strip()
-    if not candidate:
-        return None
-    normalized = candidate.replace("Z", "+00:00")
-    try:
-        return datetime.fromisoformat(normalized)
-    except ValueError:
-        pass
-    for fmt in (
-        "%Y-%m-%d",
-        "%Y/%m/%d",
-        "%d/%m/%Y",
-        "%d-%m-%Y",
-        "%Y-%m-%d %H:%M",
-        "%Y/%m/%d %H:%M",
-        "%d/%m/%Y %H:%M",
-    ):
-        try:
-            return datetime.strptime(candidate, fmt)
-        except ValueError:
-            continue
-    raise ValueError(f"Invalid datetime value: {raw_value}")
-
-
-def _coerce_lead_status(raw_status: str | None) -> LeadStatus:
-    if not raw_status:
-        return LeadStatus.NEW
-    normalized = raw_status.strip().upper()
-    try:
-        return LeadStatus(normalized)
-    except ValueError:
-        return LeadStatus.NEW
-
-
-def _coerce_project_status(raw_status: str | None) -> str:
-    if not raw_status:
-        return "Planning"
-    candidate = raw_status.strip()
-    for known in PROJECT_STATUSES:
-        if known.lower() == candidate.lower():
-            return known
-    raise ValueError(f"Unsupported project status: {raw_status}")
-
-
-def _coerce_task_status(raw_status: str | None) -> str:
-    if not raw_status:
-        return "To Do"
-    candidate = raw_status.strip()
-    for known in TASK_STATUSES:
-        if known.lower() == candidate.lower():
-            return known
-    raise ValueError(f"Unsupported task status: {raw_status}")
-
-
-def _coerce_task_priority(raw_priority: str | None) -> str:
-    if not raw_priority:
-        return "Medium"
-    candidate = raw_priority.strip()
-    for known in TASK_PRIORITIES:
-        if known.lower() == candidate.lower():
-            return known
-    raise ValueError(f"Unsupported task priority: {raw_priority}")
-
-
-def _validate_row(
-    table: str,
-    row: dict[str, str],
-    mapping: dict[str, str],
+def _resolve_table(
+    headers: list[str],
+    table: str | None,
+    mapping: dict[str, str] | None,
 ) -> dict[str, Any]:
-    if table == "leads":
-        email = _pick_value(row, "email", mapping)
-        if email:
-            email = email.strip()
-            if "@" not in email or "." not in email.split("@")[-1]:
-                email = None
-        # BYPASS: Email is no longer required
-        first_name = _pick_value(row, "first_name", mapping) or "Unknown"
-        last_name = _pick_value(row, "last_name", mapping) or ""
-        company_name = _pick_value(row, "company_name", mapping) or "Unknown Company"
-        raw_status = _pick_value(row, "status", mapping)
-        raw_segment = _pick_value(row, "segment", mapping)
-        
-        return {
-            "first_name": first_name,
-            "last_name": last_name,
-            "email": email,
-            "phone": _pick_value(row, "phone", mapping),
-            "company_name": company_name,
-            "status": _coerce_lead_status(raw_status).value if raw_status else None,
-            "segment": raw_segment if raw_segment else None,
-        }
-
-    if table == "tasks":
-        title = _pick_value(row, "title", mapping)
-        if not title:
-            raise ValueError("Task title is required.")
-        return {
-            "id": _pick_value(row, "id", mapping),
-            "title": title,
-            "status": _coerce_task_status(_pick_value(row, "status", mapping)),
-            "priority": _coerce_task_priority(_pick_value(row, "priority", mapping)),
-            "due_date": _parse_datetime(_pick_value(row, "due_date", mapping)),
-            "assigned_to": _pick_value(row, "assigned_to", mapping) or "You",
-            "lead_id": _pick_value(row, "lead_id", mapping),
-        }
-
-    if table == "projects":
-        name = _pick_value(row, "name", mapping)
-        if not name:
-            raise ValueError("Project name is required.")
-        return {
-            "id": _pick_value(row, "id", mapping),
-            "name": name,
-            "description": _pick_value(row, "description", mapping),
-            "status": _coerce_project_status(_pick_value(row, "status", mapping)),
-            "lead_id": _pick_value(row, "lead_id", mapping),
-            "due_date": _parse_datetime(_pick_value(row, "due_date", mapping)),
-        }
-
-    raise ValueError(f"Unsupported table: {table}")
-
-
-def preview_csv_import(
-    *,
-    content: bytes,
-    table: str | None = None,
-    mapping: dict[str, str] | None = None,
-    limit: int = PREVIEW_LIMIT,
-) -> dict[str, Any]:
-    headers, rows = _parse_csv_rows(content)
     detected_table, confidence = _detect_table(headers)
     selected_table = (table or detected_table).strip().lower()
     if selected_table not in SUPPORTED_TABLES:
@@ -296,36 +231,53 @@ def preview_csv_import(
             status_code=HTTP_422_STATUS,
             detail=f"Unsupported table '{selected_table}'.",
         )
-
     suggested_mapping = _suggest_mapping(selected_table, headers)
-    effective_mapping = mapping or suggested_mapping
+    return {
+        "detected_table": detected_table,
+        "selected_table": selected_table,
+        "table_confidence": confidence,
+        "suggested_mapping": suggested_mapping,
+        "effective_mapping": mapping or suggested_mapping,
+    }
+
 
+def preview_csv_import(
+    *,
+    content: bytes | BinaryIO,
+    table: str | None = None,
+    mapping: dict[str, str] | None = None,
+    limit: int = PREVIEW_LIMIT,
+) -> dict[str, Any]:
     preview_rows: list[dict[str, Any]] = []
     errors: list[dict[str, Any]] = []
     valid_rows = 0
     invalid_rows = 0
 
-    for index, row in enumerate(rows, start=2):
-        try:
-            normalized = _validate_row(selected_table, row, effective_mapping)
-            valid_rows += 1
-            if len(preview_rows) < max(1, min(limit, PREVIEW_LIMIT)):
-                if isinstance(normalized.get("due_date"), datetime):
-                    normalized["due_date"] = normalized["due_date"].isoformat()
-                preview_rows.append(normalized)
-        except ValueError as exc:
-            invalid_rows += 1
-            if len(errors) < PREVIEW_LIMIT:
-                errors.append({"row": index, "message": str(exc)})
+    with open_csv_rows(content) as (headers, rows):
+        resolved = _resolve_table(headers, table, mapping)
+        selected_table = resolved["selected_table"]
+        effective_mapping = resolved["effective_mapping"]
+        for index, row in enumerate(rows, start=2):
+            try:
+                normalized = validate_row(selected_table, row, effective_mapping)
+                valid_rows += 1
+                if len(preview_rows) < max(1, min(limit, PREVIEW_LIMIT)):
+                    if isinstance(normalized.get("due_date"), datetime):
+                        normalized["due_date"] = normalized["due_date"].isoformat()
+                    preview_rows.append(normalized)
+            except ValueError as exc:
+                invalid_rows += 1
+                if len(errors) < PREVIEW_LIMIT:
+                    errors.append({"row": index, "message": str(exc)})
 
     return {
-        "detected_table": detected_table,
+        "detected_table": resolved["detected_table"],
         "selected_table": selected_table,
-        "table_confidence": confidence,
+        "table_confidence": resolved["table_confidence"],
         "headers": headers,
-        "suggested_mapping": suggested_mapping,
+        "suggested_mapping": resolved["suggested_mapping"],
         "effective_mapping": effective_mapping,
-        "total_rows": len(rows),
+        "total_rows": valid_rows + invalid_rows,
         "valid_rows": valid_rows,
         "invalid_rows": invalid_rows,
         "errors": errors,
@@ -353,68 +305,89 @@ def _get_or_create_company(db: Session, company_name: str) -> DBCompany:
         raise
 
 
-def _upsert_lead(db: Session, row: dict[str, Any]) -> str:
+def _lead_identity(row: dict[str, Any]) -> tuple[str | None, str, str, str]:
     email = str(row.get("email") or "").strip().lower() or None
     first_name = str(row.get("first_name") or "").strip()
     last_name = str(row.get("last_name") or "").strip()
     company_name = str(row.get("company_name") or "").strip()
-    
+    return email, first_name, last_name, company_name
+
+
+def _matches_by_name(first_name: str, last_name: str, company_name: str) -> bool:
+    # Composite key lookup only if we have non-default identifiers
+    has_real_name = (first_name and first_name != "Unknown") or last_name
+    return bool(has_real_name) and company_name != "Unknown Company"
+
+
+def _update_lead(existing: DBLead, row: dict[str, Any], company: DBCompany) -> None:
+    email, first_name, last_name, _ = _lead_identity(row)
+    # Update fields only if provided in the row
+    if first_name and first_name != "Unknown":
+        existing.first_name = first_name
+    if last_name:
+        existing.last_name = last_name
+
+    phone = row.get("phone")
+    if phone:
+        existing.phone = phone
+
+    if row.get("status"):
+        existing.status = row["status"]
+
+    if row.get("segment"):
+        existing.segment = row["segment"]
+
+    existing.company_id = company.id
+
+    # Update email if missing
+    if email and not existing.email:
+        existing.email = email
+
+
+def _new_lead(row: dict[str, Any], company: DBCompany) -> DBLead:
+    email, first_name, last_name, _ = _lead_identity(row)
+    return DBLead(
+        id=str(uuid.uuid4()),
+        first_name=first_name,
+        last_name=last_name,
+        email=email,
+        phone=row.get("phone"),
+        company_id=company.id,
+        status=row.get("status") or LeadStatus.NEW,
+        segment=row.get("segment") or "General",
+        stage=LeadStage.NEW,
+    )
+
+
+def _upsert_lead(db: Session, row: dict[str, Any]) -> str:
+    email, first_name, last_name, company_name = _lead_identity(row)
+
     company = _get_or_create_company(db, company_name)
-    
+
     # Try to find existing by email first
     existing = None
     if email:
         existing = db.query(DBLead).filter(DBLead.email == email).first()
-    
-    # Fallback to composite key lookup only if we have non-default identifiers
-    has_real_name = (first_name and first_name != "Unknown") or last_name
-    if not existing and has_real_name and company_name != "Unknown Company":
+
+    if not existing and _matches_by_name(first_name, last_name, company_name):
         existing = db.query(DBLead).filter(
             func.lower(DBLead.first_name) == first_name.lower(),
             func.lower(DBLead.last_name) == last_name.lower(),
             DBLead.company_id == company.id
         ).first()
-    
+
     if existing:
-        # Update fields only if provided in the row
-        if first_name and first_name != "Unknown":
-            existing.first_name = first_name
-        if last_name:
-            existing.last_name = last_name
-        
-        phone = row.get("phone")
-        if phone:
-            existing.phone = phone
-            
-        if row.get("status"):
-            existing.status = row["status"]
-        
-        if row.get("segment"):
-            existing.segment = row["segment"]
-            
-        existing.company_id = company.id
-        
-        # Update email if missing
-        if email and not existing.email:
-            existing.email = email
-            
+        _update_lead(existing, row, company)
         return "updated"
 
-    lead = DBLead(
-        id=str(uuid.uuid4()),
-        first_name=first_name,
-        last_name=last_name,
-        email=email,
-        phone=row.get("phone"),
-        company_id=company.id,
-        status=row.get("status") or LeadStatus.NEW,
-        segment=row.get("segment") or "General",
-        stage=LeadStage.NEW,
-    )
-    db.add(lead)
+    db.add(_new_lead(row, company))
     return "created"
 
 
+def _missing_lead_error(lead_id: str) -> str:
+    return f"Referenced lead_id '{lead_id}' does not exist."
+
+
 def _upsert_task(db: Session, row: dict[str, Any]) -> str:
     task_id = str(row.get("id") or "").strip() or None
     lead_id = str(row.get("lead_id") or "").strip() or None
@@ -423,7 +396,7 @@ def _upsert_task(db: Session, row: dict[str, Any]) -> str:
     if lead_id:
         lead_exists = db.query(DBLead.id).filter(DBLead.id == lead_id).first()
         if not lead_exists:
-            raise ValueError(f"Referenced lead_id '{lead_id}' does not exist.")
+            raise ValueError(_missing_lead_error(lead_id))
 
     task = db.query(DBTask).filter(DBTask.id == task_id).first() if task_id else None
     if task:
@@ -456,7 +429,7 @@ def _upsert_project(db: Session, row: dict[str, Any]) -> str:
     if lead_id:
         lead_exists = db.query(DBLead.id).filter(DBLead.id == lead_id).first()
         if not lead_exists:
-            raise ValueError(f"Referenced lead_id '{lead_id}' does not exist.")
+            raise ValueError(_missing_lead_error(lead_id))
 
     project = db.query(DBProject).filter(DBProject.id == project_id).first() if project_id else None
     if project:
@@ -479,46 +452,184 @@ def _upsert_project(db: Session, row: dict[str, Any]) -> str:
     return "created"
 
 
-def commit_csv_import(
-    *,
-    db: Session,
-    content: bytes,
-    table: str | None = None,
-    mapping: dict[str, str] | None = None,
-) -> dict[str, Any]:
-    preview = preview_csv_import(content=content, table=table, mapping=mapping, limit=10)
-    selected_table = str(preview["selected_table"])
-    effective_mapping = dict(preview["effective_mapping"])
+def _companies_by_name(db: Session, names: set[str]) -> dict[str, DBCompany]:
+    """Existing companies for ``names`` (case-insensitive) in one query; missing ones are created in one flush."""
+    wanted = {name.lower(): name for name in names}
+    companies: dict[str, DBCompany] = {}
+    for company in db.query(DBCompany).filter(func.lower(DBCompany.name).in_(sorted(wanted))):
+        companies.setdefault((company.name or "").strip().lower(), company)
+    created = [DBCompany(name=name, domain=None) for key, name in wanted.items() if key not in companies]
+    if created:
+        db.add_all(created)
+        db.flush()
+        companies.update({company.name.lower(): company for company in created})
+    return companies
+
+
+def _bulk_upsert_leads(db: Session, rows: list[tuple[int, dict[str, Any]]]) -> tuple[int, int, list[dict[str, Any]]]:
+    identities = [(row, *_lead_identity(row)) for _, row in rows]
+    companies = _companies_by_name(db, {company_name for *_, company_name in identities})
+
+    emails = sorted({email for _, email, *_ in identities if email})
+    by_email: dict[str, DBLead] = {}
+    if emails:
+        by_email = {lead.email: lead for lead in db.query(DBLead).filter(DBLead.email.in_(emails))}
+
+    by_name: dict[tuple[str, str, int], DBLead] = {}
+    name_candidates = [
+        (first_name.lower(), companies[company_name.lower()].id)
+        for _, email, first_name, last_name, company_name in identities
+        if _matches_by_name(first_name, last_name, company_name)
+    ]
+    if name_candidates:
+        for lead in db.query(DBLead).filter(
+            func.lower(DBLead.first_name).in_(sorted({first for first, _ in name_candidates})),
+            DBLead.company_id.in_(sorted({company_id for _, company_id in name_candidates})),
+        ):
+            key = ((lead.first_name or "").lower(), (lead.last_name or "").lower(), lead.company_id)
+            by_name.setdefault(key, lead)
 
-    _, rows = _parse_csv_rows(content)
+    created = 0
+    updated = 0
+    for row, email, first_name, last_name, company_name in identities:
+        company = companies[company_name.lower()]
+        existing = by_email.get(email) if email else None
+        if existing is None and _matches_by_name(first_name, last_name, company_name):
+            existing = by_name.get((first_name.lower(), last_name.lower(), company.id))
+        if existing is not None:
+            _update_lead(existing, row, company)
+            lead = existing
+            updated += 1
+        else:
+            lead = _new_lead(row, company)
+            db.add(lead)
+            created += 1
+        # Later rows of the chunk see this one, as they would after a per-row flush.
+        if lead.email:
+            by_email[lead.email] = lead
+        by_name.setdefault(((lead.first_name or "").lower(), (lead.last_name or "").lower(), company.id), lead)
+    return created, updated, []
+
+
+def _existing_lead_ids(db: Session, rows: list[tuple[int, dict[str, Any]]]) -> set[str]:
+    lead_ids = sorted({str(row.get("lead_id") or "").strip() for _, row in rows} - {""})
+    if not lead_ids:
+        return set()
+    return {lead_id for (lead_id,) in db.query(DBLead.id).filter(DBLead.id.in_(lead_ids))}
+
+
+def _bulk_upsert_tasks(db: Session, rows: list[tuple[int, dict[str, Any]]]) -> tuple[int, int, list[dict[str, Any]]]:
+    known_leads = _existing_lead_ids(db, rows)
+    task_ids = sorted({str(row.get("id") or "").strip() for _, row in rows} - {""})
+    tasks = {task.id: task for task in db.query(DBTask).filter(DBTask.id.in_(task_ids))} if task_ids else {}
 
     created = 0
     updated = 0
-    skipped = 0
     errors: list[dict[str, Any]] = []
+    for index, row in rows:
+        task_id = str(row.get("id") or "").strip() or None
+        lead_id = str(row.get("lead_id") or "").strip() or None
+        if lead_id and lead_id not in known_leads:
+            errors.append({"row": index, "message": _missing_lead_error(lead_id)})
+            continue
+        task = tasks.get(task_id) if task_id else None
+        if task is not None:
+            task.title = row["title"]
+            task.status = row["status"]
+            task.priority = row["priority"]
+            task.due_date = row["due_date"]
+            task.assigned_to = row["assigned_to"]
+            task.lead_id = lead_id
+            updated += 1
+            continue
+        task = DBTask(
+            id=task_id or str(uuid.uuid4()),
+            title=row["title"],
+            status=row["status"],
+            priority=row["priority"],
+            due_date=row["due_date"],
+            assigned_to=row["assigned_to"],
+            lead_id=lead_id,
+        )
+        db.add(task)
+        tasks[task.id] = task
+        created += 1
+    return created, updated, errors
 
-    for index, row in enumerate(rows, start=2):
-        try:
-            normalized = _validate_row(selected_table, row, effective_mapping)
-        except ValueError as exc:
-            skipped += 1
-            if len(errors) < PREVIEW_LIMIT:
-                errors.append({"row": index, "message": str(exc)})
+
+def _bulk_upsert_projects(
+    db: Session,
+    rows: list[tuple[int, dict[str, Any]]],
+) -> tuple[int, int, list[dict[str, Any]]]:
+    known_leads = _existing_lead_ids(db, rows)
+    project_ids = sorted({str(row.get("id") or "").strip() for _, row in rows} - {""})
+    projects = (
+        {project.id: project for project in db.query(DBProject).filter(DBProject.id.in_(project_ids))}
+        if project_ids
+        else {}
+    )
+
+    created = 0
+    updated = 0
+    errors: list[dict[str, Any]] = []
+    for index, row in rows:
+        project_id = str(row.get("id") or "").strip() or None
+        lead_id = str(row.get("lead_id") or "").strip() or None
+        if lead_id and lead_id not in known_leads:
+            errors.append({"row": index, "message": _missing_lead_error(lead_id)})
+            continue
+        project = projects.get(project_id) if project_id else None
+        if project is not None:
+            project.name = row["name"]
+            project.description = row["description"]
+            project.status = row["status"]
+            project.lead_id = lead_id
+            project.due_date = row["due_date"]
+            updated += 1
             continue
+        project = DBProject(
+            id=project_id or str(uuid.uuid4()),
+            name=row["name"],
+            description=row["description"],
+            status=row["status"],
+            lead_id=lead_id,
+            due_date=row["due_date"],
+        )
+        db.add(project)
+        projects[project.id] = project
+        created += 1
+    return created, updated, errors
+
+
+BULK_UPSERTS: dict[str, Callable[[Session, list[tuple[int, dict[str, Any]]]], tuple[int, int, list[dict[str, Any]]]]] = {
+    "leads": _bulk_upsert_leads,
+    "tasks": _bulk_upsert_tasks,
+    "projects": _bulk_upsert_projects,
+}
+
 
+def _upsert_rows_one_by_one(
+    db: Session,
+    table: str,
+    rows: list[tuple[int, dict[str, Any]]],
+) -> tuple[int, int, list[dict[str, Any]]]:
+    created = 0
+    updated = 0
+    errors: list[dict[str, Any]] = []
+    for index, normalized in rows:
         try:
             with db.begin_nested():
-                if selected_table == "leads":
+                if table == "leads":
                     result = _upsert_lead(db, normalized)
-                elif selected_table == "tasks":
+                elif table == "tasks":
                     result = _upsert_task(db, normalized)
-                elif selected_table == "projects":
+                elif table == "projects":
                     result = _upsert_project(db, normalized)
                 else:
-                    raise ValueError(f"Unsupported table: {selected_table}")
-                
+                    raise ValueError(f"Unsupported table: {table}")
+
                 db.flush() # Force per-row constraint check
-                
+
                 if result == "created":
                     created += 1
                 else:
@@ -526,27 +637,275 @@ def commit_csv_import(
         except (SQLAlchemyError, ValueError) as exc:
             logger.warning(
                 "Failed to import CSV row.",
-                extra={"row": index, "error": str(exc), "table": selected_table},
+                extra={"row": index, "error": str(exc), "table": table},
             )
-            skipped += 1
-            if len(errors) < PREVIEW_LIMIT:
-                errors.append({"row": index, "message": str(exc)})
+            errors.append({"row": index, "message": str(exc)})
+    return created, updated, errors
+
 
+def _upsert_chunk(
+    db: Session,
+    table: str,
+    rows: list[tuple[int, dict[str, Any]]],
+) -> tuple[int, int, list[dict[str, Any]]]:
+    """Upsert validated rows with a handful of ``IN`` lookups and one batched flush.
+
+    If the batched flush fails (constraint violation, concurrent insert), the chunk's savepoint is
+    rolled back and its rows are replayed one by one so only the offending rows are skipped.
+    """
+    if not rows:
+        return 0, 0, []
     try:
-        db.commit()
+        with db.begin_nested():
+            result = BULK_UPSERTS[table](db, rows)
+            db.flush()
+        return result
     except SQLAlchemyError as exc:
-        db.rollback()
-        logger.exception("CSV import commit failed.", extra={"error": str(exc)})
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to persist CSV import.",
-        ) from exc
+        logger.warning(
+            "Bulk CSV chunk failed, retrying row by row.",
+            extra={"rows": len(rows), "error": str(exc), "table": table},
+        )
+        return _upsert_rows_one_by_one(db, table, rows)
+
+
+def get_validation_workers() -> int:
+    default = min(4, os.cpu_count() or 1)
+    try:
+        return max(1, int(os.getenv("ADMIN_IMPORT_VALIDATION_WORKERS", str(default))))
+    except ValueError:
+        return default
+
+
+def get_parallel_min_bytes() -> int:
+    try:
+        return max(0, int(os.getenv("ADMIN_IMPORT_PARALLEL_MIN_BYTES", str(DEFAULT_PARALLEL_MIN_BYTES))))
+    except ValueError:
+        return DEFAULT_PARALLEL_MIN_BYTES
+
+
+def _validated_chunks(
+    rows: Iterable[dict[str, str]],
+    *,
+    table: str,
+    mapping: dict[str, str],
+    chunk_size: int,
+    first_index: int,
+    workers: int,
+) -> Iterator[tuple[int, list[tuple[int, dict[str, Any]]], list[dict[str, Any]]]]:
+    """Validated chunks in file order; with ``workers`` > 1 validation runs ahead in a process pool.
+
+    At most ``2 * workers`` chunks are in flight, so memory stays bounded while the caller upserts.
+    """
+    next_index = first_index
+    if workers <= 1:
+        for chunk in _chunks(rows, chunk_size):
+            yield validate_chunk(table, mapping, next_index, chunk)
+            next_index += len(chunk)
+        return
+
+    # spawn, not fork: the API process runs background threads (job worker, audit writer...).
+    # validate_chunk lives outside src.admin, so workers import it without booting the admin app.
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    pending: deque[Future] = deque()
+    try:
+        for chunk in _chunks(rows, chunk_size):
+            pending.append(pool.submit(validate_chunk, table, mapping, next_index, chunk))
+            next_index += len(chunk)
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _write_error_rows(handle: BinaryIO, errors: list[dict[str, Any]]) -> None:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for error in errors:
+        writer.writerow([error["row"], error["message"]])
+    handle.write(buffer.getvalue().encode("utf-8"))
+    handle.flush()
+
+
+def commit_csv_import(
+    *,
+    db: Session,
+    content: bytes | BinaryIO,
+    table: str | None = None,
+    mapping: dict[str, str] | None = None,
+    chunk_size: int = IMPORT_CHUNK_ROWS,
+    progress: Callable[[int], None] | None = None,
+    checkpoint: DBImportCheckpoint | None = None,
+    error_report: BinaryIO | None = None,
+    validation_workers: int = 1,
+) -> dict[str, Any]:
+    """Validate and upsert the file in one pass, committing every ``chunk_size`` rows.
+
+    Memory stays bounded by one chunk whatever the file size. A failed chunk commit stops the import;
+    chunks committed before it stay imported. ``progress`` gets the rows processed so far after each chunk.
+
+    With ``checkpoint`` the import starts after ``checkpoint.rows_done`` and the checkpoint is updated
+    in each chunk's transaction, so a rerun resumes exactly after the last committed chunk. Failed rows
+    are appended to ``error_report`` (CSV ``row,message``) before that commit.
+    """
+    start_row = int(checkpoint.rows_done or 0) if checkpoint is not None else 0
+    created = int(checkpoint.created or 0) if checkpoint is not None else 0
+    updated = int(checkpoint.updated or 0) if checkpoint is not None else 0
+    skipped = int(checkpoint.failed or 0) if checkpoint is not None else 0
+    processed = start_row
+    errors: list[dict[str, Any]] = []
+
+    with open_csv_rows(content) as (headers, rows):
+        resolved = _resolve_table(headers, table, mapping)
+        selected_table = str(resolved["selected_table"])
+        effective_mapping = dict(resolved["effective_mapping"])
+
+        chunks = _validated_chunks(
+            islice(rows, start_row, None),
+            table=selected_table,
+            mapping=effective_mapping,
+            chunk_size=max(1, chunk_size),
+            first_index=start_row + 2,
+            workers=validation_workers,
+        )
+        for row_count, valid_rows, chunk_errors in chunks:
+            chunk_created, chunk_updated, upsert_errors = _upsert_chunk(db, selected_table, valid_rows)
+            created += chunk_created
+            updated += chunk_updated
+            chunk_errors = sorted([*chunk_errors, *upsert_errors], key=lambda item: item["row"])
+            skipped += len(chunk_errors)
+            for error in chunk_errors:
+                if len(errors) < PREVIEW_LIMIT:
+                    errors.append(error)
+
+            processed += row_count
+            if error_report is not None and chunk_errors:
+                _write_error_rows(error_report, chunk_errors)
+            if checkpoint is not None:
+                checkpoint.table_name = selected_table
+                checkpoint.rows_done = processed
+                checkpoint.chunks_done = int(checkpoint.chunks_done or 0) + 1
+                checkpoint.validated = int(checkpoint.validated or 0) + len(valid_rows)
+                checkpoint.created = created
+                checkpoint.updated = updated
+                checkpoint.failed = skipped
+                if error_report is not None:
+                    checkpoint.error_report_bytes = error_report.tell()
+            try:
+                db.commit()
+            except SQLAlchemyError as exc:
+                db.rollback()
+                logger.exception(
+                    "CSV import commit failed.",
+                    extra={"error": str(exc), "processed_rows": processed},
+                )
+                if checkpoint is not None:
+                    raise  # retryable: the job resumes from the last committed chunk
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail="Failed to persist CSV import.",
+                ) from exc
+            if progress is not None:
+                progress(processed)
 
     return {
         "table": selected_table,
-        "processed_rows": len(rows),
+        "processed_rows": processed,
         "created": created,
         "updated": updated,
         "skipped": skipped,
         "errors": errors,
     }
+
+
+def error_report_path(job_id: str) -> Path:
+    return get_import_upload_dir() / f"{job_id}.errors.csv"
+
+
+def _read_error_sample(path: Path, limit: int = PREVIEW_LIMIT) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        reader = csv.reader(handle)
+        next(reader, None)
+        return [{"row": int(row), "message": message} for row, message in islice(reader, limit)]
+
+
+def serialize_import_checkpoint(checkpoint: DBImportCheckpoint) -> dict[str, Any]:
+    return {
+        "table": checkpoint.table_name,
+        "rows_done": int(checkpoint.rows_done or 0),
+        "chunks_done": int(checkpoint.chunks_done or 0),
+        "validated": int(checkpoint.validated or 0),
+        "upserted": int(checkpoint.created or 0) + int(checkpoint.updated or 0),
+        "created": int(checkpoint.created or 0),
+        "updated": int(checkpoint.updated or 0),
+        "failed": int(checkpoint.failed or 0),
+        "updated_at": checkpoint.updated_at.isoformat() if checkpoint.updated_at else None,
+    }
+
+
+def run_csv_import_job(
+    db: Session,
+    *,
+    job_id: str,
+    upload_path: Path,
+    table: str | None = None,
+    mapping: dict[str, str] | None = None,
+    chunk_size: int = IMPORT_CHUNK_ROWS,
+    progress: Callable[[DBImportCheckpoint, float], None] | None = None,
+) -> dict[str, Any]:
+    """Import a stored upload for ``job_id``, resuming after the last chunk a previous run committed.
+
+    ``progress`` gets the checkpoint and the fraction of the upload read so far after each chunk.
+
+    Every failed row goes to ``error_report_path(job_id)`` (removed again when no row failed); the
+    upload is deleted once the import completes and kept otherwise so a retry can resume.
+    """
+    checkpoint = db.get(DBImportCheckpoint, job_id)
+    if checkpoint is None:
+        checkpoint = DBImportCheckpoint(job_id=job_id, error_report_path=str(error_report_path(job_id)))
+        db.add(checkpoint)
+        db.commit()
+    resumed_from = int(checkpoint.rows_done or 0)
+    if resumed_from:
+        logger.info("Resuming CSV import.", extra={"job_id": job_id, "rows_done": resumed_from})
+
+    report_path = Path(checkpoint.error_report_path or error_report_path(job_id))
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    upload_bytes = upload_path.stat().st_size
+    workers = get_validation_workers() if upload_bytes >= get_parallel_min_bytes() else 1
+    with upload_path.open("rb") as source, report_path.open("r+b" if report_path.exists() else "w+b") as report:
+        # Drop rows written by a run that died before committing its chunk.
+        committed_bytes = int(checkpoint.error_report_bytes or 0)
+        report.truncate(committed_bytes)
+        report.seek(committed_bytes)
+        if committed_bytes == 0:
+            report.write(b"row,message\r\n")
+        result = commit_csv_import(
+            db=db,
+            content=source,
+            table=table,
+            mapping=mapping,
+            chunk_size=chunk_size,
+            progress=(
+                (lambda _done: progress(checkpoint, min(1.0, source.tell() / max(1, upload_bytes))))
+                if progress is not None
+                else None
+            ),
+            checkpoint=checkpoint,
+            error_report=report,
+            validation_workers=workers,
+        )
+    upload_path.unlink(missing_ok=True)
+    if not checkpoint.failed:
+        report_path.unlink(missing_ok=True)
+        checkpoint.error_report_path = None
+        db.commit()
+    return {
+        **result,
+        "errors": _read_error_sample(report_path),
+        "resumed_from_row": resumed_from,
+        "progress": serialize_import_checkpoint(checkpoint),
+    }
@@ -0,0 +1,539 @@
+from __future__ import annotations
+
+import contextvars
+import os
+import socket
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session, aliased
+
+from ..core.db_models import DBJob
+from ..core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed", "cancelled")
+TERMINAL_JOB_STATUSES = {"succeeded", "failed", "cancelled"}
+DEFAULT_LEASE_SECONDS = 120
+DEFAULT_RETRY_BASE_SECONDS = 10.0
+DEFAULT_RETRY_CAP_SECONDS = 600.0
+
+
+class JobCancelled(Exception):
+    """Raised inside a handler (by ``JobContext.report_progress``) once cancellation was requested."""
+
+
+class JobFailed(Exception):
+    """Permanent failure: the job is marked failed without further retries."""
+
+
+@dataclass
+class JobContext:
+    """What a handler gets besides its session: the payload and a progress / heartbeat hook."""
+
+    job_id: str
+    kind: str
+    payload: dict[str, Any]
+    input_data: bytes | None
+    requested_by: str
+    attempt: int
+    worker_id: str
+    bind: Engine | Connection
+    lease_seconds: int = DEFAULT_LEASE_SECONDS
+
+    def report_progress(self, done: int | float, total: int | float | None = None, message: str | None = None) -> None:
+        """Persist progress, extend the lease and raise ``JobCancelled`` if cancellation was requested.
+
+        Without ``total`` only the message is updated: the stored fraction is left as it was.
+        Uses its own short transaction, so call it between the handler's commits.
+        """
+        values: dict[str, Any] = {
+            "progress_message": message,
+            "lease_expires_at": datetime.now() + timedelta(seconds=self.lease_seconds),
+            "updated_at": datetime.now(),
+        }
+        changes: dict[str, Any] = {"status": "running", "progress_message": message}
+        if total:
+            values["progress"] = changes["progress"] = max(0.0, min(1.0, float(done) / float(total)))
+        with Session(bind=self.bind) as db:
+            db.execute(
+                update(DBJob)
+                .where(DBJob.id == self.job_id, DBJob.lease_owner == self.worker_id)
+                .values(**values)
+            )
+            db.commit()
+            cancel_requested = db.query(DBJob.cancel_requested).filter(DBJob.id == self.job_id).scalar()
+        _notify(self.job_id, **changes)
+        if cancel_requested:
+            raise JobCancelled(self.job_id)
+
+
+JobHandler = Callable[[Session, JobContext], dict[str, Any] | None]
+JobListener = Callable[[str, dict[str, Any]], None]
+JobCleanup = Callable[[dict[str, Any]], None]
+_handlers: dict[str, JobHandler] = {}
+_cleanups: dict[str, JobCleanup] = {}
+_max_concurrency: dict[str, int] = {}
+_listeners: list[JobListener] = []
+
+
+def add_job_listener(listener: JobListener) -> None:
+    """Call ``listener(job_id, changes)`` after every committed status / progress change."""
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def _notify(job_id: str, **changes: Any) -> None:
+    for listener in _listeners:
+        try:
+            listener(job_id, changes)
+        except Exception as exc:  # pragma: no cover - listeners must not break job bookkeeping
+            logger.warning("Job listener failed.", extra={"job_id": job_id, "error": str(exc)})
+
+
+def job_handler(
+    kind: str,
+    *,
+    cleanup: JobCleanup | None = None,
+    max_concurrency: int | None = None,
+) -> Callable[[JobHandler], JobHandler]:
+    """Register ``handler`` for ``kind``; ``cleanup(payload)`` runs once a job of that kind ends
+    failed or cancelled (files it staged, for instance). With ``max_concurrency`` (overridable through
+    ``ADMIN_JOB_<KIND>_CONCURRENCY``, 0 = unlimited) workers leave further jobs of that kind queued
+    while that many are running."""
+
+    def _register(handler: JobHandler) -> JobHandler:
+        _handlers[kind] = handler
+        if cleanup is not None:
+            _cleanups[kind] = cleanup
+        else:
+            _cleanups.pop(kind, None)
+        if max_concurrency is not None:
+            _max_concurrency[kind] = max_concurrency
+        else:
+            _max_concurrency.pop(kind, None)
+        return handler
+
+    return _register
+
+
+def job_concurrency_limit(kind: str) -> int | None:
+    default = _max_concurrency.get(kind)
+    try:
+        limit = int(os.getenv(f"ADMIN_JOB_{kind.upper()}_CONCURRENCY", str(default or 0)))
+    except ValueError:
+        limit = default or 0
+    return limit if limit > 0 else None
+
+
+def _run_cleanup(kind: str, payload: dict[str, Any] | None) -> None:
+    cleanup = _cleanups.get(kind)
+    if cleanup is None:
+        return
+    try:
+        cleanup(dict(payload or {}))
+    except Exception as exc:
+        logger.warning("Job cleanup failed.", extra={"kind": kind, "error": str(exc)})
+
+
+def registered_job_kinds() -> list[str]:
+    return sorted(_handlers)
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def serialize_job(row: DBJob) -> dict[str, Any]:
+    return {
+        "id": row.id,
+        "kind": row.kind,
+        "status": row.status,
+        "progress": round(float(row.progress or 0.0), 4),
+        "progress_message": row.progress_message,
+        "attempts": int(row.attempts or 0),
+        "max_attempts": int(row.max_attempts or 0),
+        "cancel_requested": bool(row.cancel_requested),
+        "result": row.result_json,
+        "error_message": row.error_message,
+        "requested_by": row.requested_by,
+        "created_at": _iso(row.created_at),
+        "run_after": _iso(row.run_after),
+        "started_at": _iso(row.started_at),
+        "finished_at": _iso(row.finished_at),
+    }
+
+
+def enqueue_job(
+    db: Session,
+    kind: str,
+    payload: dict[str, Any] | None = None,
+    *,
+    input_data: bytes | None = None,
+    requested_by: str = "admin",
+    max_attempts: int = 3,
+    priority: int = 0,
+) -> DBJob:
+    if kind not in _handlers:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Unknown job kind: {kind}")
+    row = DBJob(
+        id=str(uuid.uuid4()),
+        kind=kind,
+        status="queued",
+        priority=priority,
+        payload_json=payload or {},
+        input_data=input_data,
+        max_attempts=max(1, max_attempts),
+        requested_by=requested_by,
+        run_after=datetime.now(),
+    )
+    db.add(row)
+    db.commit()
+    db.refresh(row)
+    _notify(row.id, kind=kind, status="queued")
+    return row
+
+
+def get_job_or_404(db: Session, job_id: str) -> DBJob:
+    row = db.query(DBJob).filter(DBJob.id == job_id).first()
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found.")
+    return row
+
+
+def list_jobs(
+    db: Session,
+    *,
+    kind: str | None = None,
+    job_status: str | None = None,
+    limit: int = 50,
+) -> list[DBJob]:
+    query = db.query(DBJob)
+    if kind:
+        query = query.filter(DBJob.kind == kind)
+    if job_status:
+        query = query.filter(DBJob.status == job_status)
+    return query.order_by(DBJob.created_at.desc()).limit(limit).all()
+
+
+def cancel_job(db: Session, job_id: str) -> DBJob:
+    """Queued jobs are cancelled at once; running ones stop at their next progress report."""
+    row = get_job_or_404(db, job_id)
+    if row.status in TERMINAL_JOB_STATUSES:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Job is already {row.status}.")
+    cancelled_now = row.status == "queued"
+    if cancelled_now:
+        row.status = "cancelled"
+        row.finished_at = datetime.now()
+    row.cancel_requested = True
+    db.commit()
+    db.refresh(row)
+    if cancelled_now:
+        _run_cleanup(row.kind, row.payload_json)
+    _notify(row.id, kind=row.kind, status=row.status, cancel_requested=True)
+    return row
+
+
+def _claimable(now: datetime):
+    # Queued and due, or running with an expired lease (its worker died).
+    return or_(
+        and_(DBJob.status == "queued", DBJob.run_after <= now),
+        and_(DBJob.status == "running", DBJob.lease_expires_at < now),
+    )
+
+
+def claim_job(
+    db: Session,
+    *,
+    worker_id: str,
+    job_id: str | None = None,
+    kinds: Iterable[str] | None = None,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+) -> DBJob | None:
+    """Atomically lease one due job (or ``job_id``) for ``worker_id``.
+
+    The claim is a conditional UPDATE, so concurrent workers on any number
+    of nodes never run the same attempt twice; the loser simply tries the
+    next candidate.
+    """
+    now = datetime.now()
+    candidates = db.query(DBJob.id, DBJob.kind).filter(_claimable(now), DBJob.cancel_requested.is_(False))
+    if job_id is not None:
+        candidates = candidates.filter(DBJob.id == job_id)
+    kind_list = list(kinds) if kinds is not None else list(_handlers)
+    candidates = candidates.filter(DBJob.kind.in_(kind_list))
+    candidate_rows = candidates.order_by(DBJob.priority.desc(), DBJob.run_after.asc()).limit(10).all()
+    for candidate_id, candidate_kind in candidate_rows:
+        conditions = [DBJob.id == candidate_id, _claimable(now)]
+        limit = job_concurrency_limit(candidate_kind)
+        if limit is not None:
+            # Checked in the claiming UPDATE itself, so workers on every node share the limit.
+            running = aliased(DBJob)
+            active = (
+                select(func.count())
+                .select_from(running)
+                .where(running.kind == candidate_kind, running.status == "running", running.lease_expires_at >= now)
+                .scalar_subquery()
+            )
+            conditions.append(active < limit)
+        result = db.execute(
+            update(DBJob)
+            .where(*conditions)
+            .values(
+                status="running",
+                lease_owner=worker_id,
+                lease_expires_at=now + timedelta(seconds=lease_seconds),
+                attempts=DBJob.attempts + 1,
+                started_at=now,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+        if result.rowcount == 1:
+            row = db.query(DBJob).filter(DBJob.id == candidate_id).first()
+            _notify(candidate_id, kind=row.kind, status="running", attempts=row.attempts)
+            return row
+    return None
+
+
+def _retry_delay_seconds(attempts: int) -> float:
+    try:
+        base = float(os.getenv("ADMIN_JOB_RETRY_BASE_SECONDS", str(DEFAULT_RETRY_BASE_SECONDS)))
+    except ValueError:
+        base = DEFAULT_RETRY_BASE_SECONDS
+    return min(DEFAULT_RETRY_CAP_SECONDS, max(0.0, base) * (2 ** max(0, attempts - 1)))
+
+
+def _finish(db: Session, job_id: str, worker_id: str, **values: Any) -> None:
+    values.setdefault("updated_at", datetime.now())
+    result = db.execute(
+        update(DBJob)
+        .where(DBJob.id == job_id, DBJob.lease_owner == worker_id)
+        .values(lease_owner=None, lease_expires_at=None, **values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    if result.rowcount == 1:
+        _notify(job_id, status=values.get("status"))
+
+
+class _LeaseHeartbeat:
+    """Renews a running job's lease every third of ``lease_seconds`` until stopped.
+
+    Handlers that never report progress (or block longer than a lease between reports) would
+    otherwise look crashed once the lease expires, and another worker would run them again.
+    """
+
+    def __init__(self, bind: Engine | Connection, job_id: str, *, worker_id: str, lease_seconds: int) -> None:
+        self.bind = bind
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def renew(self) -> None:
+        with Session(bind=self.bind) as db:
+            db.execute(
+                update(DBJob)
+                .where(DBJob.id == self.job_id, DBJob.lease_owner == self.worker_id, DBJob.status == "running")
+                .values(lease_expires_at=datetime.now() + timedelta(seconds=self.lease_seconds))
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+
+    def _run(self) -> None:
+        while not self._stop.wait(max(0.1, self.lease_seconds / 3)):
+            try:
+                self.renew()
+            except Exception as exc:
+                logger.warning("Job lease renewal failed.", extra={"job_id": self.job_id, "error": str(exc)})
+
+    def __enter__(self) -> "_LeaseHeartbeat":
+        self._thread = threading.Thread(target=self._run, name="job-lease-heartbeat", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+
+def execute_claimed_job(bind: Engine | Connection, row: DBJob, *, worker_id: str, lease_seconds: int) -> None:
+    handler = _handlers.get(row.kind)
+    context = JobContext(
+        job_id=row.id,
+        kind=row.kind,
+        payload=dict(row.payload_json or {}),
+        input_data=row.input_data,
+        requested_by=row.requested_by,
+        attempt=int(row.attempts or 1),
+        worker_id=worker_id,
+        bind=bind,
+        lease_seconds=lease_seconds,
+    )
+    with Session(bind=bind) as job_db:
+        if handler is None:
+            _finish(
+                job_db,
+                row.id,
+                worker_id,
+                status="failed",
+                error_message=f"No handler for {row.kind}.",
+                finished_at=datetime.now(),
+            )
+            return
+        if context.attempt > int(row.max_attempts or 1):
+            # Reclaimed after its worker's lease expired once too often (crash loop): give up.
+            _finish(
+                job_db,
+                row.id,
+                worker_id,
+                status="failed",
+                error_message=row.error_message or "Job lease expired too many times.",
+                finished_at=datetime.now(),
+            )
+            _run_cleanup(row.kind, context.payload)
+            return
+        heartbeat = _LeaseHeartbeat(bind, row.id, worker_id=worker_id, lease_seconds=lease_seconds)
+        with Session(bind=bind) as work_db, heartbeat:
+            try:
+                result = handler(work_db, context) or {}
+                work_db.commit()
+            except JobCancelled:
+                work_db.rollback()
+                _finish(job_db, row.id, worker_id, status="cancelled", finished_at=datetime.now())
+                _run_cleanup(row.kind, context.payload)
+                return
+            except Exception as exc:
+                work_db.rollback()
+                permanent = isinstance(exc, (JobFailed, HTTPException))
+                message = str(getattr(exc, "detail", None) or exc)[:1000]
+                if permanent or context.attempt >= int(row.max_attempts or 1):
+                    logger.error("Job failed.", extra={"job_id": row.id, "kind": row.kind, "error": message})
+                    _finish(
+                        job_db,
+                        row.id,
+                        worker_id,
+                        status="failed",
+                        error_message=message,
+                        finished_at=datetime.now(),
+                    )
+                    _run_cleanup(row.kind, context.payload)
+                else:
+                    delay = _retry_delay_seconds(context.attempt)
+                    logger.warning(
+                        "Job attempt failed; retrying.",
+                        extra={"job_id": row.id, "kind": row.kind, "attempt": context.attempt, "error": message},
+                    )
+                    _finish(
+                        job_db,
+                        row.id,
+                        worker_id,
+                        status="queued",
+                        error_message=message,
+                        run_after=datetime.now() + timedelta(seconds=delay),
+                    )
+                return
+        _finish(
+            job_db,
+            row.id,
+            worker_id,
+            status="succeeded",
+            result_json=result,
+            progress=1.0,
+            error_message=None,
+            finished_at=datetime.now(),
+        )
+
+
+def new_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+def run_job_now(job_id: str, *, bind: Engine | Connection, lease_seconds: int = DEFAULT_LEASE_SECONDS) -> None:
+    """Background-task entry point: run ``job_id`` in this process unless a worker already claimed it.
+
+    Background tasks inherit the request's context (deadline, usage tracking, trace); the job runs in
+    a fresh one so it behaves exactly as it would in a standalone worker.
+    """
+    contextvars.Context().run(_claim_and_run, job_id, bind=bind, lease_seconds=lease_seconds)
+
+
+def _claim_and_run(job_id: str, *, bind: Engine | Connection, lease_seconds: int) -> None:
+    worker_id = new_worker_id()
+    with Session(bind=bind) as db:
+        row = claim_job(db, worker_id=worker_id, job_id=job_id, lease_seconds=lease_seconds)
+        if row is None:
+            return
+        db.expunge(row)
+    execute_claimed_job(bind, row, worker_id=worker_id, lease_seconds=lease_seconds)
+
+
+def inline_dispatch_enabled() -> bool:
+    """``ADMIN_JOB_INLINE_DISPATCH`` (default on) runs new jobs in the API process right after the response."""
+    return os.getenv("ADMIN_JOB_INLINE_DISPATCH", "true").strip().lower() in {"1", "true", "yes", "on"}
+
+
+class JobWorker:
+    """Polls the jobs table and runs due jobs; several workers (threads, processes or nodes) can share it."""
+
+    def __init__(
+        self,
+        bind: Engine | Connection,
+        *,
+        worker_id: str | None = None,
+        kinds: Iterable[str] | None = None,
+        poll_interval_seconds: float = 2.0,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    ) -> None:
+        self.bind = bind
+        self.worker_id = worker_id or new_worker_id()
+        self.kinds = list(kinds) if kinds is not None else None
+        self.poll_interval_seconds = poll_interval_seconds
+        self.lease_seconds = lease_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> bool:
+        """Claim and run one due job; returns False when nothing was due."""
+        with Session(bind=self.bind) as db:
+            row = claim_job(db, worker_id=self.worker_id, kinds=self.kinds, lease_seconds=self.lease_seconds)
+            if row is None:
+                return False
+            db.expunge(row)
+        execute_claimed_job(self.bind, row, worker_id=self.worker_id, lease_seconds=self.lease_seconds)
+        return True
+
+    def run_forever(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ran = self.run_once()
+            except Exception as exc:  # pragma: no cover - keep the worker alive on DB hiccups
+                logger.warning("Job worker poll failed.", extra={"worker_id": self.worker_id, "error": str(exc)})
+                ran = False
+            if not ran:
+                self._stop.wait(self.poll_interval_seconds)
+
+    def start(self) -> threading.Thread:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name=f"job-worker-{self.worker_id}", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import event, func, inspect, insert, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..core.db_models import DBNotification, DBNotificationCounter
+from ..core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+_counters = DBNotificationCounter.__table__
+_installed = False
+_UPSERT_DIALECTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+def _unread_deltas(session: Session) -> dict[tuple[str, str], int]:
+    deltas: dict[tuple[str, str], int] = {}
+
+    def _add(row: DBNotification, delta: int) -> None:
+        key = (row.channel or "in_app", row.event_key)
+        deltas[key] = deltas.get(key, 0) + delta
+
+    for row in session.new:
+        if isinstance(row, DBNotification) and not row.is_read:
+            _add(row, 1)
+    for row in session.dirty:
+        if not isinstance(row, DBNotification):
+            continue
+        history = inspect(row).attrs.is_read.history
+        if not history.has_changes():
+            continue
+        was_read = bool(history.deleted[0]) if history.deleted else False
+        if was_read != bool(row.is_read):
+            _add(row, -1 if row.is_read else 1)
+    for row in session.deleted:
+        if isinstance(row, DBNotification) and not row.is_read:
+            _add(row, -1)
+    return {key: delta for key, delta in deltas.items() if delta}
+
+
+def _apply_unread_deltas(session: Session, _flush_context) -> None:
+    deltas = _unread_deltas(session)
+    if not deltas:
+        return
+    # Same connection and transaction as the flush: the counters commit or roll back with the notifications.
+    connection = session.connection()
+    now = datetime.now()
+    for (channel, event_key), delta in sorted(deltas.items()):
+        _upsert_counter(connection, channel, event_key, delta, now)
+
+
+def _upsert_counter(connection, channel: str, event_key: str, delta: int, now: datetime) -> None:
+    """Add ``delta`` to one counter row, creating it if needed, without racing concurrent first writers."""
+    values = {"channel": channel, "event_key": event_key, "unread_count": max(0, delta), "updated_at": now}
+    dialect = connection.dialect.name
+    if dialect in _UPSERT_DIALECTS:
+        statement = _UPSERT_DIALECTS[dialect](_counters).values(**values)
+        connection.execute(
+            statement.on_conflict_do_update(
+                index_elements=[_counters.c.channel, _counters.c.event_key],
+                set_={"unread_count": _counters.c.unread_count + delta, "updated_at": now},
+            )
+        )
+        return
+    increment = (
+        update(_counters)
+        .where(_counters.c.channel == channel, _counters.c.event_key == event_key)
+        .values(unread_count=_counters.c.unread_count + delta, updated_at=now)
+    )
+    if connection.execute(increment).rowcount:
+        return
+    # Another flush may create the row between the UPDATE and the INSERT; keep the
+    # outer transaction usable and count against the row it wrote.
+    try:
+        with connection.begin_nested():
+            connection.execute(insert(_counters).values(**values))
+    except IntegrityError:
+        connection.execute(increment)
+
+def install_unread_counters() -> None:
+    """Keep ``admin_notification_counters`` in step with every ORM write to notifications; safe to call twice."""
+    global _installed
+    if _installed:
+        return
+    event.listen(Session, "after_flush", _apply_unread_deltas)
+    _installed = True
+
+
+def unread_counts(db: Session, *, channel: str | None = None, event_key: str | None = None) -> dict[str, Any]:
+    query = db.query(DBNotificationCounter.channel, DBNotificationCounter.event_key, DBNotificationCounter.unread_count)
+    if channel:
+        query = query.filter(DBNotificationCounter.channel == channel)
+    if event_key:
+        query = query.filter(DBNotificationCounter.event_key == event_key)
+    by_channel: dict[str, int] = {}
+    by_event_key: dict[str, int] = {}
+    for row_channel, row_event_key, count in query.all():
+        count = max(0, int(count or 0))
+        if not count:
+            continue
+        by_channel[row_channel] = by_channel.get(row_channel, 0) + count
+        by_event_key[row_event_key] = by_event_key.get(row_event_key, 0) + count
+    return {
+        "unread_count": sum(by_channel.values()),
+        "by_channel": by_channel,
+        "by_event_key": by_event_key,
+    }
+
+
+def counters_watermark(db: Session) -> tuple[Any, ...]:
+    """Changes whenever a notification is created or its read state changes (for ETags)."""
+    latest_created, = db.query(func.max(DBNotification.created_at)).one()
+    latest_counter, unread = db.query(
+        func.max(DBNotificationCounter.updated_at),
+        func.sum(DBNotificationCounter.unread_count),
+    ).one()
+    return latest_created, latest_counter, int(unread or 0)
+
+
+def reconcile_unread_counters(db: Session) -> dict[str, Any]:
+    """Recount unread notifications and overwrite drifted counters (writes that bypassed the ORM, bugs).
+
+    Counts and corrections happen in one transaction; on databases below serializable isolation a
+    notification committed concurrently can be missed until the next run.
+    """
+    actual = {
+        (channel or "in_app", event_key): int(count)
+        for channel, event_key, count in db.query(
+            DBNotification.channel,
+            DBNotification.event_key,
+            func.count(DBNotification.id),
+        )
+        .filter(DBNotification.is_read.is_(False))
+        .group_by(DBNotification.channel, DBNotification.event_key)
+    }
+    stored = {(row.channel, row.event_key): row for row in db.query(DBNotificationCounter).all()}
+    corrected: list[dict[str, Any]] = []
+    now = datetime.now()
+    for key in sorted(set(actual) | set(stored)):
+        expected = actual.get(key, 0)
+        row = stored.get(key)
+        if row is None:
+            db.add(DBNotificationCounter(channel=key[0], event_key=key[1], unread_count=expected, updated_at=now))
+        elif int(row.unread_count or 0) != expected:
+            row.unread_count = expected
+            row.updated_at = now
+        else:
+            continue
+        corrected.append({"channel": key[0], "event_key": key[1], "unread_count": expected})
+    db.commit()
+    if corrected and stored:
+        logger.warning("Unread notification counters drifted.", extra={"corrected": corrected})
+    return {"checked": len(set(actual) | set(stored)), "corrected": len(corrected), "unread_count": sum(actual.values())}
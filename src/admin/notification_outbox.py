@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import os
+import smtplib
+import socket
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from typing import Any, Callable
+
+from sqlalchemy import and_, func, or_, update
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from ..core.db_models import DBNotification, DBNotificationOutbox
+from ..core.logging import get_logger
+
+
+logger = get_logger(__name__)
+
+OUTBOX_STATUSES = ("pending", "sending", "sent", "failed", "skipped")
+DEFAULT_MAX_ATTEMPTS = 5
+DEFAULT_RETRY_BASE_SECONDS = 30.0
+DEFAULT_RETRY_CAP_SECONDS = 3600.0
+DEFAULT_CLAIM_LEASE_SECONDS = 300
+DEFAULT_DIGEST_WINDOW_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class SmtpSettings:
+    host: str
+    port: int = 587
+    username: str | None = None
+    password: str | None = None
+    sender: str = "noreply@prospect.local"
+    use_tls: bool = True
+    timeout_seconds: float = 10.0
+
+    @classmethod
+    def from_env(cls, password: str | None) -> SmtpSettings | None:
+        """``SMTP_HOST`` / ``SMTP_PORT`` / ``SMTP_USERNAME`` / ``SMTP_FROM`` / ``SMTP_USE_TLS``; ``None`` without a host."""
+        host = (os.getenv("SMTP_HOST") or "").strip()
+        if not host:
+            return None
+        return cls(
+            host=host,
+            port=int(os.getenv("SMTP_PORT", "587")),
+            username=os.getenv("SMTP_USERNAME") or None,
+            password=password or None,
+            sender=os.getenv("SMTP_FROM", "noreply@prospect.local"),
+            use_tls=os.getenv("SMTP_USE_TLS", "1").strip().lower() not in {"0", "false", "no"},
+        )
+
+
+def build_email(settings: SmtpSettings, *, recipient: str, subject: str, body: str) -> EmailMessage:
+    email = EmailMessage()
+    email["Subject"] = subject
+    email["From"] = settings.sender
+    email["To"] = recipient
+    email.set_content(body)
+    return email
+
+
+class SmtpSender:
+    """Keeps one SMTP connection open and reuses it for every message sent by this process.
+
+    The connection is reopened when the settings change, after it has been idle for
+    ``idle_seconds`` (servers drop idle sessions) or when the server disconnected; a
+    message that hits a dropped connection is retried once on a fresh one.
+    """
+
+    def __init__(
+        self,
+        *,
+        idle_seconds: float = 60.0,
+        smtp_factory: Callable[..., smtplib.SMTP] = smtplib.SMTP,
+    ) -> None:
+        self._idle_seconds = idle_seconds
+        self._smtp_factory = smtp_factory
+        self._lock = threading.Lock()
+        self._smtp: smtplib.SMTP | None = None
+        self._settings: SmtpSettings | None = None
+        self._last_used = 0.0
+        self._connections_opened = 0
+        self._messages_sent = 0
+
+    def _close(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:  # pragma: no cover - the connection is discarded anyway
+            pass
+        self._smtp = None
+
+    def _connection(self, settings: SmtpSettings) -> smtplib.SMTP:
+        if self._smtp is not None and (
+            settings != self._settings or time.monotonic() - self._last_used > self._idle_seconds
+        ):
+            self._close()
+        if self._smtp is None:
+            smtp = self._smtp_factory(settings.host, settings.port, timeout=settings.timeout_seconds)
+            try:
+                if settings.use_tls:
+                    smtp.starttls()
+                if settings.username:
+                    smtp.login(settings.username, settings.password or "")
+            except Exception:
+                smtp.close()
+                raise
+            self._smtp = smtp
+            self._settings = settings
+            self._connections_opened += 1
+        return self._smtp
+
+    def send(self, settings: SmtpSettings, message: EmailMessage) -> None:
+        with self._lock:
+            for attempt in (1, 2):
+                smtp = self._connection(settings)
+                try:
+                    smtp.send_message(message)
+                except smtplib.SMTPServerDisconnected:
+                    self._smtp = None
+                    if attempt == 2:
+                        raise
+                    continue
+                except Exception:
+                    self._close()
+                    raise
+                self._last_used = time.monotonic()
+                self._messages_sent += 1
+                return
+
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "connections_opened": self._connections_opened,
+                "messages_sent": self._messages_sent,
+                "connected": int(self._smtp is not None),
+            }
+
+
+def _env_seconds(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+def enqueue_email(
+    db: Session,
+    *,
+    recipient: str,
+    subject: str,
+    body: str,
+    notification_id: str | None = None,
+) -> DBNotificationOutbox:
+    """Add an email to the outbox in the caller's transaction; nothing is sent until it commits.
+
+    Delivery waits ``ADMIN_NOTIFICATION_DIGEST_WINDOW_SECONDS`` so bursts to one recipient become one digest.
+    """
+    now = datetime.now()
+    row = DBNotificationOutbox(
+        id=str(uuid.uuid4()),
+        notification_id=notification_id,
+        recipient=recipient.strip().lower(),
+        subject=subject,
+        body=body,
+        status="pending",
+        attempts=0,
+        next_attempt_at=now + timedelta(
+            seconds=_env_seconds("ADMIN_NOTIFICATION_DIGEST_WINDOW_SECONDS", DEFAULT_DIGEST_WINDOW_SECONDS)
+        ),
+        created_at=now,
+    )
+    db.add(row)
+    return row
+
+
+def _claimable(now: datetime, lease_seconds: int):
+    # Due pending rows, or rows left in "sending" by a dispatcher that died mid-batch.
+    return or_(
+        and_(DBNotificationOutbox.status == "pending", DBNotificationOutbox.next_attempt_at <= now),
+        and_(
+            DBNotificationOutbox.status == "sending",
+            DBNotificationOutbox.claimed_at < now - timedelta(seconds=lease_seconds),
+        ),
+    )
+
+
+def _claim_batch(db: Session, dispatcher_id: str, batch_size: int, lease_seconds: int) -> list[DBNotificationOutbox]:
+    now = datetime.now()
+    candidate_ids = [
+        row_id
+        for (row_id,) in db.query(DBNotificationOutbox.id)
+        .filter(_claimable(now, lease_seconds))
+        .order_by(DBNotificationOutbox.next_attempt_at.asc())
+        .limit(batch_size)
+    ]
+    if not candidate_ids:
+        return []
+    # A token per claim, not just per dispatcher: rows this dispatcher claimed in an earlier call
+    # (the background thread vs. the manual endpoint) are still "sending" and must not be picked up again.
+    claim_token = f"{dispatcher_id}:{uuid.uuid4().hex[:8]}"
+    result = db.execute(
+        update(DBNotificationOutbox)
+        .where(DBNotificationOutbox.id.in_(candidate_ids), _claimable(now, lease_seconds))
+        .values(status="sending", claimed_by=claim_token, claimed_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    if result.rowcount == 0:
+        return []
+    return (
+        db.query(DBNotificationOutbox)
+        .filter(
+            DBNotificationOutbox.id.in_(candidate_ids),
+            DBNotificationOutbox.claimed_by == claim_token,
+            DBNotificationOutbox.status == "sending",
+        )
+        .order_by(DBNotificationOutbox.created_at.asc())
+        .all()
+    )
+
+
+def _digest(rows: list[DBNotificationOutbox]) -> tuple[str, str]:
+    if len(rows) == 1:
+        return rows[0].subject, rows[0].body
+    sections = [f"{row.subject}\n{'-' * min(len(row.subject), 60)}\n{row.body}" for row in rows]
+    return f"{len(rows)} nouvelles notifications", "\n\n".join(sections)
+
+
+def _retry_delay_seconds(attempts: int) -> float:
+    base = _env_seconds("ADMIN_NOTIFICATION_RETRY_BASE_SECONDS", DEFAULT_RETRY_BASE_SECONDS)
+    return min(DEFAULT_RETRY_CAP_SECONDS, base * (2 ** max(0, attempts - 1)))
+
+
+def dispatch_outbox(
+    db: Session,
+    sender: SmtpSender,
+    settings: SmtpSettings | None,
+    *,
+    dispatcher_id: str,
+    batch_size: int = 100,
+    digest: bool = True,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    lease_seconds: int = DEFAULT_CLAIM_LEASE_SECONDS,
+) -> dict[str, int]:
+    """Deliver one batch of due outbox emails, one message (or digest) per recipient."""
+    started = time.perf_counter()
+    rows = _claim_batch(db, dispatcher_id, batch_size, lease_seconds)
+    result = {"claimed": len(rows), "sent": 0, "messages": 0, "retried": 0, "failed": 0, "skipped": 0}
+    if not rows:
+        return result
+    if settings is None:
+        for row in rows:
+            row.status = "skipped"
+            row.last_error = "SMTP_HOST not configured."
+            row.claimed_by = None
+        db.commit()
+        logger.warning("SMTP_HOST not configured. Outbox emails skipped.", extra={"count": len(rows)})
+        result["skipped"] = len(rows)
+        return result
+
+    groups: dict[str, list[DBNotificationOutbox]] = {}
+    for row in rows:
+        groups.setdefault(row.recipient, []).append(row)
+    for recipient, group in groups.items():
+        batches = [group] if digest else [[row] for row in group]
+        for batch in batches:
+            subject, body = _digest(batch)
+            try:
+                sender.send(settings, build_email(settings, recipient=recipient, subject=subject, body=body))
+            except Exception as exc:
+                message = str(exc)[:500] or type(exc).__name__
+                for row in batch:
+                    row.attempts = int(row.attempts or 0) + 1
+                    row.last_error = message
+                    row.claimed_by = None
+                    if row.attempts >= max_attempts:
+                        row.status = "failed"
+                        result["failed"] += 1
+                    else:
+                        row.status = "pending"
+                        row.next_attempt_at = datetime.now() + timedelta(seconds=_retry_delay_seconds(row.attempts))
+                        result["retried"] += 1
+                logger.warning(
+                    "Outbox delivery failed.",
+                    extra={"recipient_count": len(batch), "attempts": batch[0].attempts, "error": message},
+                )
+            else:
+                sent_at = datetime.now()
+                for row in batch:
+                    row.status = "sent"
+                    row.sent_at = sent_at
+                    row.attempts = int(row.attempts or 0) + 1
+                    row.digest_size = len(batch)
+                    row.last_error = None
+                    row.claimed_by = None
+                notification_ids = [row.notification_id for row in batch if row.notification_id]
+                if notification_ids:
+                    db.execute(
+                        update(DBNotification)
+                        .where(DBNotification.id.in_(notification_ids))
+                        .values(sent_at=sent_at)
+                        .execution_options(synchronize_session=False)
+                    )
+                result["sent"] += len(batch)
+                result["messages"] += 1
+            # Commit per message so a crash never re-sends what was already delivered.
+            db.commit()
+    logger.info("Outbox dispatched.", extra={**result, "elapsed_ms": round((time.perf_counter() - started) * 1000, 2)})
+    return result
+
+
+def outbox_stats(db: Session) -> dict[str, int]:
+    counts = dict(
+        db.query(DBNotificationOutbox.status, func.count(DBNotificationOutbox.id))
+        .group_by(DBNotificationOutbox.status)
+        .all()
+    )
+    return {status: int(counts.get(status, 0)) for status in OUTBOX_STATUSES}
+
+
+def digest_enabled() -> bool:
+    return os.getenv("ADMIN_NOTIFICATION_DIGEST", "true").strip().lower() in {"1", "true", "yes", "on"}
+
+
+def new_dispatcher_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:outbox:{uuid.uuid4().hex[:6]}"
+
+
+class OutboxDispatcher:
+    """Background thread draining the outbox; ``wake()`` after a commit skips the poll interval."""
+
+    def __init__(
+        self,
+        bind: Engine | Connection,
+        sender: SmtpSender,
+        settings_provider: Callable[[Session], SmtpSettings | None],
+        *,
+        poll_interval_seconds: float = 15.0,
+        batch_size: int = 100,
+    ) -> None:
+        self.bind = bind
+        self.sender = sender
+        self.settings_provider = settings_provider
+        self.poll_interval_seconds = poll_interval_seconds
+        self.batch_size = batch_size
+        self.dispatcher_id = new_dispatcher_id()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def run_once(self) -> dict[str, int]:
+        with Session(bind=self.bind) as db:
+            return dispatch_outbox(
+                db,
+                self.sender,
+                self.settings_provider(db),
+                dispatcher_id=self.dispatcher_id,
+                batch_size=self.batch_size,
+                digest=digest_enabled(),
+            )
+
+    def run_forever(self) -> None:
+        while not self._stop.is_set():
+            try:
+                claimed = self.run_once()["claimed"]
+            except Exception as exc:  # pragma: no cover - keep the dispatcher alive on DB hiccups
+                logger.warning("Outbox dispatch failed.", extra={"error": str(exc)})
+                claimed = 0
+            if claimed >= self.batch_size:
+                continue
+            # Digest-window rows become due without a wake-up, so the poll interval bounds their delay.
+            self._wake.wait(self.poll_interval_seconds)
+            self._wake.clear()
+
+    def start(self) -> threading.Thread:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="notification-outbox", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.sender.close()
+
+
+def outbox_stats_payload(db: Session, sender: SmtpSender) -> dict[str, Any]:
+    return {"by_status": outbox_stats(db), "smtp": sender.stats()}
@@ -9,6 +9,7 @@ import requests
 
 from ..core.http import HttpRequestConfig, request_json
 from ..core.logging import get_logger
+from ..core.tracing import span
 
 
 logger = get_logger(__name__)
@@ -144,14 +145,15 @@ def chat_completion(
 
     timeout_seconds = _resolve_timeout_seconds(config)
     session = requests.Session()
-    response_payload = request_json(
-        session,
-        "POST",
-        f"{base_url}/v1/chat/completions",
-        headers=headers,
-        json=payload,
-        config=HttpRequestConfig(timeout=timeout_seconds, max_retries=2),
-    )
+    with span("ollama.chat_completion", kind="client", model=model_name, messages=len(messages)):
+        response_payload = request_json(
+            session,
+            "POST",
+            f"{base_url}/v1/chat/completions",
+            headers=headers,
+            json=payload,
+            config=HttpRequestConfig(timeout=timeout_seconds, max_retries=2),
+        )
 
     choices = response_payload.get("choices") if isinstance(response_payload, dict) else None
     if not isinstance(choices, list) or not choices:
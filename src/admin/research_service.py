@@ -9,6 +9,7 @@ from urllib.parse import parse_qs, unquote, urlparse
 
 import requests
 
+from ..core.concurrency import DeadlineExceeded
 from ..core.http import HttpRequestConfig, request_json, request_with_retries
 from ..core.logging import get_logger
 from .ollama_service import chat_completion, parse_json_from_text
@@ -293,6 +294,8 @@ def _search_perplexity(
             results = _extract_perplexity_search_items(response_payload, limit=limit)
             if results:
                 return results
+    except DeadlineExceeded:
+        raise
     except Exception as exc:  # pragma: no cover - network variation
         logger.warning("Perplexity search endpoint call failed, trying chat fallback.", extra={"error": str(exc)})
 
@@ -303,6 +306,8 @@ def _search_perplexity(
             api_key=api_key,
             config=config,
         )
+    except DeadlineExceeded:
+        raise
     except Exception as exc:  # pragma: no cover - network variation
         logger.warning("Perplexity chat fallback failed.", extra={"error": str(exc)})
         return []
@@ -503,6 +508,8 @@ def _search_ollama(query: str, limit: int, config: dict[str, Any]) -> list[dict[
             candidates=candidates,
             limit=limit,
         )
+    except DeadlineExceeded:
+        raise
     except Exception as exc:  # pragma: no cover - network/provider variation
         logger.warning("Ollama research call failed.", extra={"error": str(exc)})
         return []
@@ -561,6 +568,8 @@ def run_web_research(
                 provider_items = _search_ollama(clean_query, per_provider_limit, provider_config)
             else:
                 provider_items = []
+        except DeadlineExceeded:
+            raise
         except Exception as exc:  # pragma: no cover - defensive network fallback
             logger.warning("Web research provider failed.", extra={"provider": provider, "error": str(exc)})
             provider_items = []
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Sequence
 
 from sqlalchemy import String, func, or_, case, literal, text
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Query, Session, joinedload, load_only
 
-from ..core.db_models import DBCompany, DBInteraction, DBLead
+from ..core.db_models import DBAdminUser, DBCompany, DBInteraction, DBLead, DBTask
 from ..core.models import InteractionType, LeadStatus
 
 
@@ -39,6 +39,14 @@ def _enum_value(value: Any) -> str:
     return str(value)
 
 
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _passthrough(value: datetime | None) -> datetime | None:
+    return value
+
+
 def _canonical_stage_for_lead(lead: DBLead) -> str:
     raw = str(getattr(lead, "stage_canonical", "") or "").strip().lower()
     if raw:
@@ -57,6 +65,181 @@ def _canonical_stage_for_lead(lead: DBLead) -> str:
     return mapping.get(status_value, "new")
 
 
+DateFormatter = Callable[[datetime | None], Any]
+
+# Sparse fieldsets: output field -> (lead columns to load, company columns to load, getter).
+_LEAD_FIELD_SPECS: dict[str, tuple[tuple[str, ...], tuple[str, ...], Callable[[DBLead, DateFormatter], Any]]] = {
+    "id": (("id",), (), lambda lead, fmt: lead.id),
+    "email": (("email",), (), lambda lead, fmt: lead.email),
+    "first_name": (("first_name",), (), lambda lead, fmt: lead.first_name),
+    "last_name": (("last_name",), (), lambda lead, fmt: lead.last_name),
+    "title": (("title",), (), lambda lead, fmt: lead.title),
+    "phone": (("phone",), (), lambda lead, fmt: lead.phone),
+    "linkedin_url": (
+        ("linkedin_url",),
+        ("linkedin_url",),
+        lambda lead, fmt: lead.linkedin_url or (lead.company.linkedin_url if lead.company else None),
+    ),
+    "company_name": ((), ("name",), lambda lead, fmt: lead.company.name if lead.company else None),
+    "company_industry": ((), ("industry",), lambda lead, fmt: lead.company.industry if lead.company else None),
+    "company_location": ((), ("location",), lambda lead, fmt: lead.company.location if lead.company else None),
+    "status": (("status",), (), lambda lead, fmt: _enum_value(lead.status)),
+    "stage": (("stage",), (), lambda lead, fmt: _enum_value(lead.stage) if lead.stage else None),
+    "stage_canonical": (("stage_canonical", "status"), (), lambda lead, fmt: _canonical_stage_for_lead(lead)),
+    "outcome": (("outcome",), (), lambda lead, fmt: _enum_value(lead.outcome) if lead.outcome else None),
+    "lead_owner_user_id": (("lead_owner_user_id",), (), lambda lead, fmt: lead.lead_owner_user_id),
+    "segment": (("segment",), (), lambda lead, fmt: lead.segment),
+    "source": (("source",), (), lambda lead, fmt: lead.source),
+    "icp_score": (("icp_score",), (), lambda lead, fmt: lead.icp_score),
+    "heat_score": (("heat_score",), (), lambda lead, fmt: lead.heat_score),
+    "total_score": (("total_score",), (), lambda lead, fmt: lead.total_score),
+    "confidence_score": (("confidence_score",), (), lambda lead, fmt: lead.confidence_score),
+    "tier": (("tier",), (), lambda lead, fmt: lead.tier),
+    "heat_status": (("heat_status",), (), lambda lead, fmt: lead.heat_status),
+    "next_best_action": (("next_best_action",), (), lambda lead, fmt: lead.next_best_action),
+    "playbook_id": (("playbook_id",), (), lambda lead, fmt: lead.playbook_id),
+    "tags": (("tags",), (), lambda lead, fmt: lead.tags or []),
+    "icp_breakdown": (("icp_breakdown",), (), lambda lead, fmt: lead.icp_breakdown or {}),
+    "heat_breakdown": (("heat_breakdown",), (), lambda lead, fmt: lead.heat_breakdown or {}),
+    "details": (("details",), (), lambda lead, fmt: lead.details or {}),
+    "last_scored_at": (("last_scored_at",), (), lambda lead, fmt: fmt(lead.last_scored_at)),
+    "stage_entered_at": (("stage_entered_at",), (), lambda lead, fmt: fmt(lead.stage_entered_at)),
+    "sla_due_at": (("sla_due_at",), (), lambda lead, fmt: fmt(lead.sla_due_at)),
+    "next_action_at": (("next_action_at",), (), lambda lead, fmt: fmt(lead.next_action_at)),
+    "handoff_required": (("handoff_required",), (), lambda lead, fmt: bool(lead.handoff_required)),
+    "handoff_completed_at": (("handoff_completed_at",), (), lambda lead, fmt: fmt(lead.handoff_completed_at)),
+    "created_at": (("created_at",), (), lambda lead, fmt: fmt(lead.created_at)),
+    "updated_at": (("updated_at",), (), lambda lead, fmt: fmt(lead.updated_at)),
+}
+
+LEAD_FIELDS = frozenset(_LEAD_FIELD_SPECS)
+LEAD_LIST_DEFAULT_FIELDS = (
+    "id",
+    "email",
+    "first_name",
+    "last_name",
+    "phone",
+    "linkedin_url",
+    "company_name",
+    "company_industry",
+    "company_location",
+    "status",
+    "stage_canonical",
+    "lead_owner_user_id",
+    "segment",
+    "icp_score",
+    "heat_score",
+    "total_score",
+    "tier",
+    "heat_status",
+    "next_best_action",
+    "tags",
+    "last_scored_at",
+    "stage_entered_at",
+    "sla_due_at",
+    "next_action_at",
+    "handoff_required",
+    "handoff_completed_at",
+    "created_at",
+    "updated_at",
+)
+LEAD_INCLUDES = frozenset({"company", "owner", "open_tasks_count", "last_interaction"})
+_INCLUDED_COMPANY_COLUMNS = ("id", "name", "domain", "industry", "size_range", "location", "linkedin_url")
+
+
+def _lead_load_options(fields: Sequence[str], include: Sequence[str]) -> list[Any]:
+    lead_columns = {"id"}
+    company_columns: set[str] = set()
+    for field in fields:
+        columns, company_fields, _getter = _LEAD_FIELD_SPECS[field]
+        lead_columns.update(columns)
+        company_columns.update(company_fields)
+    if "owner" in include:
+        lead_columns.add("lead_owner_user_id")
+    if "company" in include:
+        company_columns.update(_INCLUDED_COMPANY_COLUMNS)
+
+    options: list[Any] = [load_only(*(getattr(DBLead, column) for column in sorted(lead_columns)))]
+    if company_columns:
+        options.append(
+            joinedload(DBLead.company).load_only(*(getattr(DBCompany, column) for column in sorted(company_columns)))
+        )
+    return options
+
+
+def _serialize_lead_fields(lead: DBLead, fields: Sequence[str], format_datetime: DateFormatter) -> dict[str, Any]:
+    return {field: _LEAD_FIELD_SPECS[field][2](lead, format_datetime) for field in fields}
+
+
+def _attach_lead_includes(
+    db: Session,
+    leads: Sequence[DBLead],
+    items: list[dict[str, Any]],
+    include: Sequence[str],
+    format_datetime: DateFormatter,
+) -> None:
+    """Add opt-in expansions to serialized leads with one batched query per expansion."""
+    if not leads or not include:
+        return
+    lead_ids = [lead.id for lead in leads]
+
+    owners: dict[str, dict[str, Any]] = {}
+    if "owner" in include:
+        owner_ids = {lead.lead_owner_user_id for lead in leads if lead.lead_owner_user_id}
+        if owner_ids:
+            rows = (
+                db.query(DBAdminUser.id, DBAdminUser.email, DBAdminUser.display_name)
+                .filter(DBAdminUser.id.in_(owner_ids))
+                .all()
+            )
+            owners = {row.id: {"id": row.id, "email": row.email, "display_name": row.display_name} for row in rows}
+
+    open_tasks: dict[str, int] = {}
+    if "open_tasks_count" in include:
+        rows = (
+            db.query(DBTask.lead_id, func.count(DBTask.id))
+            .filter(DBTask.lead_id.in_(lead_ids), DBTask.status != "Done")
+            .group_by(DBTask.lead_id)
+            .all()
+        )
+        open_tasks = {lead_id: int(count) for lead_id, count in rows}
+
+    last_interactions: dict[str, dict[str, Any]] = {}
+    if "last_interaction" in include:
+        latest_ids = (
+            db.query(func.max(DBInteraction.id))
+            .filter(DBInteraction.lead_id.in_(lead_ids))
+            .group_by(DBInteraction.lead_id)
+        )
+        rows = (
+            db.query(DBInteraction.id, DBInteraction.lead_id, DBInteraction.type, DBInteraction.timestamp)
+            .filter(DBInteraction.id.in_(latest_ids))
+            .all()
+        )
+        last_interactions = {
+            row.lead_id: {
+                "id": row.id,
+                "type": _enum_value(row.type) if row.type else None,
+                "timestamp": format_datetime(row.timestamp),
+            }
+            for row in rows
+        }
+
+    for lead, item in zip(leads, items):
+        if "company" in include:
+            item["company"] = (
+                {column: getattr(lead.company, column) for column in _INCLUDED_COMPANY_COLUMNS}
+                if lead.company
+                else None
+            )
+        if "owner" in include:
+            item["owner"] = owners.get(lead.lead_owner_user_id) if lead.lead_owner_user_id else None
+        if "open_tasks_count" in include:
+            item["open_tasks_count"] = open_tasks.get(lead.id, 0)
+        if "last_interaction" in include:
+            item["last_interaction"] = last_interactions.get(lead.id)
+
+
 def _build_daily_trend(db: Session, days: int = 30) -> List[Dict[str, Any]]:
     start_day = date.today() - timedelta(days=days - 1)
     start_dt = datetime.combine(start_day, datetime.min.time())
@@ -166,10 +349,9 @@ def compute_core_funnel_stats(db: Session, qualification_threshold: float) -> Di
     }
 
 
-def list_leads(
+def build_leads_filter_query(
     db: Session,
-    page: int,
-    page_size: int,
+    *,
     search: str | None = None,
     status_filter: str | None = None,
     segment_filter: str | None = None,
@@ -188,13 +370,15 @@ def list_leads(
     created_to: datetime | None = None,
     last_scored_from: datetime | None = None,
     last_scored_to: datetime | None = None,
-    sort_by: str = "created_at",
-    sort_desc: bool = True,
-) -> Dict[str, Any]:
-    page_size = max(1, min(page_size, 100))
-    page = max(page, 1)
+) -> Query | None:
+    """Return the filtered lead query shared by the list and its change watermark.
+
+    Returns ``None`` when the filter combination can never match (min_score > max_score).
+    """
+    if min_score is not None and max_score is not None and float(min_score) > float(max_score):
+        return None
 
-    query = db.query(DBLead).options(joinedload(DBLead.company))
+    query = db.query(DBLead)
 
     if search and search.strip():
         term = f"%{search.strip()}%"
@@ -287,14 +471,111 @@ def list_leads(
         query = query.filter(DBLead.last_scored_at.isnot(None), DBLead.last_scored_at >= last_scored_from)
     if last_scored_to is not None:
         query = query.filter(DBLead.last_scored_at.isnot(None), DBLead.last_scored_at <= last_scored_to)
+    return query
+
+
+def leads_watermark(db: Session, **filters: Any) -> tuple[int, str | None]:
+    """Cheap (row count, max updated_at) fingerprint of the leads matching a filter."""
+    query = build_leads_filter_query(db, **filters)
+    if query is None:
+        return 0, None
+    total, latest = query.with_entities(func.count(DBLead.id), func.max(DBLead.updated_at)).one()
+    return int(total or 0), latest.isoformat() if latest else None
+
+
+def lead_includes_watermark(db: Session, include: Sequence[str] | None) -> tuple[Any, ...]:
+    """Fingerprint of the other tables an ``include`` expansion reads; empty without includes.
+
+    Lead rows alone do not change when a task closes or an interaction is logged, so ETags of
+    payloads with expansions must cover these tables too.
+    """
+    include = include or ()
+    parts: list[Any] = []
+    if "open_tasks_count" in include:
+        total, latest = db.query(func.count(DBTask.id), func.max(DBTask.updated_at)).one()
+        parts.append(("tasks", int(total or 0), latest.isoformat() if latest else None))
+    if "last_interaction" in include:
+        total, last_id = db.query(func.count(DBInteraction.id), func.max(DBInteraction.id)).one()
+        parts.append(("interactions", int(total or 0), last_id))
+    if "owner" in include:
+        total, latest = db.query(func.count(DBAdminUser.id), func.max(DBAdminUser.updated_at)).one()
+        parts.append(("admin_users", int(total or 0), latest.isoformat() if latest else None))
+    if "company" in include:
+        # companies has no updated_at; company fields are edited through a lead update, which touches that lead.
+        total, last_id = db.query(func.count(DBCompany.id), func.max(DBCompany.id)).one()
+        parts.append(("companies", int(total or 0), last_id))
+    return tuple(parts)
 
-    if min_score is not None and max_score is not None and float(min_score) > float(max_score):
+
+def list_leads(
+    db: Session,
+    page: int,
+    page_size: int,
+    search: str | None = None,
+    status_filter: str | None = None,
+    segment_filter: str | None = None,
+    tier_filter: str | None = None,
+    heat_status_filter: str | None = None,
+    company_filter: str | None = None,
+    industry_filter: str | None = None,
+    location_filter: str | None = None,
+    tag_filter: str | None = None,
+    min_score: float | None = None,
+    max_score: float | None = None,
+    has_email: bool | None = None,
+    has_phone: bool | None = None,
+    has_linkedin: bool | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+    last_scored_from: datetime | None = None,
+    last_scored_to: datetime | None = None,
+    sort_by: str = "created_at",
+    sort_desc: bool = True,
+    native_datetimes: bool = False,
+    fields: Sequence[str] | None = None,
+    include: Sequence[str] | None = None,
+) -> Dict[str, Any]:
+    """Paginated lead list.
+
+    With ``native_datetimes`` the items keep ``datetime`` values, for callers that
+    render through ``FastJSONResponse`` instead of FastAPI's encoder. ``fields``
+    (a subset of ``LEAD_FIELDS``) restricts both the loaded columns and the
+    serialized keys; ``include`` adds expansions from ``LEAD_INCLUDES``.
+    """
+    page_size = max(1, min(page_size, 100))
+    page = max(page, 1)
+
+    query = build_leads_filter_query(
+        db,
+        search=search,
+        status_filter=status_filter,
+        segment_filter=segment_filter,
+        tier_filter=tier_filter,
+        heat_status_filter=heat_status_filter,
+        company_filter=company_filter,
+        industry_filter=industry_filter,
+        location_filter=location_filter,
+        tag_filter=tag_filter,
+        min_score=min_score,
+        max_score=max_score,
+        has_email=has_email,
+        has_phone=has_phone,
+        has_linkedin=has_linkedin,
+        created_from=created_from,
+        created_to=created_to,
+        last_scored_from=last_scored_from,
+        last_scored_to=last_scored_to,
+    )
+    if query is None:
         return {
             "page": page,
             "page_size": page_size,
             "total": 0,
             "items": [],
         }
+    selected_fields = tuple(fields) if fields else LEAD_LIST_DEFAULT_FIELDS
+    selected_include = tuple(include or ())
+    query = query.options(*_lead_load_options(selected_fields, selected_include))
 
     sort_column = DBLead.created_at
     if sort_by == "total_score":
@@ -326,47 +607,37 @@ def list_leads(
     offset = (page - 1) * page_size
     rows = query.offset(offset).limit(page_size).all()
 
-    items = []
-    for lead in rows:
-        company_name = lead.company.name if lead.company else None
-        company_industry = lead.company.industry if lead.company else None
-        company_location = lead.company.location if lead.company else None
-        linkedin_url = lead.linkedin_url or (lead.company.linkedin_url if lead.company else None)
-        items.append(
-            {
-                "id": lead.id,
-                "email": lead.email,
-                "first_name": lead.first_name,
-                "last_name": lead.last_name,
-                "phone": lead.phone,
-                "linkedin_url": linkedin_url,
-                "company_name": company_name,
-                "company_industry": company_industry,
-                "company_location": company_location,
-                "status": _enum_value(lead.status),
-                "stage_canonical": _canonical_stage_for_lead(lead),
-                "lead_owner_user_id": getattr(lead, "lead_owner_user_id", None),
-                "segment": lead.segment,
-                "icp_score": lead.icp_score,
-                "heat_score": lead.heat_score,
-                "total_score": lead.total_score,
-                "tier": lead.tier,
-                "heat_status": lead.heat_status,
-                "next_best_action": lead.next_best_action,
-                "tags": lead.tags or [],
-                "last_scored_at": lead.last_scored_at.isoformat() if lead.last_scored_at else None,
-                "stage_entered_at": lead.stage_entered_at.isoformat() if getattr(lead, "stage_entered_at", None) else None,
-                "sla_due_at": lead.sla_due_at.isoformat() if getattr(lead, "sla_due_at", None) else None,
-                "next_action_at": lead.next_action_at.isoformat() if getattr(lead, "next_action_at", None) else None,
-                "handoff_required": bool(getattr(lead, "handoff_required", False)),
-                "handoff_completed_at": lead.handoff_completed_at.isoformat() if getattr(lead, "handoff_completed_at", None) else None,
-                "created_at": lead.created_at.isoformat() if lead.created_at else None,
-                "updated_at": lead.updated_at.isoformat() if lead.updated_at else None,
-            }
-        )
+    format_datetime = _passthrough if native_datetimes else _isoformat
+    items = [_serialize_lead_fields(lead, selected_fields, format_datetime) for lead in rows]
+    _attach_lead_includes(db, rows, items, selected_include, format_datetime)
     return {
         "page": page,
         "page_size": page_size,
         "total": total,
         "items": items,
     }
+
+
+def get_lead_fields(
+    db: Session,
+    lead_id: str,
+    *,
+    fields: Sequence[str] | None = None,
+    include: Sequence[str] | None = None,
+    native_datetimes: bool = False,
+) -> Dict[str, Any] | None:
+    """Sparse single-lead payload; returns None when the lead does not exist."""
+    selected_fields = tuple(fields) if fields else LEAD_LIST_DEFAULT_FIELDS
+    selected_include = tuple(include or ())
+    lead = (
+        db.query(DBLead)
+        .options(*_lead_load_options(selected_fields, selected_include))
+        .filter(DBLead.id == lead_id)
+        .first()
+    )
+    if lead is None:
+        return None
+    format_datetime = _passthrough if native_datetimes else _isoformat
+    item = _serialize_lead_fields(lead, selected_fields, format_datetime)
+    _attach_lead_includes(db, [lead], [item], selected_include, format_datetime)
+    return item
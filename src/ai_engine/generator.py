@@ -1,5 +1,7 @@
 from .prompts import COLD_EMAIL_TEMPLATE, LINKEDIN_CONNECTION_TEMPLATE, LINKEDIN_MESSAGE_TEMPLATE
 from ..core.models import Lead
+from ..core.concurrency import DeadlineExceeded, bounded_timeout, remaining_seconds
+from ..core.tracing import span
 from openai import OpenAI
 import os
 import json
@@ -85,16 +87,27 @@ class MessageGenerator:
         else:
             print("Warning: No AI provider available. Using template fallbacks only.")
 
+    @staticmethod
+    def _deadline_kwargs() -> dict:
+        """Cap the provider timeout by the request deadline when the caller runs under one."""
+        if remaining_seconds() is None:
+            return {}
+        return {"timeout": bounded_timeout(600.0)}
+
     def generate_gpt_content(self, prompt: str) -> str:
         if not self.client:
             return None
         try:
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=300
-            )
+            with span("llm.chat_completion", kind="client", provider=self.provider, model=self.model_name):
+                response = self.client.chat.completions.create(
+                    model=self.model_name,
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=300,
+                    **self._deadline_kwargs(),
+                )
             return response.choices[0].message.content.strip()
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             print(f"AI Generation Error ({self.provider}): {e}")
             return None
@@ -245,8 +258,11 @@ class MessageGenerator:
             # Only use json_object format for providers that support it
             if self.provider in ("openai", "groq"):
                 kwargs["response_format"] = {"type": "json_object"}
-            response = self.client.chat.completions.create(**kwargs)
+            with span("llm.chat_completion", kind="client", provider=self.provider, model=self.model_name):
+                response = self.client.chat.completions.create(**kwargs, **self._deadline_kwargs())
             return json.loads(response.choices[0].message.content)
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             print(f"Landing Page Generation Error: {e}")
             return {
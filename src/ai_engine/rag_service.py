@@ -9,6 +9,9 @@ from typing import List, Dict, Any
 import pypdf
 from glob import glob
 
+from ..core.concurrency import DeadlineExceeded, bounded_timeout
+from ..core.tracing import span
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -66,13 +69,16 @@ class RAGService:
     def generate_embedding(self, text: str) -> List[float]:
         """Generates an embedding for the given text using Ollama."""
         try:
-            response = requests.post(
-                f"{OLLAMA_BASE_URL}/api/embeddings",
-                json={"model": EMBEDDING_MODEL, "prompt": text},
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()["embedding"]
+            with span("rag.embedding", kind="client", model=EMBEDDING_MODEL, chars=len(text)):
+                response = requests.post(
+                    f"{OLLAMA_BASE_URL}/api/embeddings",
+                    json={"model": EMBEDDING_MODEL, "prompt": text},
+                    timeout=bounded_timeout(10)
+                )
+                response.raise_for_status()
+                return response.json()["embedding"]
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
             return []
@@ -163,6 +169,8 @@ class RAGService:
                 new_docs_count += 1
                 logger.info(f"Ingested: {file_path}")
 
+            except DeadlineExceeded:
+                raise
             except Exception as e:
                 logger.error(f"Failed to ingest {file_path}: {e}")
                 failed_docs_count += 1
@@ -174,6 +182,10 @@ class RAGService:
 
     def search(self, query: str, k: int = 3) -> List[Dict[str, Any]]:
         """Searches for the most similar documents to the query."""
+        with span("rag.search", k=k, documents=len(self.vector_store)):
+            return self._search(query, k)
+
+    def _search(self, query: str, k: int) -> List[Dict[str, Any]]:
         if not self.vector_store:
             return []
 
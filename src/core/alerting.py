@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable
+
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+OVERFLOW_FINGERPRINT = "overflow"
+
+
+@dataclass
+class Alert:
+    """One outbound alert: the first occurrence of an error, or a digest of repeats."""
+
+    fingerprint: str
+    severity: str
+    title: str
+    kind: str
+    path: str
+    count: int
+    first_seen: datetime
+    last_seen: datetime
+    message: str
+    request_ids: list[str] = field(default_factory=list)
+
+    def describe(self) -> str:
+        lines = [f"**Path**: {self.path}", f"**Error**: {self.message}"]
+        if self.count > 1:
+            lines.append(
+                f"**Occurrences**: {self.count} between {self.first_seen:%H:%M:%S} and {self.last_seen:%H:%M:%S}"
+            )
+        if self.request_ids:
+            lines.append(f"**Request ID**: {', '.join(self.request_ids)}")
+        lines.append(f"**Fingerprint**: {self.fingerprint}")
+        return "\n".join(lines)
+
+
+@dataclass
+class _Bucket:
+    fingerprint: str
+    kind: str
+    path: str
+    severity: str
+    message: str
+    first_seen: datetime
+    last_seen: datetime
+    pending: int = 0
+    request_ids: deque[str] = field(default_factory=lambda: deque(maxlen=3))
+    last_sent: float | None = None
+
+
+def alert_fingerprint(kind: str, path: str) -> str:
+    return hashlib.sha1(f"{kind}|{path}".encode("utf-8")).hexdigest()[:12]
+
+
+class AlertPipeline:
+    """Aggregates error reports per fingerprint (error type + route) and sends them off the request path.
+
+    ``report`` only updates in-memory counters. The first occurrence of a fingerprint is sent on the
+    next tick; repeats are counted and sent as one digest once ``min_interval_seconds`` have passed
+    since the last alert for that fingerprint. At most ``max_alerts_per_minute`` alerts go out per
+    minute across all fingerprints; the rest wait for a later tick, which only grows their digest.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[Alert], None],
+        *,
+        min_interval_seconds: float = 300.0,
+        tick_seconds: float = 5.0,
+        max_alerts_per_minute: int = 10,
+        max_fingerprints: int = 500,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._send = send
+        self.min_interval_seconds = min_interval_seconds
+        self.tick_seconds = tick_seconds
+        self.max_alerts_per_minute = max(1, max_alerts_per_minute)
+        self.max_fingerprints = max(1, max_fingerprints)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: dict[str, _Bucket] = {}
+        self._sent_times: deque[float] = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._reported = 0
+        self._sent = 0
+        self._send_errors = 0
+
+    def report(
+        self,
+        kind: str,
+        path: str,
+        *,
+        message: str,
+        severity: str = "ERROR",
+        request_id: str | None = None,
+    ) -> str:
+        """Count one occurrence; never blocks on I/O. Returns the fingerprint."""
+        fingerprint = alert_fingerprint(kind, path)
+        now = datetime.now()
+        with self._lock:
+            self._reported += 1
+            bucket = self._buckets.get(fingerprint)
+            if bucket is None and len(self._buckets) >= self.max_fingerprints:
+                # Too many distinct errors at once: fold the rest into one bucket.
+                fingerprint = OVERFLOW_FINGERPRINT
+                bucket = self._buckets.get(fingerprint)
+                kind, path, message = "various", "various", "Too many distinct errors; see the logs."
+            if bucket is None:
+                bucket = _Bucket(fingerprint, kind, path, severity, message, first_seen=now, last_seen=now)
+                self._buckets[fingerprint] = bucket
+            if bucket.pending == 0:
+                bucket.first_seen = now
+                bucket.message = message
+            bucket.pending += 1
+            bucket.last_seen = now
+            if request_id:
+                bucket.request_ids.append(request_id)
+            first_ever = bucket.last_sent is None and bucket.pending == 1
+        if first_ever:
+            self._wake.set()
+        return fingerprint
+
+    def due_alerts(self) -> list[Alert]:
+        """Take the alerts that may be sent now (at most the remaining per-minute budget)."""
+        now = self._clock()
+        alerts: list[Alert] = []
+        with self._lock:
+            while self._sent_times and now - self._sent_times[0] >= 60:
+                self._sent_times.popleft()
+            budget = self.max_alerts_per_minute - len(self._sent_times)
+            ready = [
+                bucket
+                for bucket in self._buckets.values()
+                if bucket.pending
+                and (bucket.last_sent is None or now - bucket.last_sent >= self.min_interval_seconds)
+            ]
+            ready.sort(key=lambda bucket: (bucket.last_sent is not None, bucket.first_seen))
+            for bucket in ready[: max(0, budget)]:
+                repeated = bucket.last_sent is not None or bucket.pending > 1
+                alerts.append(
+                    Alert(
+                        fingerprint=bucket.fingerprint,
+                        severity=bucket.severity,
+                        title=f"[{bucket.severity}] {'Repeated error' if repeated else 'Application Alert'}",
+                        kind=bucket.kind,
+                        path=bucket.path,
+                        count=bucket.pending,
+                        first_seen=bucket.first_seen,
+                        last_seen=bucket.last_seen,
+                        message=bucket.message,
+                        request_ids=list(bucket.request_ids),
+                    )
+                )
+                bucket.pending = 0
+                bucket.request_ids.clear()
+                bucket.last_sent = now
+                self._sent_times.append(now)
+            # Forget quiet fingerprints so a recurrence much later is reported as new.
+            for fingerprint in [
+                key
+                for key, bucket in self._buckets.items()
+                if not bucket.pending
+                and bucket.last_sent is not None
+                and now - bucket.last_sent >= 2 * self.min_interval_seconds
+            ]:
+                del self._buckets[fingerprint]
+        return alerts
+
+    def run_once(self) -> int:
+        sent = 0
+        for alert in self.due_alerts():
+            try:
+                self._send(alert)
+                sent += 1
+            except Exception as exc:
+                with self._lock:
+                    self._send_errors += 1
+                logger.warning("Unable to send alert.", extra={"fingerprint": alert.fingerprint, "error": str(exc)})
+        with self._lock:
+            self._sent += sent
+        return sent
+
+    def run_forever(self) -> None:
+        while not self._stop.is_set():
+            self.run_once()
+            self._wake.wait(self.tick_seconds)
+            self._wake.clear()
+
+    def start(self) -> threading.Thread:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="alert-pipeline", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.run_once()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "fingerprints": len(self._buckets),
+                "pending": sum(bucket.pending for bucket in self._buckets.values()),
+                "reported": self._reported,
+                "sent": self._sent,
+                "send_errors": self._send_errors,
+            }
+
+
+def build_alert_pipeline(send: Callable[[Alert], None]) -> AlertPipeline:
+    """Configure from ``ALERT_MIN_INTERVAL_SECONDS`` (per-fingerprint digest interval) and
+    ``ALERT_MAX_PER_MINUTE`` (global cap)."""
+    try:
+        min_interval = max(0.0, float(os.getenv("ALERT_MIN_INTERVAL_SECONDS", "300")))
+    except ValueError:
+        min_interval = 300.0
+    try:
+        max_per_minute = int(os.getenv("ALERT_MAX_PER_MINUTE", "10"))
+    except ValueError:
+        max_per_minute = 10
+    return AlertPipeline(send, min_interval_seconds=min_interval, max_alerts_per_minute=max_per_minute)
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+from typing import Callable
+
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+Clock = Callable[[], float]
+
+
+@dataclass(frozen=True)
+class CachedSession:
+    username: str
+    expires_at: datetime
+    cached_until: float
+
+
+@dataclass(frozen=True)
+class _CachedCredential:
+    subject: str
+    cached_until: float
+
+
+class RevocationFeed:
+    """Append-only file that carries revocations between worker processes.
+
+    Each line is ``<kind> <value>``. Readers only stat the file on the hot
+    path and read the new tail when its size changed, so checking for
+    revocations costs one ``os.stat`` per request.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.touch(exist_ok=True)
+        self._offset = self._path.stat().st_size
+
+    def publish(self, kind: str, value: str) -> None:
+        with self._path.open("a", encoding="utf-8") as handle:
+            handle.write(f"{kind} {value}\n")
+
+    def poll(self) -> list[tuple[str, str]]:
+        try:
+            size = self._path.stat().st_size
+        except OSError:
+            return []
+        if size == self._offset:
+            return []
+        if size < self._offset:  # truncated / rotated
+            self._offset = 0
+        with self._path.open("r", encoding="utf-8") as handle:
+            handle.seek(self._offset)
+            chunk = handle.read()
+            self._offset = handle.tell()
+        events: list[tuple[str, str]] = []
+        for line in chunk.splitlines():
+            kind, _, value = line.partition(" ")
+            if kind and value:
+                events.append((kind, value))
+        return events
+
+
+class AuthCache:
+    """In-process cache for the admin auth dependency.
+
+    * Sessions: a validated JWT session id maps to its username and expiry
+      for ``session_ttl_seconds``, so most requests skip the session lookup.
+    * Credentials: successful Basic-auth checks are remembered under an HMAC
+      of the presented username + password (keyed by a per-process secret,
+      so no password material is kept), skipping PBKDF2 on repeat requests.
+      Failed attempts are never cached.
+
+    ``revoke_session`` / ``invalidate_subject`` drop entries immediately in
+    this process and, when a ``RevocationFeed`` is configured, in every
+    other worker that shares the feed file. The TTLs bound how stale a
+    worker can be otherwise.
+    """
+
+    def __init__(
+        self,
+        *,
+        session_ttl_seconds: float = 30.0,
+        credential_ttl_seconds: float = 300.0,
+        max_entries: int = 4096,
+        feed: RevocationFeed | None = None,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        self._lock = Lock()
+        self._session_ttl = session_ttl_seconds
+        self._credential_ttl = credential_ttl_seconds
+        self._max_entries = max_entries
+        self._feed = feed
+        self._clock = clock
+        self._key = secrets.token_bytes(32)
+        self._sessions: OrderedDict[str, CachedSession] = OrderedDict()
+        self._credentials: OrderedDict[str, _CachedCredential] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def _credential_key(self, username: str, password: str) -> str:
+        material = f"{username}\0{password}".encode("utf-8")
+        return hmac.new(self._key, material, hashlib.sha256).hexdigest()
+
+    def _apply_remote_revocations(self) -> None:
+        if self._feed is None:
+            return
+        for kind, value in self._feed.poll():
+            if kind == "session":
+                self._sessions.pop(value, None)
+            elif kind == "subject":
+                self._drop_subject(value)
+
+    def _drop_subject(self, subject: str) -> None:
+        for session_id in [key for key, entry in self._sessions.items() if entry.username == subject]:
+            del self._sessions[session_id]
+        for key in [key for key, entry in self._credentials.items() if entry.subject == subject]:
+            del self._credentials[key]
+
+    @staticmethod
+    def _store(bucket: OrderedDict, key: str, value: object, max_entries: int) -> None:
+        bucket[key] = value
+        bucket.move_to_end(key)
+        while len(bucket) > max_entries:
+            bucket.popitem(last=False)
+
+    def get_session(self, session_id: str) -> CachedSession | None:
+        now = self._clock()
+        with self._lock:
+            self._apply_remote_revocations()
+            entry = self._sessions.get(session_id)
+            if entry is None or entry.cached_until <= now or entry.expires_at <= datetime.utcnow():
+                if entry is not None:
+                    del self._sessions[session_id]
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry
+
+    def put_session(self, session_id: str, *, username: str, expires_at: datetime) -> None:
+        if self._session_ttl <= 0:
+            return
+        entry = CachedSession(username=username, expires_at=expires_at, cached_until=self._clock() + self._session_ttl)
+        with self._lock:
+            self._store(self._sessions, session_id, entry, self._max_entries)
+
+    def get_subject(self, username: str, password: str) -> str | None:
+        now = self._clock()
+        key = self._credential_key(username, password)
+        with self._lock:
+            self._apply_remote_revocations()
+            entry = self._credentials.get(key)
+            if entry is None or entry.cached_until <= now:
+                if entry is not None:
+                    del self._credentials[key]
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry.subject
+
+    def put_subject(self, username: str, password: str, subject: str) -> None:
+        if self._credential_ttl <= 0:
+            return
+        entry = _CachedCredential(subject=subject, cached_until=self._clock() + self._credential_ttl)
+        key = self._credential_key(username, password)
+        with self._lock:
+            self._store(self._credentials, key, entry, self._max_entries)
+
+    def revoke_session(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+        self._publish("session", session_id)
+
+    def invalidate_subject(self, subject: str) -> None:
+        """Forget every cached session and credential of ``subject`` (disabled user, password change...)."""
+        with self._lock:
+            self._drop_subject(subject)
+        self._publish("subject", subject)
+
+    def _publish(self, kind: str, value: str) -> None:
+        if self._feed is None:
+            return
+        try:
+            self._feed.publish(kind, value)
+        except OSError as exc:
+            logger.warning("Unable to broadcast auth revocation.", extra={"kind": kind, "error": str(exc)})
+
+    def clear(self) -> None:
+        with self._lock:
+            self._sessions.clear()
+            self._credentials.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "credentials": len(self._credentials),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+def build_auth_cache() -> AuthCache:
+    """Configure the cache from ``ADMIN_AUTH_SESSION_CACHE_TTL_SECONDS``, ``ADMIN_AUTH_CREDENTIAL_CACHE_TTL_SECONDS``
+    and ``ADMIN_AUTH_REVOCATION_FILE`` (shared revocation feed for multi-worker deployments)."""
+
+    def _seconds(name: str, default: float) -> float:
+        try:
+            return max(0.0, float(os.getenv(name, str(default))))
+        except ValueError:
+            return default
+
+    feed_path = os.getenv("ADMIN_AUTH_REVOCATION_FILE", "").strip()
+    return AuthCache(
+        session_ttl_seconds=_seconds("ADMIN_AUTH_SESSION_CACHE_TTL_SECONDS", 30.0),
+        credential_ttl_seconds=_seconds("ADMIN_AUTH_CREDENTIAL_CACHE_TTL_SECONDS", 300.0),
+        feed=RevocationFeed(feed_path) if feed_path else None,
+    )
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any, Callable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+_PENDING_TAGS_KEY = "response_cache_pending_tags"
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    expires_at: float
+    tag_versions: tuple[tuple[str, int], ...]
+
+
+class ResponseCache:
+    """In-process TTL cache for computed payloads.
+
+    Entries are keyed by endpoint + parameters and carry a snapshot of the
+    version of every tag they depend on. Bumping a tag (see ``invalidate``)
+    makes every dependent entry stale without scanning the cache. Concurrent
+    misses on the same key are collapsed: one caller computes, the others wait
+    for its result.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, *, max_entries: int = 512) -> None:
+        self._lock = Lock()
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._inflight: dict[str, Lock] = {}
+        self._tag_versions: dict[str, int] = {}
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def build_key(endpoint: str, **params: Any) -> str:
+        if not params:
+            return endpoint
+        parts = [f"{name}={params[name]!r}" for name in sorted(params)]
+        return f"{endpoint}?{'&'.join(parts)}"
+
+    def _current_versions(self, tags: Iterable[str]) -> tuple[tuple[str, int], ...]:
+        return tuple((tag, self._tag_versions.get(tag, 0)) for tag in sorted(set(tags)))
+
+    def _lookup(self, key: str, now: float) -> _CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        is_stale = entry.expires_at <= now or any(
+            self._tag_versions.get(tag, 0) != version for tag, version in entry.tag_versions
+        )
+        if is_stale:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Any],
+        *,
+        ttl_seconds: float,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        if ttl_seconds <= 0:
+            return compute()
+
+        tags = tuple(tags)
+        with self._lock:
+            entry = self._lookup(key, time.monotonic())
+            if entry is not None:
+                self._hits += 1
+                return entry.value
+            key_lock = self._inflight.setdefault(key, Lock())
+
+        with key_lock:
+            with self._lock:
+                # Another caller may have filled the entry while we waited.
+                entry = self._lookup(key, time.monotonic())
+                if entry is not None:
+                    self._hits += 1
+                    return entry.value
+                self._misses += 1
+                versions = self._current_versions(tags)
+
+            try:
+                value = compute()
+            finally:
+                with self._lock:
+                    if self._inflight.get(key) is key_lock:
+                        del self._inflight[key]
+
+            with self._lock:
+                # Only store if no tag moved while computing; otherwise the value may already be stale.
+                if versions == self._current_versions(tags):
+                    self._entries[key] = _CacheEntry(
+                        value=value,
+                        expires_at=time.monotonic() + ttl_seconds,
+                        tag_versions=versions,
+                    )
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self._max_entries:
+                        self._entries.popitem(last=False)
+            return value
+
+    def invalidate(self, *tags: str) -> None:
+        if not tags:
+            return
+        with self._lock:
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tag_versions.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round((self._hits / lookups) * 100, 2) if lookups else 0.0,
+            }
+
+
+def _tables_for_instances(instances: Iterable[Any]) -> set[str]:
+    tables: set[str] = set()
+    for instance in instances:
+        table_name = getattr(instance, "__tablename__", None)
+        if table_name:
+            tables.add(table_name)
+    return tables
+
+
+def install_cache_invalidation(cache: ResponseCache, tracked_tables: Iterable[str]) -> None:
+    """Bump cache tags named after tables whenever a transaction writing them commits.
+
+    Covers unit-of-work flushes as well as bulk ``query.update()`` / ``query.delete()``.
+    Tags are only bumped after commit so readers never cache pre-commit state.
+    """
+    tracked = frozenset(tracked_tables)
+
+    def _remember(session: Session, tables: set[str]) -> None:
+        relevant = tables & tracked
+        if relevant:
+            session.info.setdefault(_PENDING_TAGS_KEY, set()).update(relevant)
+
+    @event.listens_for(Session, "after_flush")
+    def _collect_flushed_tables(session: Session, _flush_context: Any) -> None:
+        _remember(
+            session,
+            _tables_for_instances(session.new)
+            | _tables_for_instances(session.dirty)
+            | _tables_for_instances(session.deleted),
+        )
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _collect_bulk_tables(orm_execute_state: Any) -> None:
+        if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+            return
+        mapper = orm_execute_state.bind_mapper
+        table = getattr(getattr(mapper, "local_table", None), "name", None)
+        if table:
+            _remember(orm_execute_state.session, {table})
+
+    @event.listens_for(Session, "after_commit")
+    def _bump_committed_tags(session: Session) -> None:
+        pending = session.info.pop(_PENDING_TAGS_KEY, None)
+        if pending:
+            cache.invalidate(*pending)
+
+    @event.listens_for(Session, "after_soft_rollback")
+    def _drop_rolled_back_tags(session: Session, previous_transaction: Any) -> None:
+        # Only the outermost rollback discards: a rolled-back savepoint keeps the tags of the writes
+        # before it, which at worst invalidates an entry that did not change.
+        if previous_transaction.parent is None:
+            session.info.pop(_PENDING_TAGS_KEY, None)
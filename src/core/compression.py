@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import zlib
+from typing import Callable, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+# Content that is already compressed (or must not be buffered) is passed through untouched.
+UNCOMPRESSIBLE_CONTENT_TYPES = (
+    "text/event-stream",
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "application/zstd",
+    "application/vnd.apache.parquet",
+    "application/octet-stream",
+    "application/pdf",
+    "image/",
+    "audio/",
+    "video/",
+    "font/woff",
+)
+
+CompressionObserver = Callable[[str, int, int], None]
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self, final: bool) -> bytes: ...
+
+
+class _GzipCompressor:
+    def __init__(self, level: int) -> None:
+        # wbits=16+MAX_WBITS writes a gzip container instead of a raw zlib stream.
+        self._stream = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._stream.compress(data)
+
+    def flush(self, final: bool) -> bytes:
+        return self._stream.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self._stream = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._stream.process(data)
+
+    def flush(self, final: bool) -> bytes:
+        return self._stream.finish() if final else self._stream.flush()
+
+
+def supported_encodings() -> tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Pick the best supported encoding from an ``Accept-Encoding`` header (brotli first on ties)."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[token] = weight
+
+    best: str | None = None
+    best_weight = 0.0
+    for encoding in supported_encodings():
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
+
+
+class CompressionMiddleware:
+    """Negotiated gzip / brotli response compression.
+
+    Responses smaller than ``minimum_size``, responses that already carry a
+    ``Content-Encoding`` and already-compressed content types are sent as-is.
+    Streaming bodies are compressed chunk by chunk and flushed after every
+    chunk, so clients keep receiving data incrementally. ``on_compress`` is
+    called once per compressed response with (encoding, original bytes,
+    compressed bytes).
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        on_compress: CompressionObserver | None = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.on_compress = on_compress
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressionResponder(self, encoding)(scope, receive, send)
+
+    def _build_compressor(self, encoding: str) -> _Compressor:
+        if encoding == "br":
+            return _BrotliCompressor(self.brotli_quality)
+        return _GzipCompressor(self.gzip_level)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send: Send | None = None
+        self.start_message: Message | None = None
+        self.compressor: _Compressor | None = None
+        self.passthrough = False
+        self.started = False
+        self.original_bytes = 0
+        self.compressed_bytes = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.middleware.app(scope, receive, self._send)
+
+    def _should_skip(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return True
+        content_type = headers.get("content-type", "").lower()
+        return content_type.startswith(UNCOMPRESSIBLE_CONTENT_TYPES)
+
+    def _compress(self, body: bytes, *, final: bool) -> bytes:
+        assert self.compressor is not None
+        self.original_bytes += len(body)
+        chunk = self.compressor.compress(body) + self.compressor.flush(final)
+        self.compressed_bytes += len(chunk)
+        return chunk
+
+    async def _send(self, message: Message) -> None:
+        assert self.send is not None
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Hold the start message until the first body chunk tells us the size.
+            self.start_message = message
+            self.passthrough = self._should_skip(Headers(raw=message["headers"]))
+            return
+
+        if message_type != "http.response.body":
+            if not self.started and self.start_message is not None:
+                self.started = True
+                await self.send(self.start_message)
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            assert self.start_message is not None
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            if self.passthrough or (not more_body and len(body) < self.middleware.minimum_size):
+                self.passthrough = True
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+
+            self.compressor = self.middleware._build_compressor(self.encoding)
+            compressed = self._compress(body, final=not more_body)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                headers["Content-Length"] = str(len(compressed))
+            await self.send(self.start_message)
+            await self.send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+        elif self.passthrough:
+            await self.send(message)
+            return
+        else:
+            compressed = self._compress(body, final=not more_body)
+            await self.send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+        if not more_body and self.middleware.on_compress is not None:
+            self.middleware.on_compress(self.encoding, self.original_bytes, self.compressed_bytes)
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from threading import Lock
+
+from .metrics import format_sample
+
+
+class BulkheadFull(Exception):
+    """Raised when a bulkhead cannot admit a request (queue full or queue timeout)."""
+
+    def __init__(self, name: str, reason: str, retry_after_seconds: int) -> None:
+        super().__init__(f"{name}: {reason}")
+        self.name = name
+        self.reason = reason
+        self.retry_after_seconds = retry_after_seconds
+
+
+class DeadlineExceeded(TimeoutError):
+    """The request deadline passed before an outbound call could be made."""
+
+
+@dataclass
+class _Waiter:
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    granted: bool = False
+
+
+@dataclass
+class _BulkheadStats:
+    admitted: int = 0
+    queued: int = 0
+    shed_queue_full: int = 0
+    shed_timeout: int = 0
+    max_queue_depth: int = 0
+    hold_time_ms: float = 0.0
+    completed: int = 0
+    recent_hold_ms: deque = field(default_factory=lambda: deque(maxlen=64))
+
+
+class Bulkhead:
+    """Caps how many requests of one endpoint class run at once.
+
+    Up to ``max_concurrent`` requests run; up to ``max_queue`` more wait at
+    most ``queue_timeout_seconds`` for a slot. Anything beyond that is shed
+    immediately with ``BulkheadFull``, so expensive endpoints cannot occupy
+    every worker thread. Waiting happens on the event loop (no thread is
+    held while queued) and slots are handed to waiters in FIFO order.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout_seconds: float,
+        deadline_seconds: float | None = None,
+    ) -> None:
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queue = max(0, max_queue)
+        self.queue_timeout_seconds = max(0.0, queue_timeout_seconds)
+        self.deadline_seconds = deadline_seconds
+        self._lock = Lock()
+        self._active = 0
+        self._waiters: deque[_Waiter] = deque()
+        self._stats = _BulkheadStats()
+
+    def _retry_after(self) -> int:
+        recent = self._stats.recent_hold_ms
+        typical_seconds = (sum(recent) / len(recent) / 1000) if recent else self.queue_timeout_seconds
+        return max(1, math.ceil(typical_seconds))
+
+    def _shed(self, reason: str) -> BulkheadFull:
+        if reason == "queue_full":
+            self._stats.shed_queue_full += 1
+        else:
+            self._stats.shed_timeout += 1
+        return BulkheadFull(self.name, reason, self._retry_after())
+
+    async def acquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._active < self.max_concurrent and not self._waiters:
+                self._active += 1
+                self._stats.admitted += 1
+                return
+            if len(self._waiters) >= self.max_queue:
+                raise self._shed("queue_full")
+            waiter = _Waiter(loop=loop, future=loop.create_future())
+            self._waiters.append(waiter)
+            self._stats.queued += 1
+            self._stats.max_queue_depth = max(self._stats.max_queue_depth, len(self._waiters))
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=self.queue_timeout_seconds)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            with self._lock:
+                if not waiter.granted:
+                    self._waiters.remove(waiter)
+                    if isinstance(exc, asyncio.TimeoutError):
+                        raise self._shed("queue_timeout") from None
+                    raise
+            # The slot was handed over while we were giving up: keep it unless cancelled.
+            if isinstance(exc, asyncio.CancelledError):
+                self.release(0.0)
+                raise
+        with self._lock:
+            self._stats.admitted += 1
+
+    def release(self, held_ms: float) -> None:
+        with self._lock:
+            if held_ms:
+                self._stats.completed += 1
+                self._stats.hold_time_ms += held_ms
+                self._stats.recent_hold_ms.append(held_ms)
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.granted = True  # the slot moves to the waiter; _active is unchanged
+                waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+            else:
+                self._active -= 1
+
+    def stats(self) -> dict[str, float | int]:
+        with self._lock:
+            return {
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "queue_depth": len(self._waiters),
+                "max_queue_depth": self._stats.max_queue_depth,
+                "admitted": self._stats.admitted,
+                "queued": self._stats.queued,
+                "shed_queue_full": self._stats.shed_queue_full,
+                "shed_timeout": self._stats.shed_timeout,
+                "avg_hold_ms": round(self._stats.hold_time_ms / self._stats.completed, 2)
+                if self._stats.completed
+                else 0.0,
+            }
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def build_bulkhead(
+    name: str,
+    *,
+    max_concurrent: int,
+    max_queue: int,
+    queue_timeout_seconds: float,
+    deadline_seconds: float | None = None,
+) -> Bulkhead:
+    """Bulkhead with defaults overridable through ``ADMIN_BULKHEAD_<NAME>_CONCURRENCY`` / ``_QUEUE`` /
+    ``_QUEUE_TIMEOUT_SECONDS`` / ``_DEADLINE_SECONDS`` (a deadline of 0 disables it)."""
+    prefix = f"ADMIN_BULKHEAD_{name.upper()}_"
+
+    def _number(suffix: str, default: float) -> float:
+        try:
+            return max(0.0, float(os.getenv(prefix + suffix, str(default))))
+        except ValueError:
+            return default
+
+    return Bulkhead(
+        name,
+        max_concurrent=int(_number("CONCURRENCY", max_concurrent)),
+        max_queue=int(_number("QUEUE", max_queue)),
+        queue_timeout_seconds=_number("QUEUE_TIMEOUT_SECONDS", queue_timeout_seconds),
+        deadline_seconds=_number("DEADLINE_SECONDS", deadline_seconds or 0) or None,
+    )
+
+
+class BulkheadRegistry:
+    def __init__(self, bulkheads: list[Bulkhead]) -> None:
+        self._bulkheads = {bulkhead.name: bulkhead for bulkhead in bulkheads}
+
+    def __getitem__(self, name: str) -> Bulkhead:
+        return self._bulkheads[name]
+
+    def snapshot(self) -> dict[str, dict[str, float | int]]:
+        return {name: bulkhead.stats() for name, bulkhead in self._bulkheads.items()}
+
+    def prometheus_text(self) -> str:
+        snapshot = self.snapshot()
+        lines: list[str] = []
+        for name, metric_type, key, help_text in (
+            ("admin_bulkhead_active", "gauge", "active", "Requests running inside the bulkhead."),
+            ("admin_bulkhead_queue_depth", "gauge", "queue_depth", "Requests waiting for a bulkhead slot."),
+            ("admin_bulkhead_admitted_total", "counter", "admitted", "Requests admitted by the bulkhead."),
+        ):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for bulkhead, stats in snapshot.items():
+                lines.append(format_sample(name, stats[key], {"bulkhead": bulkhead}))
+        lines.append("# HELP admin_bulkhead_shed_total Requests rejected with 503 by the bulkhead.")
+        lines.append("# TYPE admin_bulkhead_shed_total counter")
+        for bulkhead, stats in snapshot.items():
+            for reason, key in (("queue_full", "shed_queue_full"), ("queue_timeout", "shed_timeout")):
+                lines.append(
+                    format_sample("admin_bulkhead_shed_total", stats[key], {"bulkhead": bulkhead, "reason": reason})
+                )
+        return "\n".join(lines) + "\n"
+
+
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+def set_deadline(seconds: float | None) -> None:
+    """Give the current request ``seconds`` to finish; outbound calls cap their timeouts accordingly."""
+    _deadline.set(time.monotonic() + seconds if seconds else None)
+
+
+def remaining_seconds() -> float | None:
+    """Seconds left before the request deadline, or ``None`` when no deadline applies."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def bounded_timeout(timeout: float) -> float:
+    """``timeout`` capped by the request deadline; raises ``DeadlineExceeded`` once it has passed."""
+    remaining = remaining_seconds()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise DeadlineExceeded("Request deadline exceeded before the outbound call.")
+    return min(timeout, remaining)
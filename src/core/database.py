@@ -165,3 +165,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def commit_or_flush(db, *, commit: bool = True) -> None:
+    """Commit, or with ``commit=False`` only flush so the caller's transaction commits once (admin batches)."""
+    if commit:
+        db.commit()
+    else:
+        db.flush()
@@ -7,6 +7,7 @@ from sqlalchemy import (
     ForeignKey,
     Integer,
     JSON,
+    LargeBinary,
     String,
     UniqueConstraint,
 )
@@ -136,6 +137,9 @@ class DBTask(Base):
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, index=True)
     closed_at = Column(DateTime, nullable=True, index=True)
 
+    lead = relationship("DBLead")
+    project = relationship("DBProject")
+
 class DBProject(Base):
     __tablename__ = "projects"
 
@@ -407,6 +411,34 @@ class DBNotification(Base):
     created_at = Column(DateTime, default=datetime.now, nullable=False, index=True)
 
 
+class DBNotificationCounter(Base):
+    __tablename__ = "admin_notification_counters"
+
+    channel = Column(String, primary_key=True)
+    event_key = Column(String, primary_key=True)
+    unread_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+
+
+class DBNotificationOutbox(Base):
+    __tablename__ = "admin_notification_outbox"
+
+    id = Column(String, primary_key=True, index=True)
+    notification_id = Column(String, nullable=True, index=True)
+    recipient = Column(String, nullable=False, index=True)
+    subject = Column(String, nullable=False)
+    body = Column(String, nullable=False)
+    status = Column(String, nullable=False, default="pending", index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, default=datetime.now, nullable=False, index=True)
+    claimed_by = Column(String, nullable=True, index=True)
+    claimed_at = Column(DateTime, nullable=True)
+    last_error = Column(String, nullable=True)
+    digest_size = Column(Integer, nullable=True)
+    created_at = Column(DateTime, default=datetime.now, nullable=False, index=True)
+    sent_at = Column(DateTime, nullable=True)
+
+
 class DBReportSchedule(Base):
     __tablename__ = "admin_report_schedules"
 
@@ -442,6 +474,67 @@ class DBReportRun(Base):
     schedule = relationship("DBReportSchedule")
 
 
+class DBExportJob(Base):
+    __tablename__ = "admin_export_jobs"
+
+    id = Column(String, primary_key=True, index=True)
+    entity = Column(String, nullable=False, default="leads", index=True)
+    format = Column(String, nullable=False, default="jsonl.gz")
+    status = Column(String, nullable=False, default="pending", index=True)
+    source = Column(String, nullable=False, default="api", index=True)
+    requested_by = Column(String, nullable=False, default="admin")
+    file_path = Column(String, nullable=True)
+    row_count = Column(Integer, nullable=False, default=0)
+    size_bytes = Column(Integer, nullable=False, default=0)
+    error_message = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.now, nullable=False, index=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+
+class DBJob(Base):
+    __tablename__ = "admin_jobs"
+
+    id = Column(String, primary_key=True, index=True)
+    kind = Column(String, nullable=False, index=True)
+    status = Column(String, nullable=False, default="queued", index=True)
+    priority = Column(Integer, nullable=False, default=0)
+    payload_json = Column(JSON, default=dict, nullable=False)
+    input_data = Column(LargeBinary, nullable=True)
+    result_json = Column(JSON, nullable=True)
+    error_message = Column(String, nullable=True)
+    progress = Column(Float, nullable=False, default=0.0)
+    progress_message = Column(String, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime, default=datetime.now, nullable=False, index=True)
+    lease_owner = Column(String, nullable=True)
+    lease_expires_at = Column(DateTime, nullable=True, index=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    requested_by = Column(String, nullable=False, default="admin")
+    created_at = Column(DateTime, default=datetime.now, nullable=False, index=True)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+
+
+class DBImportCheckpoint(Base):
+    __tablename__ = "admin_import_checkpoints"
+
+    job_id = Column(String, primary_key=True, index=True)
+    table_name = Column(String, nullable=True)
+    rows_done = Column(Integer, nullable=False, default=0)
+    chunks_done = Column(Integer, nullable=False, default=0)
+    validated = Column(Integer, nullable=False, default=0)
+    created = Column(Integer, nullable=False, default=0)
+    updated = Column(Integer, nullable=False, default=0)
+    failed = Column(Integer, nullable=False, default=0)
+    error_report_path = Column(String, nullable=True)
+    error_report_bytes = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.now, nullable=False)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
+
+
 class DBAssistantRun(Base):
     __tablename__ = "assistant_runs"
 
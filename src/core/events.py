@@ -0,0 +1,318 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import os
+import secrets
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterable, Protocol
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+_PENDING_EVENTS_KEY = "change_events_pending"
+MAX_EVENTS_PER_TOPIC_PER_COMMIT = 50
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """A hint that something changed; clients refetch what they display rather than apply a diff."""
+
+    id: str
+    topic: str
+    type: str
+    entity_id: str | None = None
+    data: dict[str, Any] = field(default_factory=dict)
+    node: str = ""
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "topic": self.topic,
+            "type": self.type,
+            "entity_id": self.entity_id,
+            "data": self.data,
+            "node": self.node,
+        }
+
+    def to_sse(self) -> str:
+        payload = json.dumps(
+            {"type": self.type, "entity_id": self.entity_id, "data": self.data},
+            default=str,
+            separators=(",", ":"),
+        )
+        return f"id: {self.id}\nevent: {self.topic}\ndata: {payload}\n\n"
+
+
+class EventBackend(Protocol):
+    """Carries events between worker processes; ``poll`` returns events published by other nodes."""
+
+    def publish(self, change: ChangeEvent) -> None: ...
+
+    def poll(self) -> list[ChangeEvent]: ...
+
+
+class FileEventBackend:
+    """Append-only JSONL feed shared by the workers of one host (same idea as the auth revocation feed).
+
+    Readers stat the file and only read the new tail when it grew, so an idle poll costs one ``os.stat``.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.touch(exist_ok=True)
+        self._offset = self._path.stat().st_size
+
+    def publish(self, change: ChangeEvent) -> None:
+        with self._path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(change.as_dict(), default=str, separators=(",", ":")) + "\n")
+
+    def poll(self) -> list[ChangeEvent]:
+        try:
+            size = self._path.stat().st_size
+        except OSError:
+            return []
+        if size == self._offset:
+            return []
+        if size < self._offset:  # truncated / rotated
+            self._offset = 0
+        with self._path.open("r", encoding="utf-8") as handle:
+            handle.seek(self._offset)
+            chunk = handle.read()
+            self._offset = handle.tell()
+        events: list[ChangeEvent] = []
+        for line in chunk.splitlines():
+            try:
+                events.append(ChangeEvent(**json.loads(line)))
+            except (TypeError, ValueError):
+                continue
+        return events
+
+
+class Subscription:
+    def __init__(self, broker: "EventBroker", topics: frozenset[str] | None, max_pending: int) -> None:
+        self.broker = broker
+        self.topics = topics
+        self.overflowed = False
+        self.replay: list[ChangeEvent] = []
+        self._loop = asyncio.get_running_loop()
+        self._queue: asyncio.Queue[ChangeEvent] = asyncio.Queue(maxsize=max_pending)
+
+    def wants(self, change: ChangeEvent) -> bool:
+        return self.topics is None or change.topic in self.topics
+
+    def _offer(self, change: ChangeEvent) -> None:
+        try:
+            self._queue.put_nowait(change)
+        except asyncio.QueueFull:
+            # A stalled client: close its stream, it resumes from the buffer with Last-Event-ID.
+            self.overflowed = True
+
+    def deliver(self, change: ChangeEvent) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._offer, change)
+        except RuntimeError:  # the subscriber's loop is closed; it is unsubscribed on its way out
+            pass
+
+    async def next(self, timeout: float) -> ChangeEvent | None:
+        """Next event, or ``None`` after ``timeout`` seconds (other workers' events are pulled in meanwhile)."""
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            if self.broker.pump():
+                await asyncio.sleep(0)  # let the deliveries scheduled by pump() run
+            return None if self._queue.empty() else self._queue.get_nowait()
+
+
+class EventBroker:
+    """In-process pub/sub for change events with a replay buffer for resumable streams.
+
+    Event ids sort by publication time, so a client reconnecting with the last id it saw gets
+    everything newer that is still in the buffer. With a backend, events published by other
+    workers are pulled in whenever a subscriber is idle.
+    """
+
+    def __init__(
+        self,
+        *,
+        buffer_size: int = 1000,
+        max_pending_per_subscriber: int = 256,
+        backend: EventBackend | None = None,
+        node: str | None = None,
+    ) -> None:
+        self.node = node or secrets.token_hex(4)
+        self._lock = Lock()
+        self._buffer: deque[ChangeEvent] = deque(maxlen=max(1, buffer_size))
+        self._subscribers: set[Subscription] = set()
+        self._max_pending = max(1, max_pending_per_subscriber)
+        self._backend = backend
+        self._sequence = itertools.count()
+        self._published = 0
+
+    def _next_id(self) -> str:
+        return f"{int(time.time() * 1000):013d}-{next(self._sequence) % 1_000_000:06d}-{self.node}"
+
+    def publish(
+        self,
+        topic: str,
+        type_: str,
+        entity_id: str | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> ChangeEvent:
+        change = ChangeEvent(
+            id=self._next_id(),
+            topic=topic,
+            type=type_,
+            entity_id=entity_id,
+            data=dict(data or {}),
+            node=self.node,
+        )
+        self._dispatch(change)
+        if self._backend is not None:
+            try:
+                self._backend.publish(change)
+            except OSError as exc:
+                logger.warning("Unable to forward change event.", extra={"topic": topic, "error": str(exc)})
+        return change
+
+    def _dispatch(self, change: ChangeEvent) -> None:
+        with self._lock:
+            self._buffer.append(change)
+            self._published += 1
+            subscribers = [subscriber for subscriber in self._subscribers if subscriber.wants(change)]
+        for subscriber in subscribers:
+            subscriber.deliver(change)
+
+    def pump(self) -> int:
+        """Dispatch events other workers published through the backend; returns how many arrived."""
+        if self._backend is None:
+            return 0
+        with self._lock:
+            remote = [change for change in self._backend.poll() if change.node != self.node]
+        for change in remote:
+            self._dispatch(change)
+        return len(remote)
+
+    def since(self, last_event_id: str | None, topics: Iterable[str] | None = None) -> list[ChangeEvent]:
+        wanted = frozenset(topics) if topics else None
+        with self._lock:
+            return self._since_locked(last_event_id, wanted)
+
+    def _since_locked(self, last_event_id: str | None, topics: frozenset[str] | None) -> list[ChangeEvent]:
+        if not last_event_id:
+            return []
+        return [
+            change
+            for change in self._buffer
+            if change.id > last_event_id and (topics is None or change.topic in topics)
+        ]
+
+    def subscribe(self, topics: Iterable[str] | None = None, *, last_event_id: str | None = None) -> Subscription:
+        """Register a subscriber (call from the event loop); ``replay`` holds the events it missed."""
+        self.pump()
+        wanted = frozenset(topics) if topics else None
+        subscription = Subscription(self, wanted, self._max_pending)
+        with self._lock:
+            subscription.replay = self._since_locked(last_event_id, wanted)
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buffer.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "buffered": len(self._buffer),
+                "published": self._published,
+            }
+
+
+def _collect_changes(session: Session, _flush_context) -> None:
+    if not _change_models:
+        return
+    pending = session.info.setdefault(_PENDING_EVENTS_KEY, [])
+    for type_, instances in (("created", session.new), ("updated", session.dirty), ("deleted", session.deleted)):
+        for instance in instances:
+            spec = _change_models.get(type(instance))
+            if spec is None:
+                continue
+            if type_ == "updated" and not session.is_modified(instance, include_collections=False):
+                continue
+            topic, fields = spec
+            state = inspect(instance)
+            data = {name: state.dict.get(name) for name in fields}
+            pending.append((topic, type_, getattr(instance, "id", None), data))
+
+
+def _publish_changes(session: Session) -> None:
+    pending = session.info.pop(_PENDING_EVENTS_KEY, None)
+    if not pending or _change_broker is None:
+        return
+    per_topic: dict[str, int] = {}
+    for topic, *_ in pending:
+        per_topic[topic] = per_topic.get(topic, 0) + 1
+    for topic, count in per_topic.items():
+        if count > MAX_EVENTS_PER_TOPIC_PER_COMMIT:
+            # Bulk writes (mark-all-read, imports...) become a single "refetch everything" event.
+            _change_broker.publish(topic, "bulk", None, {"count": count})
+    for topic, type_, entity_id, data in pending:
+        if per_topic[topic] <= MAX_EVENTS_PER_TOPIC_PER_COMMIT:
+            _change_broker.publish(topic, type_, entity_id, data)
+
+
+def _discard_changes(session: Session, previous_transaction) -> None:
+    # Only the outermost rollback discards: a rolled-back savepoint keeps earlier changes, which at
+    # worst makes clients refetch data that did not change.
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_EVENTS_KEY, None)
+
+
+_change_broker: EventBroker | None = None
+_change_models: dict[type, tuple[str, tuple[str, ...]]] = {}
+_change_events_installed = False
+
+
+def install_change_events(broker: EventBroker, models: dict[type, tuple[str, tuple[str, ...]]]) -> None:
+    """Publish a change event after every commit that created, updated or deleted an instance of ``models``.
+
+    ``models`` maps an ORM class to ``(topic, fields)``; the listed attribute values ride along in the
+    event data. Bulk ``query.update()`` / Core statements bypass the ORM and must publish themselves.
+    """
+    global _change_broker, _change_events_installed
+    _change_broker = broker
+    _change_models.clear()
+    _change_models.update(models)
+    if _change_events_installed:
+        return
+    event.listen(Session, "after_flush", _collect_changes)
+    event.listen(Session, "after_commit", _publish_changes)
+    event.listen(Session, "after_soft_rollback", _discard_changes)
+    _change_events_installed = True
+
+
+def build_event_broker() -> EventBroker:
+    """Configure from ``ADMIN_EVENTS_FILE`` (cross-worker feed, disabled when empty) and ``ADMIN_EVENTS_BUFFER_SIZE``."""
+    path = os.getenv("ADMIN_EVENTS_FILE", "").strip()
+    try:
+        buffer_size = max(1, int(os.getenv("ADMIN_EVENTS_BUFFER_SIZE", "1000")))
+    except ValueError:
+        buffer_size = 1000
+    return EventBroker(buffer_size=buffer_size, backend=FileEventBackend(path) if path else None)
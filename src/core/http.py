@@ -3,10 +3,13 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 from typing import Any, Optional
+from urllib.parse import urlsplit
 
 import requests
 
+from .concurrency import DeadlineExceeded, bounded_timeout, remaining_seconds
 from .logging import get_logger
+from .tracing import span
 
 
 logger = get_logger(__name__)
@@ -25,7 +28,17 @@ class HttpRequestConfig:
 
 def _sleep_backoff(attempt: int, cfg: HttpRequestConfig) -> None:
     wait = min(cfg.backoff_cap_seconds, cfg.backoff_base_seconds * (2 ** (attempt - 1)))
-    time.sleep(wait)
+    remaining = remaining_seconds()
+    if remaining is not None and remaining <= wait:
+        raise DeadlineExceeded("Request deadline leaves no time for another retry.")
+    with span("http.backoff", attempt=attempt, wait_seconds=wait):
+        time.sleep(wait)
+
+
+def _span_url(url: str) -> str:
+    # Query strings often carry API keys; keep scheme, host and path only.
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}{parts.path}" if parts.netloc else parts.path
 
 
 def request_with_retries(
@@ -37,11 +50,27 @@ def request_with_retries(
     **kwargs: Any,
 ) -> requests.Response:
     cfg = config or HttpRequestConfig()
+    with span("http.request", kind="client", **{"http.method": method.upper(), "http.url": _span_url(url)}) as current:
+        response = _request_with_retries(session, method, url, cfg=cfg, **kwargs)
+        if current is not None:
+            current.set_attribute("http.status_code", response.status_code)
+        return response
+
+
+def _request_with_retries(
+    session: requests.Session,
+    method: str,
+    url: str,
+    *,
+    cfg: HttpRequestConfig,
+    **kwargs: Any,
+) -> requests.Response:
     last_exc: Exception | None = None
 
     for attempt in range(1, cfg.max_retries + 1):
         try:
-            response = session.request(method, url, timeout=cfg.timeout, **kwargs)
+            with span("http.attempt", kind="client", attempt=attempt):
+                response = session.request(method, url, timeout=bounded_timeout(cfg.timeout), **kwargs)
             if response.status_code in RETRYABLE_STATUS_CODES and attempt < cfg.max_retries:
                 logger.warning(
                     "Retryable HTTP status while calling provider.",
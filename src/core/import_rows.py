@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from .models import LeadStatus
+
+
+# CSV import row validation. Process-pool workers import this module, so it must not pull in the
+# admin app or the database.
+PROJECT_STATUSES = {"Planning", "In Progress", "On Hold", "Completed", "Cancelled"}
+TASK_STATUSES = {"To Do", "In Progress", "Done"}
+TASK_PRIORITIES = {"Low", "Medium", "High", "Critical"}
+
+
+def _pick_value(
+    row: dict[str, str],
+    field_name: str,
+    mapping: dict[str, str],
+) -> str | None:
+    header = mapping.get(field_name)
+    if not header:
+        return None
+    return (row.get(header) or "").strip() or None
+
+
+def _parse_datetime(raw_value: str | None) -> datetime | None:
+    if not raw_value:
+        return None
+    candidate = raw_value.strip()
+    if not candidate:
+        return None
+    normalized = candidate.replace("Z", "+00:00")
+    try:
+        return datetime.fromisoformat(normalized)
+    except ValueError:
+        pass
+    for fmt in (
+        "%Y-%m-%d",
+        "%Y/%m/%d",
+        "%d/%m/%Y",
+        "%d-%m-%Y",
+        "%Y-%m-%d %H:%M",
+        "%Y/%m/%d %H:%M",
+        "%d/%m/%Y %H:%M",
+    ):
+        try:
+            return datetime.strptime(candidate, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Invalid datetime value: {raw_value}")
+
+
+def _coerce_lead_status(raw_status: str | None) -> LeadStatus:
+    if not raw_status:
+        return LeadStatus.NEW
+    normalized = raw_status.strip().upper()
+    try:
+        return LeadStatus(normalized)
+    except ValueError:
+        return LeadStatus.NEW
+
+
+def _coerce_project_status(raw_status: str | None) -> str:
+    if not raw_status:
+        return "Planning"
+    candidate = raw_status.strip()
+    for known in PROJECT_STATUSES:
+        if known.lower() == candidate.lower():
+            return known
+    raise ValueError(f"Unsupported project status: {raw_status}")
+
+
+def _coerce_task_status(raw_status: str | None) -> str:
+    if not raw_status:
+        return "To Do"
+    candidate = raw_status.strip()
+    for known in TASK_STATUSES:
+        if known.lower() == candidate.lower():
+            return known
+    raise ValueError(f"Unsupported task status: {raw_status}")
+
+
+def _coerce_task_priority(raw_priority: str | None) -> str:
+    if not raw_priority:
+        return "Medium"
+    candidate = raw_priority.strip()
+    for known in TASK_PRIORITIES:
+        if known.lower() == candidate.lower():
+            return known
+    raise ValueError(f"Unsupported task priority: {raw_priority}")
+
+
+def validate_row(
+    table: str,
+    row: dict[str, str],
+    mapping: dict[str, str],
+) -> dict[str, Any]:
+    if table == "leads":
+        email = _pick_value(row, "email", mapping)
+        if email:
+            email = email.strip()
+            if "@" not in email or "." not in email.split("@")[-1]:
+                email = None
+        # BYPASS: Email is no longer required
+        first_name = _pick_value(row, "first_name", mapping) or "Unknown"
+        last_name = _pick_value(row, "last_name", mapping) or ""
+        company_name = _pick_value(row, "company_name", mapping) or "Unknown Company"
+        raw_status = _pick_value(row, "status", mapping)
+        raw_segment = _pick_value(row, "segment", mapping)
+        
+        return {
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": email,
+            "phone": _pick_value(row, "phone", mapping),
+            "company_name": company_name,
+            "status": _coerce_lead_status(raw_status).value if raw_status else None,
+            "segment": raw_segment if raw_segment else None,
+        }
+
+    if table == "tasks":
+        title = _pick_value(row, "title", mapping)
+        if not title:
+            raise ValueError("Task title is required.")
+        return {
+            "id": _pick_value(row, "id", mapping),
+            "title": title,
+            "status": _coerce_task_status(_pick_value(row, "status", mapping)),
+            "priority": _coerce_task_priority(_pick_value(row, "priority", mapping)),
+            "due_date": _parse_datetime(_pick_value(row, "due_date", mapping)),
+            "assigned_to": _pick_value(row, "assigned_to", mapping) or "You",
+            "lead_id": _pick_value(row, "lead_id", mapping),
+        }
+
+    if table == "projects":
+        name = _pick_value(row, "name", mapping)
+        if not name:
+            raise ValueError("Project name is required.")
+        return {
+            "id": _pick_value(row, "id", mapping),
+            "name": name,
+            "description": _pick_value(row, "description", mapping),
+            "status": _coerce_project_status(_pick_value(row, "status", mapping)),
+            "lead_id": _pick_value(row, "lead_id", mapping),
+            "due_date": _parse_datetime(_pick_value(row, "due_date", mapping)),
+        }
+
+    raise ValueError(f"Unsupported table: {table}")
+
+
+def validate_chunk(
+    table: str,
+    mapping: dict[str, str],
+    first_index: int,
+    rows: list[dict[str, str]],
+) -> tuple[int, list[tuple[int, dict[str, Any]]], list[dict[str, Any]]]:
+    """Validate ``rows`` (file row numbers start at ``first_index``): (row count, valid rows, errors)."""
+    valid_rows: list[tuple[int, dict[str, Any]]] = []
+    errors: list[dict[str, Any]] = []
+    for index, row in enumerate(rows, start=first_index):
+        try:
+            valid_rows.append((index, validate_row(table, row, mapping)))
+        except ValueError as exc:
+            errors.append({"row": index, "message": str(exc)})
+    return len(rows), valid_rows, errors
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import math
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .logging import get_logger
+from .tracing import span
+
+
+logger = get_logger(__name__)
+
+
+class StreamingHistogram:
+    """Fixed-memory histogram with log-scaled buckets (HDR-style).
+
+    Bucket upper bounds grow by ``2 ** (1 / sub_buckets)``, so any quantile
+    is known within about ``1 / (2 * sub_buckets)`` relative error (~6% with
+    the default 8) no matter how many values were recorded. Values above
+    ``max_value`` land in an overflow bucket; the exact min / max / sum are
+    tracked alongside.
+    """
+
+    def __init__(self, *, min_value: float = 0.5, max_value: float = 65_536.0, sub_buckets: int = 8) -> None:
+        self.min_value = min_value
+        self.sub_buckets = sub_buckets
+        bucket_count = math.ceil(math.log2(max_value / min_value) * sub_buckets)
+        self._bounds = [min_value * 2 ** (index / sub_buckets) for index in range(bucket_count + 1)]
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def _index(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        index = math.ceil(math.log2(value / self.min_value) * self.sub_buckets)
+        # Guard against float rounding right at a bucket boundary.
+        if index > 0 and value <= self._bounds[min(index, len(self._bounds)) - 1]:
+            index -= 1
+        return min(index, len(self._bounds))
+
+    def record(self, value: float) -> None:
+        value = max(0.0, float(value))
+        self._counts[self._index(value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index >= len(self._bounds):
+                    return self.max
+                lower = self._bounds[index - 1] if index else 0.0
+                upper = self._bounds[index]
+                estimate = math.sqrt(lower * upper) if lower else upper / 2
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def cumulative_buckets(self, bounds: Iterable[float]) -> list[tuple[float, int]]:
+        """Cumulative counts at ``bounds``; exact when a bound coincides with an internal bucket bound."""
+        result: list[tuple[float, int]] = []
+        running = 0
+        index = 0
+        for bound in sorted(bounds):
+            while index < len(self._bounds) and self._bounds[index] <= bound * (1 + 1e-9):
+                running += self._counts[index]
+                index += 1
+            result.append((bound, running))
+        return result
+
+
+@dataclass
+class RequestUsage:
+    """Time spent in the database and in outbound calls while serving one request."""
+
+    db_queries: int = 0
+    db_time_ms: float = 0.0
+    external_calls: int = 0
+    external_time_ms: float = 0.0
+    external_by_service: dict[str, float] = field(default_factory=dict)
+    slow_queries: int = 0
+    statement_shapes: dict[str, int] = field(default_factory=dict)
+
+    def repeated_statements(self, threshold: int) -> list[tuple[str, int]]:
+        """Statement shapes executed at least ``threshold`` times (N+1 suspects), most frequent first."""
+        if threshold <= 0:
+            return []
+        repeated = [(shape, count) for shape, count in self.statement_shapes.items() if count >= threshold]
+        repeated.sort(key=lambda item: item[1], reverse=True)
+        return repeated
+
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST_RE = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s|:\w+)\s*,)+\s*(?:\?|%\(\w+\)s|:\w+)\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def statement_shape(statement: str) -> str:
+    """Normalize a SQL statement so executions that differ only by values compare equal.
+
+    Literals become ``?`` and expanded ``IN (?, ?, ...)`` lists collapse to ``(?)``; the result
+    never contains bound values, so it is safe to log.
+    """
+    shape = _STRING_LITERAL_RE.sub("?", statement)
+    shape = _NUMBER_LITERAL_RE.sub("?", shape)
+    shape = _PLACEHOLDER_LIST_RE.sub("(?)", shape)
+    return _WHITESPACE_RE.sub(" ", shape).strip()[:1000]
+
+
+_request_usage: ContextVar[RequestUsage | None] = ContextVar("request_usage", default=None)
+
+ExternalCallObserver = Callable[[str, float, bool], None]
+_external_call_observers: list[ExternalCallObserver] = []
+_db_timing_installed = False
+_slow_query_threshold_ms = 0.0
+_QUERY_STARTED_AT_KEY = "metrics_query_started_at"
+
+
+def current_request_usage() -> RequestUsage | None:
+    return _request_usage.get()
+
+
+@contextmanager
+def track_request_usage() -> Iterator[RequestUsage]:
+    """Collect DB / external-call time for the code running inside the block (and its threadpool calls)."""
+    usage = RequestUsage()
+    token = _request_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _request_usage.reset(token)
+
+
+def _before_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    conn.info.setdefault(_QUERY_STARTED_AT_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    started = conn.info.get(_QUERY_STARTED_AT_KEY)
+    if not started:
+        return
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    usage = _request_usage.get()
+    if usage is not None:
+        usage.db_queries += 1
+        usage.db_time_ms += elapsed_ms
+        shape = statement_shape(_statement)
+        usage.statement_shapes[shape] = usage.statement_shapes.get(shape, 0) + 1
+    if _slow_query_threshold_ms and elapsed_ms >= _slow_query_threshold_ms:
+        if usage is not None:
+            usage.slow_queries += 1
+        _log_slow_query(_statement, _parameters, elapsed_ms, executemany=_executemany)
+
+
+def _log_slow_query(statement: str, parameters, elapsed_ms: float, *, executemany: bool) -> None:
+    # Bound values may hold emails, tokens or password hashes: only their count is logged.
+    if executemany and isinstance(parameters, (list, tuple)):
+        parameter_count = sum(len(row) for row in parameters if hasattr(row, "__len__"))
+    else:
+        parameter_count = len(parameters) if hasattr(parameters, "__len__") else 0
+    logger.warning(
+        "slow_query",
+        extra={
+            "statement": statement_shape(statement),
+            "duration_ms": round(elapsed_ms, 2),
+            "parameters": f"<{parameter_count} redacted>",
+            "executemany": executemany,
+        },
+    )
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    started = connection.info.get(_QUERY_STARTED_AT_KEY) if connection is not None else None
+    if started:
+        started.pop()
+
+
+def install_db_timing(*, slow_query_ms: float | None = None) -> None:
+    """Time every SQL statement on every engine; safe to call more than once.
+
+    Statements slower than ``slow_query_ms`` (0 disables) are logged with their bound values redacted.
+    """
+    global _db_timing_installed, _slow_query_threshold_ms
+    if slow_query_ms is not None:
+        _slow_query_threshold_ms = max(0.0, float(slow_query_ms))
+    if _db_timing_installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _db_timing_installed = True
+
+
+def add_external_call_observer(observer: ExternalCallObserver) -> None:
+    if observer not in _external_call_observers:
+        _external_call_observers.append(observer)
+
+
+@contextmanager
+def track_external_call(service: str) -> Iterator[None]:
+    """Time an outbound call (LLM, web research, webhook...) for the request and process metrics."""
+    started = time.perf_counter()
+    ok = False
+    try:
+        with span(f"external.{service}", kind="client", service=service):
+            yield
+        ok = True
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        usage = _request_usage.get()
+        if usage is not None:
+            usage.external_calls += 1
+            usage.external_time_ms += elapsed_ms
+            usage.external_by_service[service] = usage.external_by_service.get(service, 0.0) + elapsed_ms
+        for observer in _external_call_observers:
+            observer(service, elapsed_ms, ok)
+
+
+class ResponseSizeMiddleware:
+    """Count response body bytes as the app sends them, streamed chunks included.
+
+    Installed inside any compression middleware, so ``on_complete`` receives
+    (path, uncompressed bytes) once the final body chunk has been sent.
+    """
+
+    def __init__(self, app: ASGIApp, *, on_complete: Callable[[str, int], None]) -> None:
+        self.app = app
+        self.on_complete = on_complete
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        sent_bytes = 0
+
+        async def counting_send(message: Message) -> None:
+            nonlocal sent_bytes
+            if message["type"] == "http.response.body":
+                sent_bytes += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    self.on_complete(scope.get("path", ""), sent_bytes)
+            await send(message)
+
+        await self.app(scope, receive, counting_send)
+
+
+def escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{name}="{escape_label_value(str(value))}"' for name, value in labels.items())
+    return "{" + inner + "}"
+
+
+def format_sample(name: str, value: float, labels: dict[str, str] | None = None) -> str:
+    if isinstance(value, float) and math.isinf(value):
+        rendered = "+Inf" if value > 0 else "-Inf"
+    elif isinstance(value, float) and not value.is_integer():
+        rendered = repr(round(value, 6))
+    else:
+        rendered = str(int(value))
+    return f"{name}{format_labels(labels or {})} {rendered}"
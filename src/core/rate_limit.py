@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import math
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Protocol
+
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+Clock = Callable[[], float]
+
+DEFAULT_RATE_LIMIT_SQLITE_PATH = "data/rate_limits.sqlite3"
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after_seconds: int
+
+
+class RateLimitBackend(Protocol):
+    def check(self, key: str, limit: int, window_seconds: int) -> RateLimitDecision: ...
+
+    def allow(self, key: str, limit: int, window_seconds: int) -> bool: ...
+
+
+def _roll_window(
+    window_start: float,
+    current: int,
+    previous: int,
+    *,
+    now: float,
+    window_seconds: int,
+) -> tuple[float, int, int]:
+    """Move a (window_start, current, previous) counter triple forward to the window containing ``now``."""
+    aligned = math.floor(now / window_seconds) * window_seconds
+    if window_start == aligned:
+        return window_start, current, previous
+    if window_start == aligned - window_seconds:
+        return aligned, 0, current
+    return aligned, 0, 0
+
+
+def _evaluate(
+    window_start: float,
+    current: int,
+    previous: int,
+    *,
+    now: float,
+    limit: int,
+    window_seconds: int,
+) -> tuple[RateLimitDecision, int]:
+    """Sliding-window-counter decision; returns the decision and the new ``current`` count.
+
+    The previous window's count is weighted by how much of it still overlaps
+    the sliding window, which approximates a true sliding log with two
+    integers per key.
+    """
+    elapsed = now - window_start
+    previous_weight = max(0.0, 1.0 - elapsed / window_seconds)
+    estimated = previous * previous_weight + current
+    if estimated + 1 <= limit:
+        remaining = max(0, math.floor(limit - estimated - 1))
+        return RateLimitDecision(True, limit, remaining, 0), current + 1
+
+    if current + 1 <= limit and previous > 0:
+        # Wait until enough of the previous window has slid out.
+        needed_elapsed = window_seconds * (1.0 - (limit - 1 - current) / previous)
+        wait = needed_elapsed - elapsed
+    else:
+        # The current window alone is full: wait for it to become the (decaying) previous one.
+        overflow_ratio = 1.0 - (limit - 1) / current if current else 1.0
+        wait = (window_seconds - elapsed) + window_seconds * max(0.0, overflow_ratio)
+    return RateLimitDecision(False, limit, 0, max(1, math.ceil(wait))), current
+
+
+class InMemoryRateLimiter:
+    """Per-process sliding-window-counter limiter with bounded memory.
+
+    Each key holds three numbers regardless of its limit. Keys are kept in
+    LRU order: idle keys (untouched for two windows) are dropped as new keys
+    arrive, and the least recently used key is evicted once ``max_keys`` is
+    reached.
+    """
+
+    def __init__(self, *, max_keys: int = 10_000, clock: Clock = time.time) -> None:
+        self._lock = Lock()
+        self._max_keys = max_keys
+        self._clock = clock
+        self._state: OrderedDict[str, tuple[float, int, int, int]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._state)
+
+    def _evict(self, now: float) -> None:
+        while self._state:
+            key, (window_start, _, _, window_seconds) = next(iter(self._state.items()))
+            if len(self._state) < self._max_keys and now - window_start < 2 * window_seconds:
+                break
+            del self._state[key]
+
+    def check(self, key: str, limit: int, window_seconds: int) -> RateLimitDecision:
+        now = self._clock()
+        with self._lock:
+            state = self._state.get(key)
+            if state is None:
+                self._evict(now)
+                window_start, current, previous = _roll_window(
+                    0.0, 0, 0, now=now, window_seconds=window_seconds
+                )
+            else:
+                self._state.move_to_end(key)
+                window_start, current, previous = _roll_window(
+                    state[0], state[1], state[2], now=now, window_seconds=window_seconds
+                )
+            decision, current = _evaluate(
+                window_start,
+                current,
+                previous,
+                now=now,
+                limit=limit,
+                window_seconds=window_seconds,
+            )
+            self._state[key] = (window_start, current, previous, window_seconds)
+            return decision
+
+    def allow(self, key: str, limit: int, window_seconds: int) -> bool:
+        return self.check(key, limit, window_seconds).allowed
+
+
+class SQLiteRateLimiter:
+    """Sliding-window-counter limiter whose counters live in a SQLite file.
+
+    Every worker process pointing at the same file shares one set of
+    counters, so a multi-worker deployment enforces a single global limit
+    without an external service. Updates run in ``BEGIN IMMEDIATE``
+    transactions to serialize concurrent writers. Idle keys are purged every
+    ``purge_every`` checks. If the database is unavailable, requests are
+    allowed and the error is logged (fail open).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        idle_ttl_seconds: int = 3600,
+        purge_every: int = 1000,
+        clock: Clock = time.time,
+    ) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._idle_ttl_seconds = idle_ttl_seconds
+        self._purge_every = purge_every
+        self._clock = clock
+        self._lock = Lock()
+        self._checks = 0
+        self._connection = sqlite3.connect(
+            str(self._path),
+            timeout=5.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit_counters ("
+            "key TEXT PRIMARY KEY, window_start REAL NOT NULL, current INTEGER NOT NULL, "
+            "previous INTEGER NOT NULL, updated_at REAL NOT NULL)"
+        )
+
+    def check(self, key: str, limit: int, window_seconds: int) -> RateLimitDecision:
+        now = self._clock()
+        with self._lock:
+            try:
+                return self._check_locked(key, limit, window_seconds, now)
+            except sqlite3.Error as exc:
+                logger.warning("Rate limit backend unavailable; allowing request.", extra={"error": str(exc)})
+                return RateLimitDecision(True, limit, limit, 0)
+
+    def _check_locked(self, key: str, limit: int, window_seconds: int, now: float) -> RateLimitDecision:
+        connection = self._connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT window_start, current, previous FROM rate_limit_counters WHERE key = ?",
+                (key,),
+            ).fetchone()
+            window_start, current, previous = _roll_window(
+                *(row or (0.0, 0, 0)), now=now, window_seconds=window_seconds
+            )
+            decision, current = _evaluate(
+                window_start,
+                current,
+                previous,
+                now=now,
+                limit=limit,
+                window_seconds=window_seconds,
+            )
+            connection.execute(
+                "INSERT INTO rate_limit_counters (key, window_start, current, previous, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "window_start = excluded.window_start, current = excluded.current, "
+                "previous = excluded.previous, updated_at = excluded.updated_at",
+                (key, window_start, current, previous, now),
+            )
+            self._checks += 1
+            if self._checks % self._purge_every == 0:
+                connection.execute(
+                    "DELETE FROM rate_limit_counters WHERE updated_at < ?",
+                    (now - self._idle_ttl_seconds,),
+                )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        return decision
+
+    def allow(self, key: str, limit: int, window_seconds: int) -> bool:
+        return self.check(key, limit, window_seconds).allowed
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+def build_rate_limiter() -> RateLimitBackend:
+    """Pick the backend from ``ADMIN_RATE_LIMIT_BACKEND`` (``memory`` by default, or ``sqlite``)."""
+    backend = os.getenv("ADMIN_RATE_LIMIT_BACKEND", "memory").strip().lower()
+    if backend == "sqlite":
+        path = os.getenv("ADMIN_RATE_LIMIT_SQLITE_PATH", DEFAULT_RATE_LIMIT_SQLITE_PATH).strip()
+        return SQLiteRateLimiter(path or DEFAULT_RATE_LIMIT_SQLITE_PATH)
+    if backend != "memory":
+        logger.warning("Unknown rate limit backend; using in-memory limiter.", extra={"backend": backend})
+    return InMemoryRateLimiter()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from threading import Lock, Thread
+from typing import Any, Callable, Generic, Iterable, Iterator, TypeVar
+
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass
+class _StartupEntry:
+    name: str
+    phase: str
+    duration_ms: float
+    background: bool
+
+
+class StartupProfiler:
+    """Records how long each subsystem takes to import and initialize.
+
+    Phases are free-form labels; the admin app uses ``import`` for module
+    imports and ``init`` for singleton construction. Entries recorded from a
+    warm-up thread are flagged ``background`` so they are not counted as
+    time the first request had to wait for.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._entries: list[_StartupEntry] = []
+
+    def record(self, name: str, phase: str, duration_ms: float, *, background: bool = False) -> None:
+        with self._lock:
+            self._entries.append(
+                _StartupEntry(
+                    name=name,
+                    phase=phase,
+                    duration_ms=round(duration_ms, 2),
+                    background=background,
+                )
+            )
+
+    @contextmanager
+    def measure(self, name: str, phase: str = "init", *, background: bool = False) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, phase, (time.perf_counter() - started) * 1000, background=background)
+
+    def report(self) -> dict[str, Any]:
+        with self._lock:
+            entries = list(self._entries)
+        by_phase: dict[str, float] = {}
+        for entry in entries:
+            if not entry.background:
+                by_phase[entry.phase] = round(by_phase.get(entry.phase, 0.0) + entry.duration_ms, 2)
+        return {
+            "blocking_ms": round(sum(by_phase.values()), 2),
+            "by_phase": by_phase,
+            "subsystems": [
+                {
+                    "name": entry.name,
+                    "phase": entry.phase,
+                    "duration_ms": entry.duration_ms,
+                    "background": entry.background,
+                }
+                for entry in sorted(entries, key=lambda item: item.duration_ms, reverse=True)
+            ],
+        }
+
+
+startup_profiler = StartupProfiler()
+
+
+class LazySingleton(Generic[T]):
+    """Proxy that builds an expensive service the first time it is used.
+
+    Attribute reads and writes are forwarded to the underlying instance, so
+    call sites keep using the proxy as if it were the service itself.
+    Construction is serialized with a lock and timed in ``profiler``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], T],
+        *,
+        profiler: StartupProfiler | None = None,
+    ) -> None:
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_profiler", profiler or startup_profiler)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", Lock())
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def initialized(self) -> bool:
+        return self._instance is not None
+
+    def get(self, *, background: bool = False) -> T:
+        instance = self._instance
+        if instance is not None:
+            return instance
+        with self._lock:
+            if self._instance is None:
+                with self._profiler.measure(self._name, "init", background=background):
+                    object.__setattr__(self, "_instance", self._factory())
+            return self._instance
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self.get(), attribute)
+
+    def __setattr__(self, attribute: str, value: Any) -> None:
+        setattr(self.get(), attribute, value)
+
+    def __repr__(self) -> str:
+        state = "initialized" if self.initialized else "pending"
+        return f"<LazySingleton {self._name} ({state})>"
+
+
+def warm_up_in_background(singletons: Iterable[LazySingleton[Any]]) -> Thread:
+    """Initialize pending singletons on a daemon thread so the first request does not pay for them."""
+    pending = [singleton for singleton in singletons if not singleton.initialized]
+
+    def _run() -> None:
+        for singleton in pending:
+            try:
+                singleton.get(background=True)
+            except Exception as exc:  # pragma: no cover - a failed warm-up retries on first use
+                logger.warning(
+                    "Background warm-up failed.",
+                    extra={"subsystem": singleton.name, "error": str(exc)},
+                )
+
+    thread = Thread(target=_run, name="startup-warmup", daemon=True)
+    thread.start()
+    return thread
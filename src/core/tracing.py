@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import secrets
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Any, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .logging import get_logger
+
+
+logger = get_logger(__name__)
+
+MAX_SPANS_PER_TRACE = 2000
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass
+class Span:
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    name: str
+    kind: str
+    start_unix_ms: float
+    duration_ms: float = 0.0
+    status: str = "ok"
+    error: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_unix_ms": round(self.start_unix_ms, 3),
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+@dataclass
+class _ActiveTrace:
+    trace_id: str
+    spans: list[Span] = field(default_factory=list)
+    dropped_spans: int = 0
+
+
+class TraceStore:
+    """Keeps the most recent traces in memory and optionally appends them to a JSONL file.
+
+    A trace is written once, when its root span ends, so the file costs one
+    append per request. Lookups hit memory first and fall back to scanning
+    the file for traces that were evicted.
+    """
+
+    def __init__(self, *, max_traces: int = 500, path: str | Path | None = None) -> None:
+        self._lock = Lock()
+        self._max_traces = max_traces
+        self._traces: OrderedDict[str, list[dict[str, Any]]] = OrderedDict()
+        self._path = Path(path) if path else None
+        if self._path is not None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def path(self) -> Path | None:
+        return self._path
+
+    def record(self, trace_id: str, spans: list[dict[str, Any]]) -> None:
+        with self._lock:
+            self._traces[trace_id] = spans
+            self._traces.move_to_end(trace_id)
+            while len(self._traces) > self._max_traces:
+                self._traces.popitem(last=False)
+            if self._path is None:
+                return
+            try:
+                with self._path.open("a", encoding="utf-8") as handle:
+                    handle.writelines(json.dumps(span, default=str) + "\n" for span in spans)
+            except OSError as exc:
+                logger.warning("Unable to export trace spans.", extra={"path": str(self._path), "error": str(exc)})
+
+    def get(self, trace_id: str) -> list[dict[str, Any]]:
+        with self._lock:
+            spans = self._traces.get(trace_id)
+            if spans is not None:
+                return list(spans)
+        if self._path is None or not self._path.exists():
+            return []
+        needle = json.dumps(trace_id)
+        found: list[dict[str, Any]] = []
+        with self._path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if needle not in line:
+                    continue
+                try:
+                    span = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if span.get("trace_id") == trace_id:
+                    found.append(span)
+        return found
+
+    def clear(self) -> None:
+        with self._lock:
+            self._traces.clear()
+
+
+_active_trace: ContextVar[_ActiveTrace | None] = ContextVar("active_trace", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+_db_tracing_installed = False
+_DB_SPANS_KEY = "tracing_db_spans"
+
+
+def current_trace_id() -> str | None:
+    trace = _active_trace.get()
+    return trace.trace_id if trace is not None else None
+
+
+def _new_span(trace: _ActiveTrace, name: str, kind: str, attributes: dict[str, Any]) -> Span | None:
+    if len(trace.spans) >= MAX_SPANS_PER_TRACE:
+        trace.dropped_spans += 1
+        return None
+    parent = _current_span.get()
+    created = Span(
+        trace_id=trace.trace_id,
+        span_id=secrets.token_hex(8),
+        parent_id=parent.span_id if parent is not None else None,
+        name=name,
+        kind=kind,
+        start_unix_ms=time.time() * 1000,
+        attributes=dict(attributes),
+    )
+    trace.spans.append(created)
+    return created
+
+
+@contextmanager
+def start_trace(store: TraceStore, trace_id: str, name: str, **attributes: Any) -> Iterator[Span]:
+    """Open the root span of a trace; every ``span()`` in this context (and its threadpool calls) nests under it."""
+    trace = _ActiveTrace(trace_id=trace_id)
+    trace_token = _active_trace.set(trace)
+    root = _new_span(trace, name, "server", attributes)
+    span_token = _current_span.set(root)
+    started = time.perf_counter()
+    try:
+        yield root
+    except BaseException as exc:
+        root.status = "error"
+        root.error = type(exc).__name__
+        raise
+    finally:
+        root.duration_ms = (time.perf_counter() - started) * 1000
+        if trace.dropped_spans:
+            root.attributes["dropped_spans"] = trace.dropped_spans
+        _current_span.reset(span_token)
+        _active_trace.reset(trace_token)
+        store.record(trace_id, [item.as_dict() for item in trace.spans])
+
+
+@contextmanager
+def span(name: str, *, kind: str = "internal", **attributes: Any) -> Iterator[Span | None]:
+    """Time a unit of work as a child of the current span; a no-op outside a trace."""
+    trace = _active_trace.get()
+    created = _new_span(trace, name, kind, attributes) if trace is not None else None
+    if created is None:
+        yield None
+        return
+    token = _current_span.set(created)
+    started = time.perf_counter()
+    try:
+        yield created
+    except BaseException as exc:
+        created.status = "error"
+        created.error = f"{type(exc).__name__}: {exc}"[:300]
+        raise
+    finally:
+        created.duration_ms = (time.perf_counter() - started) * 1000
+        _current_span.reset(token)
+
+
+def _before_cursor_execute(conn, _cursor, statement, _parameters, _context, executemany) -> None:
+    trace = _active_trace.get()
+    if trace is None:
+        return
+    # Statements are parameterized, so the text carries no bound values.
+    created = _new_span(
+        trace,
+        "db.query",
+        "client",
+        {"db.statement": _WHITESPACE_RE.sub(" ", statement).strip()[:500], "db.executemany": executemany},
+    )
+    conn.info.setdefault(_DB_SPANS_KEY, []).append((created, time.perf_counter()))
+
+
+def _after_cursor_execute(conn, _cursor, _statement, _parameters, _context, _executemany) -> None:
+    pending = conn.info.get(_DB_SPANS_KEY)
+    if not pending:
+        return
+    created, started = pending.pop()
+    if created is not None:
+        created.duration_ms = (time.perf_counter() - started) * 1000
+
+
+def _handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    pending = connection.info.get(_DB_SPANS_KEY) if connection is not None else None
+    if not pending:
+        return
+    created, started = pending.pop()
+    if created is not None:
+        created.duration_ms = (time.perf_counter() - started) * 1000
+        created.status = "error"
+        created.error = type(exception_context.original_exception).__name__
+
+
+def install_db_tracing() -> None:
+    """Emit a ``db.query`` span for every SQL statement run inside a trace; safe to call more than once."""
+    global _db_tracing_installed
+    if _db_tracing_installed:
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+    _db_tracing_installed = True
+
+
+def build_trace_store() -> TraceStore:
+    """Configure from ``ADMIN_TRACE_FILE`` (JSONL export, disabled when empty) and ``ADMIN_TRACE_MEMORY_LIMIT``."""
+    path = os.getenv("ADMIN_TRACE_FILE", "").strip()
+    try:
+        max_traces = max(1, int(os.getenv("ADMIN_TRACE_MEMORY_LIMIT", "500")))
+    except ValueError:
+        max_traces = 500
+    return TraceStore(max_traces=max_traces, path=path or None)
@@ -7,6 +7,7 @@ from urllib.parse import urlparse
 import re
 import requests
 
+from ..core.concurrency import DeadlineExceeded
 from ..core.http import HttpRequestConfig, request_with_retries
 from ..core.logging import get_logger
 
@@ -273,6 +274,8 @@ class ApifyMapsClient(SourcingClient):
             logger.info("Apify lead search completed.", extra={"lead_count": len(leads)})
             return leads
 
+        except DeadlineExceeded:
+            raise
         except Exception as exc:
             logger.exception(
                 "Apify lead search failed.",
@@ -1,6 +1,7 @@
 from typing import Dict, Any, List
 from ..core.models import Lead
 from ..core.db_models import DBWorkflowRule, DBLead, DBTask
+from ..core.database import commit_or_flush
 from ..core.logging import get_logger
 from sqlalchemy.orm import Session
 import json
@@ -12,8 +13,9 @@ import httpx
 logger = get_logger(__name__)
 
 class RulesEngine:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, commit: bool = True):
         self.db = db
+        self.commit = commit
 
     def evaluate_and_execute(self, lead: DBLead, trigger_type: str):
         """
@@ -77,7 +79,7 @@ class RulesEngine:
                 source="workflow_automation",
             )
             self.db.add(task)
-            self.db.commit()
+            commit_or_flush(self.db, commit=self.commit)
             logger.info(f"Task created for lead {lead.id}")
 
         elif action_type == "change_stage":
@@ -85,7 +87,7 @@ class RulesEngine:
             if new_stage:
                 lead.stage = new_stage
                 lead.updated_at = datetime.now()
-                self.db.commit()
+                commit_or_flush(self.db, commit=self.commit)
                 logger.info(f"Lead {lead.id} stage updated to {new_stage}")
 
         elif action_type == "change_status":
@@ -93,7 +95,7 @@ class RulesEngine:
             if new_status:
                 lead.status = new_status
                 lead.updated_at = datetime.now()
-                self.db.commit()
+                commit_or_flush(self.db, commit=self.commit)
                 logger.info(f"Lead {lead.id} status updated to {new_status}")
 
         elif action_type == "send_webhook":
@@ -130,7 +132,7 @@ class RulesEngine:
                 current_tags.append(tag)
                 lead.tags_json = current_tags
                 lead.updated_at = datetime.now()
-                self.db.commit()
+                commit_or_flush(self.db, commit=self.commit)
                 logger.info(f"Tag '{tag}' added to lead {lead.id}")
 
         else:
@@ -151,8 +151,9 @@ def test_report_schedules_runs_and_pdf_export(client, db_session):
     db_session.commit()
 
     run_due_response = client.post("/api/v1/admin/reports/schedules/run-due", auth=("admin", "secret"))
-    assert run_due_response.status_code == 200
-    assert run_due_response.json()["executed"] >= 1
+    assert run_due_response.status_code == 202
+    job_response = client.get(f"/api/v1/admin/jobs/{run_due_response.json()['id']}", auth=("admin", "secret"))
+    assert job_response.json()["result"]["executed"] >= 1
 
     runs_response = client.get(
         f"/api/v1/admin/reports/schedules/runs?schedule_id={schedule_id}&limit=10",
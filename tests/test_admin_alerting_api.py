@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import sys
+
+from fastapi.testclient import TestClient
+
+from src.core.alerting import AlertPipeline, alert_fingerprint
+
+
+admin_app_module = sys.modules["src.admin.app"]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_repeated_errors_are_sent_once_then_as_a_digest():
+    clock = FakeClock()
+    sent = []
+    pipeline = AlertPipeline(sent.append, min_interval_seconds=300, clock=clock)
+
+    for index in range(3):
+        pipeline.report("OperationalError", "GET /api/v1/admin/leads", message="db down", request_id=f"r-{index}")
+    assert pipeline.run_once() == 1
+    assert (sent[0].count, sent[0].title) == (3, "[ERROR] Repeated error")
+
+    for _ in range(500):
+        pipeline.report("OperationalError", "GET /api/v1/admin/leads", message="db down")
+    clock.now += 299
+    assert pipeline.run_once() == 0
+
+    clock.now += 1
+    assert pipeline.run_once() == 1
+    assert sent[1].count == 500
+    assert "**Occurrences**: 500" in sent[1].describe()
+    assert pipeline.stats()["reported"] == 503
+
+
+def test_global_rate_limit_defers_alerts_to_the_next_minute():
+    clock = FakeClock()
+    sent = []
+    pipeline = AlertPipeline(sent.append, max_alerts_per_minute=10, clock=clock)
+    for index in range(15):
+        pipeline.report("KeyError", f"GET /api/v1/admin/route-{index}", message="boom")
+
+    assert pipeline.run_once() == 10
+    assert pipeline.run_once() == 0
+    clock.now += 60
+    assert pipeline.run_once() == 5
+    assert len({alert.fingerprint for alert in sent}) == 15
+
+
+def test_failed_sends_do_not_break_the_pipeline():
+    def _fail(_alert):
+        raise RuntimeError("discord down")
+
+    pipeline = AlertPipeline(_fail)
+    pipeline.report("KeyError", "GET /x", message="boom")
+    assert pipeline.run_once() == 0
+    assert pipeline.stats()["send_errors"] == 1
+
+
+def test_unhandled_exception_is_reported_to_the_pipeline(client, monkeypatch):
+    def _boom(*_args, **_kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(admin_app_module, "_list_audit_logs_payload", _boom)
+    before = admin_app_module.alert_pipeline.stats()["reported"]
+    raw_client = TestClient(admin_app_module.app, raise_server_exceptions=False)
+
+    response = raw_client.get("/api/v1/admin/audit-log", auth=("admin", "secret"))
+
+    assert response.status_code == 500
+    assert admin_app_module.alert_pipeline.stats()["reported"] == before + 1
+    fingerprint = alert_fingerprint("RuntimeError", "GET /api/v1/admin/audit-log")
+    assert fingerprint in admin_app_module.alert_pipeline._buckets
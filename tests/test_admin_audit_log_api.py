@@ -1,5 +1,12 @@
 from __future__ import annotations
 
+import json
+import os
+import socket
+
+from src.admin.audit_log import AuditBuffer, audit_entry, record_audit
+from src.core.db_models import DBAuditLog
+
 
 def test_audit_log_tracks_mutations(client):
     create_response = client.post(
@@ -35,3 +42,90 @@ def test_audit_log_cursor_parameter(client):
             auth=("admin", "secret"),
         )
         assert second_response.status_code == 200
+
+
+def test_buffered_audit_entries_are_bulk_inserted_on_flush(db_session):
+    buffer = AuditBuffer(db_session.get_bind(), batch_size=2)
+    for index in range(3):
+        record_audit(db_session, buffer, actor="admin", action="task_created", entity_type="task", entity_id=f"t-{index}")
+    assert db_session.query(DBAuditLog).count() == 0
+    assert buffer.stats()["pending"] == 3
+
+    assert buffer.flush() == 3
+    assert sorted(row.entity_id for row in db_session.query(DBAuditLog)) == ["t-0", "t-1", "t-2"]
+    assert buffer.stats() == {"pending": 0, "recorded": 3, "flushed": 3, "dropped": 0, "flush_errors": 0}
+
+
+def test_security_critical_actions_are_written_synchronously(db_session):
+    buffer = AuditBuffer(db_session.get_bind())
+    record_audit(db_session, buffer, actor="admin", action="secret_upserted", entity_type="secret", entity_id="SMTP")
+    record_audit(db_session, buffer, actor="admin", action="rag_chat", entity_type="rag", sync=True)
+
+    assert {row.action for row in db_session.query(DBAuditLog)} == {"secret_upserted", "rag_chat"}
+    assert buffer.stats()["recorded"] == 0
+
+
+def test_wal_entries_survive_a_crash(db_session, tmp_path):
+    wal_path = tmp_path / "audit.wal"
+    crashed = AuditBuffer(db_session.get_bind(), wal_path=wal_path)
+    crashed.record(audit_entry(actor="admin", action="rag_chat", entity_type="rag", entity_id=None, metadata={"q": 1}))
+    flushed = audit_entry(actor="admin", action="task_created", entity_type="task", entity_id="t-1", metadata=None)
+    crashed.record(flushed)
+    db_session.add(DBAuditLog(**flushed))
+    db_session.commit()
+
+    restarted = AuditBuffer(db_session.get_bind(), wal_path=wal_path)
+    assert restarted.recover() == 1
+    assert sorted(row.action for row in db_session.query(DBAuditLog)) == ["rag_chat", "task_created"]
+    assert list(tmp_path.glob("audit.wal.*")) == []
+
+
+def _entry(action: str) -> dict:
+    return audit_entry(actor="admin", action=action, entity_type="task", entity_id=None, metadata=None)
+
+
+def _wal_lines(tmp_path) -> list[str]:
+    return [line for path in tmp_path.glob("audit.wal.*") for line in path.read_text().splitlines()]
+
+
+def test_wal_segments_rotate_per_flush_and_stay_per_worker(db_session, tmp_path):
+    wal_path = tmp_path / "audit.wal"
+    worker_a = AuditBuffer(db_session.get_bind(), wal_path=wal_path)
+    worker_b = AuditBuffer(db_session.get_bind(), wal_path=wal_path)
+    for index in range(3):
+        worker_a.record(_entry(f"a-{index}"))
+        worker_a.flush()
+    worker_a.record(_entry("a-pending"))
+    worker_b.record(_entry("b-pending"))
+
+    assert all(f"{socket.gethostname()}-{os.getpid()}-" in path.name for path in tmp_path.glob("audit.wal.*"))
+    # Flushed segments are gone and worker A's flushes never touched worker B's entry.
+    assert len(_wal_lines(tmp_path)) == 2
+    worker_a.flush()
+    assert [line for line in _wal_lines(tmp_path) if "b-pending" in line]
+
+    # Worker B dies; the next startup replays its segment.
+    restarted = AuditBuffer(db_session.get_bind(), wal_path=wal_path)
+    assert restarted.recover() == 1
+    assert db_session.query(DBAuditLog).filter(DBAuditLog.action == "b-pending").count() == 1
+    assert _wal_lines(tmp_path) == []
+
+
+def test_recover_leaves_segments_of_live_workers(db_session, tmp_path):
+    wal_path = tmp_path / "audit.wal"
+    live = tmp_path / f"audit.wal.{socket.gethostname()}-{os.getppid()}-deadbeef-0"
+    other_host = tmp_path / "audit.wal.other-host-4242-deadbeef-0"
+    for path in (live, other_host):
+        path.write_text(json.dumps(_entry("elsewhere"), default=str) + "\n")
+
+    assert AuditBuffer(db_session.get_bind(), wal_path=wal_path).recover() == 0
+    assert live.exists() and other_host.exists()
+
+
+def test_stop_flushes_pending_entries(db_session):
+    buffer = AuditBuffer(db_session.get_bind(), flush_interval_seconds=60)
+    buffer.start()
+    record_audit(db_session, buffer, actor="admin", action="task_created", entity_type="task")
+    buffer.stop()
+
+    assert db_session.query(DBAuditLog).count() == 1
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from src.core.auth_cache import AuthCache, RevocationFeed
+from src.core.db_models import DBAdminUser
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_session_entries_expire_after_ttl():
+    clock = _Clock(100.0)
+    cache = AuthCache(session_ttl_seconds=30, clock=clock)
+    cache.put_session("sid-1", username="admin", expires_at=datetime.utcnow() + timedelta(hours=1))
+
+    assert cache.get_session("sid-1").username == "admin"
+    clock.now += 31
+    assert cache.get_session("sid-1") is None
+    assert cache.stats()["sessions"] == 0
+
+
+def test_revocations_propagate_through_shared_feed(tmp_path):
+    path = tmp_path / "auth_revocations.log"
+    worker_a = AuthCache(feed=RevocationFeed(path))
+    worker_b = AuthCache(feed=RevocationFeed(path))
+    expires_at = datetime.utcnow() + timedelta(hours=1)
+    worker_b.put_session("sid-1", username="rep@example.com", expires_at=expires_at)
+    worker_b.put_session("sid-2", username="other@example.com", expires_at=expires_at)
+    worker_b.put_subject("rep@example.com", "StrongPass123!", "rep@example.com")
+
+    worker_a.revoke_session("sid-2")
+    assert worker_b.get_session("sid-2") is None
+
+    worker_a.invalidate_subject("rep@example.com")
+    assert worker_b.get_session("sid-1") is None
+    assert worker_b.get_subject("rep@example.com", "StrongPass123!") is None
+
+
+def test_jwt_requests_skip_session_lookup_until_logout(client, db_session, monkeypatch):
+    monkeypatch.setenv("APP_ENV", "production")
+    login = client.post("/api/v1/admin/auth/login", json={"username": "admin", "password": "secret"})
+    assert login.status_code == 200
+    access_token = client.cookies.get("admin_access_token")
+
+    statements: list[str] = []
+
+    def _capture(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        for _ in range(3):
+            assert client.get("/api/v1/admin/auth/me").status_code == 200
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    assert sum("admin_sessions" in statement for statement in statements) <= 1
+
+    assert client.post("/api/v1/admin/auth/logout").status_code == 200
+    revoked = client.get("/api/v1/admin/auth/me", headers={"Authorization": f"Bearer {access_token}"})
+    assert revoked.status_code == 401
+
+
+def test_basic_auth_caches_successes_only_and_honours_disable(client, db_session, monkeypatch):
+    monkeypatch.setenv("APP_ENV", "production")
+    signup = client.post(
+        "/api/v1/admin/auth/signup",
+        json={"email": "rep@example.com", "password": "StrongPass123!"},
+    )
+    assert signup.status_code == 200
+    client.post("/api/v1/admin/auth/logout")
+    client.cookies.clear()
+
+    module = sys.modules["src.admin.app"]
+    verify_calls: list[str] = []
+    original_verify = module._verify_admin_password
+
+    def _counting_verify(password, stored_hash):
+        verify_calls.append(password)
+        return original_verify(password, stored_hash)
+
+    monkeypatch.setattr(module, "_verify_admin_password", _counting_verify)
+
+    for _ in range(3):
+        response = client.get("/api/v1/admin/auth/me", auth=("rep@example.com", "StrongPass123!"))
+        assert response.status_code == 200
+    assert verify_calls == ["StrongPass123!"]
+
+    for _ in range(2):
+        response = client.get("/api/v1/admin/auth/me", auth=("rep@example.com", "wrong-password"))
+        assert response.status_code == 401
+    assert verify_calls.count("wrong-password") == 2
+
+    user = db_session.query(DBAdminUser).filter(DBAdminUser.email == "rep@example.com").one()
+    disabled = client.patch(
+        f"/api/v1/admin/users/{user.id}",
+        json={"status": "disabled"},
+        auth=("admin", "secret"),
+    )
+    assert disabled.status_code == 200
+    response = client.get("/api/v1/admin/auth/me", auth=("rep@example.com", "StrongPass123!"))
+    assert response.status_code == 401
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+
+from sqlalchemy import event
+
+from src.core.db_models import DBAuditLog, DBLead, DBNotification, DBTask, DBWorkflowRule
+from src.core.models import LeadStage, LeadStatus
+
+
+admin_app_module = sys.modules["src.admin.app"]
+
+
+def _seed(db_session) -> None:
+    db_session.add(
+        DBLead(
+            id="batch@example.com",
+            email="batch@example.com",
+            first_name="Batch",
+            last_name="Lead",
+            status=LeadStatus.NEW,
+            stage=LeadStage.NEW,
+            created_at=datetime.now(),
+        )
+    )
+    db_session.add_all(
+        [
+            DBTask(id="batch-task-1", title="Relance 1", status="To Do", lead_id="batch@example.com"),
+            DBTask(id="batch-task-2", title="Relance 2", status="To Do", lead_id="batch@example.com"),
+        ]
+    )
+    db_session.commit()
+
+
+def test_batch_runs_operations_in_one_commit_with_per_op_results(client, db_session):
+    _seed(db_session)
+    commits: list[int] = []
+
+    def _count_commit(_conn):
+        commits.append(1)
+
+    # Savepoint releases also fire the session-level after_commit hook, so count real COMMITs.
+    engine = db_session.get_bind()
+    event.listen(engine, "commit", _count_commit)
+    try:
+        response = client.post(
+            "/api/v1/admin/batch",
+            json={
+                "operations": [
+                    {"op": "lead.update", "id": "batch@example.com", "payload": {"first_name": "Renamed"}},
+                    {"op": "task.close", "id": "missing-task", "ref": "close-missing"},
+                    {"op": "task.close", "id": "batch-task-1", "payload": {"note": "Fait"}},
+                    {
+                        "op": "lead.notes",
+                        "id": "batch@example.com",
+                        "payload": {"items": [{"content": "Appel prevu jeudi"}]},
+                    },
+                ]
+            },
+            auth=("admin", "secret"),
+        )
+    finally:
+        event.remove(engine, "commit", _count_commit)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["committed"] is True
+    assert body["succeeded"] == 3
+    assert body["failed"] == 1
+    assert [entry["status"] for entry in body["results"]] == ["ok", "error", "ok", "ok"]
+    assert body["results"][1]["status_code"] == 404
+    assert body["results"][1]["ref"] == "close-missing"
+    assert body["results"][0]["result"]["first_name"] == "Renamed"
+    assert len(commits) == 1
+
+    db_session.expire_all()
+    assert db_session.get(DBLead, "batch@example.com").first_name == "Renamed"
+    assert db_session.get(DBTask, "batch-task-1").status == "Done"
+    admin_app_module.audit_buffer.flush()
+    assert db_session.query(DBAuditLog).filter(DBAuditLog.action == "task_closed").count() == 1
+
+
+def test_atomic_batch_rolls_back_everything_on_failure(client, db_session):
+    _seed(db_session)
+    response = client.post(
+        "/api/v1/admin/batch",
+        json={
+            "atomic": True,
+            "operations": [
+                {"op": "task.close", "id": "batch-task-1"},
+                {"op": "lead.update", "id": "batch@example.com", "payload": {"first_name": ""}},
+                {"op": "task.close", "id": "batch-task-2"},
+            ],
+        },
+        auth=("admin", "secret"),
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["committed"] is False
+    assert [entry["status"] for entry in body["results"]] == ["rolled_back", "error", "skipped"]
+    assert body["results"][1]["status_code"] == 422
+
+    db_session.expire_all()
+    assert db_session.get(DBTask, "batch-task-1").status == "To Do"
+    assert db_session.get(DBTask, "batch-task-2").status == "To Do"
+    admin_app_module.audit_buffer.flush()
+    assert db_session.query(DBAuditLog).count() == 0
+
+
+def test_atomic_batch_rolls_back_workflow_and_notification_writes(client, db_session):
+    _seed(db_session)
+    db_session.add(
+        DBWorkflowRule(
+            id="batch-rule",
+            name="Follow up after close",
+            trigger_type="task_completed",
+            criteria_json={},
+            action_type="create_task",
+            action_config_json={"title": "Suivi automatique"},
+        )
+    )
+    db_session.commit()
+
+    response = client.post(
+        "/api/v1/admin/batch",
+        json={
+            "atomic": True,
+            "operations": [
+                {"op": "task.close", "id": "batch-task-1"},
+                {"op": "task.close", "id": "missing-task"},
+            ],
+        },
+        auth=("admin", "secret"),
+    )
+    body = response.json()
+    assert body["committed"] is False
+    assert [entry["status"] for entry in body["results"]] == ["rolled_back", "error"]
+
+    db_session.expire_all()
+    assert db_session.get(DBTask, "batch-task-1").status == "To Do"
+    assert db_session.query(DBTask).filter(DBTask.source == "workflow_automation").count() == 0
+    assert db_session.query(DBNotification).count() == 0
+
+
+def test_batch_rejects_unknown_ops_and_invalid_payloads(client, db_session):
+    _seed(db_session)
+    response = client.post(
+        "/api/v1/admin/batch",
+        json={
+            "operations": [
+                {"op": "lead.delete_everything", "id": "batch@example.com"},
+                {"op": "lead.stage_transition", "id": "batch@example.com", "payload": {}},
+            ]
+        },
+        auth=("admin", "secret"),
+    )
+    body = response.json()
+    assert [entry["status_code"] for entry in body["results"]] == [422, 422]
+    assert body["results"][1]["error"][0]["loc"] == ["to_stage"]
+
+    empty = client.post("/api/v1/admin/batch", json={"operations": []}, auth=("admin", "secret"))
+    assert empty.status_code == 422
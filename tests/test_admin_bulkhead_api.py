@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import sys
+
+import pytest
+
+from src.core.concurrency import (
+    Bulkhead,
+    BulkheadFull,
+    BulkheadRegistry,
+    DeadlineExceeded,
+    bounded_timeout,
+    set_deadline,
+)
+from src.core.http import HttpRequestConfig, request_with_retries
+
+
+def test_bulkhead_queues_then_sheds():
+    async def scenario() -> dict:
+        bulkhead = Bulkhead("ai", max_concurrent=1, max_queue=1, queue_timeout_seconds=0.05)
+        await bulkhead.acquire()
+
+        waiting = asyncio.create_task(bulkhead.acquire())
+        await asyncio.sleep(0)
+        with pytest.raises(BulkheadFull) as full:
+            await bulkhead.acquire()
+        assert full.value.reason == "queue_full"
+
+        with pytest.raises(BulkheadFull) as timed_out:
+            await waiting
+        assert timed_out.value.reason == "queue_timeout"
+        assert timed_out.value.retry_after_seconds >= 1
+
+        # A released slot goes straight to the next waiter.
+        handed_over = asyncio.create_task(bulkhead.acquire())
+        await asyncio.sleep(0)
+        bulkhead.release(12.0)
+        await asyncio.wait_for(handed_over, timeout=1)
+        bulkhead.release(8.0)
+        return bulkhead.stats()
+
+    stats = asyncio.run(scenario())
+    assert stats["active"] == 0
+    assert stats["admitted"] == 2
+    assert stats["shed_queue_full"] == 1
+    assert stats["shed_timeout"] == 1
+    assert stats["max_queue_depth"] == 1
+    assert stats["avg_hold_ms"] == 10.0
+
+
+def test_deadline_caps_provider_timeouts_and_retries():
+    class _Session:
+        def __init__(self) -> None:
+            self.timeouts: list[float] = []
+
+        def request(self, method, url, timeout=None, **kwargs):
+            self.timeouts.append(timeout)
+
+            class _Busy:
+                status_code = 503
+
+            return _Busy()
+
+    def run_with_deadline() -> _Session:
+        set_deadline(0.5)
+        assert bounded_timeout(10.0) <= 0.5
+        session = _Session()
+        with pytest.raises(DeadlineExceeded):
+            request_with_retries(
+                session,
+                "GET",
+                "https://provider.example.com/search",
+                config=HttpRequestConfig(timeout=10.0, max_retries=3, backoff_base_seconds=1.0),
+            )
+        return session
+
+    session = contextvars.copy_context().run(run_with_deadline)
+    assert len(session.timeouts) == 1
+    assert session.timeouts[0] <= 0.5
+    assert bounded_timeout(10.0) == 10.0
+
+
+def test_saturated_endpoint_class_is_shed_with_retry_after(client, monkeypatch):
+    module = sys.modules["src.admin.app"]
+    bulkhead = Bulkhead("ai", max_concurrent=1, max_queue=0, queue_timeout_seconds=1)
+    monkeypatch.setattr(module, "bulkheads", BulkheadRegistry([bulkhead]))
+    asyncio.run(bulkhead.acquire())
+
+    response = client.post("/api/v1/admin/rag/chat", json={"query": "pricing"}, auth=("admin", "secret"))
+    assert response.status_code == 503
+    assert int(response.headers["retry-after"]) >= 1
+    body = response.json()
+    assert body["error"] == "SERVER_002"
+    assert body["details"] == {"bulkhead": "ai", "reason": "queue_full"}
+
+    # Lightweight endpoints are unaffected.
+    assert client.get("/api/v1/admin/leads", auth=("admin", "secret")).status_code == 200
+
+    bulkhead.release(5.0)
+    metrics = client.get("/api/v1/admin/metrics", auth=("admin", "secret")).json()
+    assert metrics["bulkheads"]["ai"]["shed_queue_full"] == 1
+    assert metrics["bulkheads"]["ai"]["active"] == 0
+
+    prometheus = client.get("/metrics", auth=("admin", "secret")).text
+    assert 'admin_bulkhead_shed_total{bulkhead="ai",reason="queue_full"} 1' in prometheus
+
+
+
+def test_research_provider_deadline_is_not_swallowed(monkeypatch):
+    from src.admin import research_service
+
+    def out_of_time(query, limit):
+        raise DeadlineExceeded("Request deadline leaves no time for another retry.")
+
+    monkeypatch.setattr(research_service, "_search_duckduckgo", out_of_time)
+    with pytest.raises(DeadlineExceeded):
+        research_service.run_web_research(
+            query="crm tools",
+            limit=5,
+            provider_selector="duckduckgo",
+            provider_configs={},
+        )
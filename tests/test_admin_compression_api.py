@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import gzip
+import sys
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.core.compression import CompressionMiddleware, negotiate_encoding
+from src.core.db_models import DBLead
+from src.core.metrics import ResponseSizeMiddleware
+from src.core.models import LeadStage, LeadStatus
+
+
+def _seed_tagged_leads(db_session, count: int) -> None:
+    for index in range(count):
+        db_session.add(
+            DBLead(
+                id=f"zip-{index}@example.com",
+                email=f"zip-{index}@example.com",
+                first_name="Zip",
+                last_name=str(index),
+                status=LeadStatus.NEW,
+                stage=LeadStage.NEW,
+                tags=["saas", "paris", "decision-maker"],
+                created_at=datetime.now(),
+            )
+        )
+    db_session.commit()
+
+
+def test_large_lead_list_is_gzipped_and_ratio_is_reported(client, db_session):
+    _seed_tagged_leads(db_session, 40)
+
+    response = client.get(
+        "/api/v1/admin/leads?page_size=100",
+        headers={"Accept-Encoding": "gzip"},
+        auth=("admin", "secret"),
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert len(response.json()["items"]) == 40
+
+    small = client.get(
+        "/api/v1/admin/leads/missing@example.com",
+        headers={"Accept-Encoding": "gzip"},
+        auth=("admin", "secret"),
+    )
+    assert "content-encoding" not in small.headers
+
+    identity = client.get(
+        "/api/v1/admin/leads?page_size=100",
+        headers={"Accept-Encoding": "identity"},
+        auth=("admin", "secret"),
+    )
+    assert "content-encoding" not in identity.headers
+
+    compression = client.get("/api/v1/admin/metrics", auth=("admin", "secret")).json()["compression"]
+    assert compression["by_encoding"]["gzip"]["responses"] >= 1
+    assert compression["ratio"] > 1
+
+
+def test_response_bytes_are_counted_before_compression(client, db_session):
+    _seed_tagged_leads(db_session, 40)
+    request_metrics = sys.modules["src.admin.app"].request_metrics
+
+    def leads_bytes() -> int:
+        endpoints = request_metrics.snapshot()["endpoints"]
+        return next((item["response_bytes"] for item in endpoints if item["path"] == "/api/v1/admin/leads"), 0)
+
+    before = leads_bytes()
+    response = client.get(
+        "/api/v1/admin/leads?page_size=100",
+        headers={"Accept-Encoding": "gzip"},
+        auth=("admin", "secret"),
+    )
+    assert response.headers["content-encoding"] == "gzip"
+    assert leads_bytes() - before == len(response.content)
+    assert len(response.content) > int(response.headers["content-length"])
+
+    app = FastAPI()
+    observed: list[tuple[str, int]] = []
+    app.add_middleware(ResponseSizeMiddleware, on_complete=lambda path, size: observed.append((path, size)))
+    app.add_middleware(CompressionMiddleware, minimum_size=64)
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse((f"row-{index},value\n" * 50 for index in range(5)), media_type="text/csv")
+
+    streamed = TestClient(app).get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert streamed.headers["content-encoding"] == "gzip"
+    assert observed == [("/stream", len(streamed.content))]
+
+
+def test_streamed_bodies_are_compressed_incrementally_and_gzip_content_is_skipped():
+    app = FastAPI()
+    observed: list[tuple[str, int, int]] = []
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=64,
+        on_compress=lambda encoding, original, compressed: observed.append((encoding, original, compressed)),
+    )
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse((f"row-{index},value\n" * 50 for index in range(5)), media_type="text/csv")
+
+    @app.get("/archive")
+    def archive() -> Response:
+        return Response(gzip.compress(b"x" * 4096), media_type="application/gzip")
+
+    @app.get("/text")
+    def text() -> PlainTextResponse:
+        return PlainTextResponse("y" * 4096)
+
+    with TestClient(app) as test_client:
+        streamed = test_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert streamed.headers["content-encoding"] == "gzip"
+        assert "content-length" not in streamed.headers
+        assert streamed.text.count("\n") == 250
+
+        archived = test_client.get("/archive", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in archived.headers
+
+        text_response = test_client.get("/text", headers={"Accept-Encoding": "gzip"})
+        assert text_response.headers["content-encoding"] == "gzip"
+        assert text_response.text == "y" * 4096
+
+    assert [entry[0] for entry in observed] == ["gzip", "gzip"]
+    assert all(original > compressed for _, original, compressed in observed)
+
+
+def test_negotiate_encoding_respects_q_values():
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0, deflate") is None
+    assert negotiate_encoding("*") in {"gzip", "br"}
+    assert negotiate_encoding("") is None
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from src.core.db_models import DBCompany, DBLead, DBNotification, DBTask
+from src.core.models import LeadStage, LeadStatus
+
+
+def _seed_lead(db_session) -> None:
+    company = DBCompany(name="Etag Corp", domain="etagcorp.com")
+    db_session.add(company)
+    db_session.flush()
+    db_session.add(
+        DBLead(
+            id="etag.lead@example.com",
+            email="etag.lead@example.com",
+            first_name="Etag",
+            last_name="Lead",
+            company_id=company.id,
+            status=LeadStatus.NEW,
+            stage=LeadStage.NEW,
+            created_at=datetime.now(),
+        )
+    )
+    db_session.commit()
+
+
+def test_leads_list_returns_304_until_a_lead_changes(client, db_session):
+    _seed_lead(db_session)
+
+    first = client.get("/api/v1/admin/leads?page=1&page_size=25", auth=("admin", "secret"))
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    cached = client.get(
+        "/api/v1/admin/leads?page=1&page_size=25",
+        headers={"If-None-Match": etag},
+        auth=("admin", "secret"),
+    )
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    other_page = client.get(
+        "/api/v1/admin/leads?page=2&page_size=25",
+        headers={"If-None-Match": etag},
+        auth=("admin", "secret"),
+    )
+    assert other_page.status_code == 200
+
+    patched = client.patch(
+        "/api/v1/admin/leads/etag.lead@example.com",
+        json={"company_name": "Etag Corp Renamed"},
+        auth=("admin", "secret"),
+    )
+    assert patched.status_code == 200
+
+    refreshed = client.get(
+        "/api/v1/admin/leads?page=1&page_size=25",
+        headers={"If-None-Match": etag},
+        auth=("admin", "secret"),
+    )
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert refreshed.json()["items"][0]["company_name"] == "Etag Corp Renamed"
+
+
+def test_lead_detail_and_tasks_support_if_none_match(client, db_session):
+    _seed_lead(db_session)
+
+    detail = client.get("/api/v1/admin/leads/etag.lead@example.com", auth=("admin", "secret"))
+    assert detail.status_code == 200
+    detail_etag = detail.headers["etag"]
+    assert client.get(
+        "/api/v1/admin/leads/etag.lead@example.com",
+        headers={"If-None-Match": f'"other", {detail_etag}'},
+        auth=("admin", "secret"),
+    ).status_code == 304
+
+    missing = client.get(
+        "/api/v1/admin/leads/missing@example.com",
+        headers={"If-None-Match": "*"},
+        auth=("admin", "secret"),
+    )
+    assert missing.status_code == 404
+
+    tasks = client.get("/api/v1/admin/tasks", auth=("admin", "secret"))
+    tasks_etag = tasks.headers["etag"]
+    assert client.get(
+        "/api/v1/admin/tasks", headers={"If-None-Match": tasks_etag}, auth=("admin", "secret")
+    ).status_code == 304
+
+    client.post(
+        "/api/v1/admin/tasks",
+        json={"title": "Nouvelle tache", "lead_id": "etag.lead@example.com"},
+        auth=("admin", "secret"),
+    )
+    assert client.get(
+        "/api/v1/admin/tasks", headers={"If-None-Match": tasks_etag}, auth=("admin", "secret")
+    ).status_code == 200
+
+
+def test_lead_etag_covers_included_tasks(client, db_session):
+    _seed_lead(db_session)
+    db_session.add(DBTask(id="etag-task", title="Relancer", status="To Do", lead_id="etag.lead@example.com"))
+    db_session.commit()
+    url = "/api/v1/admin/leads?page=1&page_size=25&include=open_tasks_count"
+
+    first = client.get(url, auth=("admin", "secret"))
+    assert first.json()["items"][0]["open_tasks_count"] == 1
+
+    db_session.get(DBTask, "etag-task").status = "Done"
+    db_session.commit()
+
+    refreshed = client.get(url, headers={"If-None-Match": first.headers["etag"]}, auth=("admin", "secret"))
+    assert refreshed.status_code == 200
+    assert refreshed.json()["items"][0]["open_tasks_count"] == 0
+
+
+def test_notifications_etag_changes_when_marked_read(client, db_session):
+    db_session.add(
+        DBNotification(
+            id="notif-etag",
+            event_key="lead_created",
+            title="Nouveau lead",
+            message="Un lead a ete cree.",
+            channel="in_app",
+            is_read=False,
+            created_at=datetime.now(),
+        )
+    )
+    db_session.commit()
+
+    first = client.get("/api/v1/admin/notifications", auth=("admin", "secret"))
+    etag = first.headers["etag"]
+    assert first.json()["unread_count"] == 1
+    assert client.get(
+        "/api/v1/admin/notifications", headers={"If-None-Match": etag}, auth=("admin", "secret")
+    ).status_code == 304
+
+    client.post(
+        "/api/v1/admin/notifications/mark-read",
+        json={"ids": ["notif-etag"]},
+        auth=("admin", "secret"),
+    )
+    after = client.get(
+        "/api/v1/admin/notifications", headers={"If-None-Match": etag}, auth=("admin", "secret")
+    )
+    assert after.status_code == 200
+    assert after.json()["unread_count"] == 0
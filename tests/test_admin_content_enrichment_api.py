@@ -78,8 +78,9 @@ def test_enrichment_run_and_fetch(client, db_session):
             "context": {"source": "manual"},
         },
     )
-    assert run_response.status_code == 200, run_response.text
-    run_payload = run_response.json()
+    assert run_response.status_code == 202, run_response.text
+    job_response = client.get(f"/api/v1/admin/jobs/{run_response.json()['id']}", auth=("admin", "secret"))
+    run_payload = job_response.json()["result"]
     assert run_payload["status"] == "completed"
     assert run_payload["relevance_score"] > 0
     assert run_payload.get("result", {}).get("summary")
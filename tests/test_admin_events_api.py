@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+
+from src.core.db_models import DBNotification, DBTask
+from src.core.events import EventBroker, FileEventBackend
+
+
+admin_app_module = sys.modules["src.admin.app"]
+
+
+def _read_events(body: str) -> list[dict]:
+    events = []
+    for block in body.split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line and not line.startswith(":"))
+        if "event" in fields:
+            events.append({"id": fields["id"], "topic": fields["event"], **json.loads(fields["data"])})
+    return events
+
+
+def test_committed_writes_publish_change_events(db_session):
+    broker = admin_app_module.event_broker
+    marker = broker.publish("leads", "marker")
+
+    db_session.add(DBTask(id="task-1", title="Call back", status="To Do"))
+    db_session.commit()
+    db_session.add(DBTask(id="task-2", title="Never saved"))
+    db_session.rollback()
+    task = db_session.get(DBTask, "task-1")
+    task.status = "Done"
+    db_session.commit()
+
+    changes = [(item.topic, item.type, item.entity_id, item.data) for item in broker.since(marker.id, ["tasks"])]
+    assert changes == [
+        ("tasks", "created", "task-1", {"status": "To Do", "lead_id": None, "project_id": None}),
+        ("tasks", "updated", "task-1", {"status": "Done", "lead_id": None, "project_id": None}),
+    ]
+
+
+def test_bulk_commit_collapses_into_one_event(db_session):
+    broker = admin_app_module.event_broker
+    marker = broker.publish("notifications", "marker")
+    for index in range(60):
+        db_session.add(DBNotification(id=f"n-{index}", event_key="lead_created", title="t", message="m"))
+    db_session.commit()
+
+    changes = broker.since(marker.id, ["notifications"])
+    assert [(item.type, item.data) for item in changes] == [("bulk", {"count": 60})]
+
+
+def test_stream_replays_missed_events_for_subscribed_topics(client, monkeypatch):
+    monkeypatch.setenv("ADMIN_EVENTS_STREAM_MAX_SECONDS", "1")
+    broker = admin_app_module.event_broker
+    marker = broker.publish("tasks", "marker")
+    lead_event = broker.publish("leads", "updated", "lead-1", {"status": "CONTACTED"})
+    broker.publish("tasks", "updated", "task-9", {})
+
+    with client.stream(
+        "GET",
+        "/api/v1/admin/events/stream?topics=leads",
+        headers={"Last-Event-ID": marker.id},
+        auth=("admin", "secret"),
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = "".join(response.iter_text())
+
+    assert body.startswith("retry: 3000")
+    assert _read_events(body) == [
+        {
+            "id": lead_event.id,
+            "topic": "leads",
+            "type": "updated",
+            "entity_id": "lead-1",
+            "data": {"status": "CONTACTED"},
+        }
+    ]
+
+
+def test_stream_rejects_unknown_topics(client):
+    response = client.get("/api/v1/admin/events/stream?topics=leads,secrets", auth=("admin", "secret"))
+    assert response.status_code == 422
+
+
+def test_file_backend_carries_events_between_brokers(tmp_path):
+    path = tmp_path / "events.jsonl"
+    first = EventBroker(backend=FileEventBackend(path), node="a")
+    second = EventBroker(backend=FileEventBackend(path), node="b")
+
+    async def _receive():
+        subscription = second.subscribe(["jobs"])
+        first.publish("jobs", "updated", "job-1", {"status": "succeeded"})
+        first.publish("leads", "updated", "lead-1")
+        return await subscription.next(timeout=0.05), await subscription.next(timeout=0.05)
+
+    received, nothing_else = asyncio.run(_receive())
+    assert (received.topic, received.entity_id, received.node) == ("jobs", "job-1", "a")
+    assert nothing_else is None
+    assert first.pump() == 0  # a broker ignores its own events coming back from the feed
+
+
+def test_open_stream_does_not_hold_a_database_connection(client, db_session, monkeypatch):
+    monkeypatch.setenv("APP_ENV", "production")
+    monkeypatch.setenv("ADMIN_EVENTS_STREAM_MAX_SECONDS", "1")
+    assert client.post("/api/v1/admin/auth/login", json={"username": "admin", "password": "secret"}).status_code == 200
+    # A session-cache miss makes require_admin look the session up in the request's DB session.
+    admin_app_module.auth_cache.clear()
+    db_session.close()
+    pool = db_session.get_bind().pool
+
+    with client.stream("GET", "/api/v1/admin/events/stream") as response:
+        assert response.status_code == 200
+        chunks = response.iter_text()
+        assert next(chunks).startswith("retry:")
+        assert pool.checkedout() == 0
+        "".join(chunks)
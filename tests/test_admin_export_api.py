@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from datetime import datetime
 
 from src.core.db_models import DBCompany, DBLead, DBProject, DBTask
@@ -83,3 +84,43 @@ def test_export_csv_systems(client, db_session):
     lines = response.text.strip().splitlines()
     assert lines[0] == "system_key,system_type,status,item_count,updated_at,details"
     assert any("admin_settings,settings" in line for line in lines[1:])
+
+
+def test_export_csv_streams_large_tables_in_chunks(client, db_session, monkeypatch):
+    admin_module = sys.modules["src.admin.app"]
+    monkeypatch.setattr(admin_module, "EXPORT_CSV_BATCH_SIZE", 50)
+    monkeypatch.setattr(admin_module, "EXPORT_CSV_CHUNK_BYTES", 512)
+    for index in range(300):
+        db_session.add(
+            DBLead(
+                id=f"stream-{index}@example.com",
+                email=f"stream-{index}@example.com",
+                first_name="Stream",
+                last_name=str(index),
+                status=LeadStatus.NEW,
+                stage=LeadStage.NEW,
+                created_at=datetime.now(),
+            )
+        )
+    db_session.commit()
+
+    chunks, file_name = admin_module._export_csv_stream(db_session, entity="leads", fields="id,email")
+    chunks = list(chunks)
+    assert file_name == "leads.csv"
+    assert len(chunks) > 1
+    assert all(len(chunk) < 1024 for chunk in chunks)
+
+    response = client.get(
+        "/api/v1/admin/export/csv?entity=leads&fields=id,email",
+        auth=("admin", "secret"),
+    )
+    assert response.status_code == 200
+    assert "content-length" not in response.headers
+    lines = response.text.strip().splitlines()
+    assert lines[0] == "id,email"
+    assert len(lines) == 301
+    assert response.text == "".join(chunks)
+
+def test_export_csv_rejects_unknown_entity(client):
+    response = client.get("/api/v1/admin/export/csv?entity=invoices", auth=("admin", "secret"))
+    assert response.status_code == 422
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import gzip
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.admin import export_service
+from src.core.db_models import DBCompany, DBExportJob, DBLead, DBReportSchedule
+from src.core.models import LeadStage, LeadStatus
+
+
+@pytest.fixture(autouse=True)
+def _artifact_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("ADMIN_EXPORT_ARTIFACT_DIR", str(tmp_path / "exports"))
+
+
+def _seed_scored_lead(db_session) -> None:
+    company = DBCompany(name="Columnar Corp", domain="columnar.com", industry="SaaS", location="Lyon")
+    db_session.add(company)
+    db_session.flush()
+    db_session.add(
+        DBLead(
+            id="columnar@example.com",
+            email="columnar@example.com",
+            first_name="Col",
+            last_name="Umnar",
+            company_id=company.id,
+            status=LeadStatus.NEW,
+            stage=LeadStage.NEW,
+            icp_score=40.0,
+            heat_score=25.0,
+            total_score=65.0,
+            icp_breakdown={"industry": 20, "size": 20},
+            heat_breakdown={"recency": 25},
+            created_at=datetime.now(),
+        )
+    )
+    db_session.commit()
+
+
+def test_jsonl_export_job_runs_in_background_and_downloads(client, db_session):
+    _seed_scored_lead(db_session)
+
+    created = client.post(
+        "/api/v1/admin/exports/jobs",
+        json={"entity": "leads", "format": "jsonl.gz"},
+        auth=("admin", "secret"),
+    )
+    assert created.status_code == 202
+    job_id = created.json()["id"]
+
+    job = client.get(f"/api/v1/admin/exports/jobs/{job_id}", auth=("admin", "secret")).json()
+    assert job["status"] == "completed"
+    assert job["row_count"] == 1
+    assert job["file_name"].endswith(".jsonl.gz")
+
+    download = client.get(f"/api/v1/admin/exports/jobs/{job_id}/download", auth=("admin", "secret"))
+    assert download.status_code == 200
+    rows = [json.loads(line) for line in gzip.decompress(download.content).decode("utf-8").splitlines()]
+    assert rows[0]["email"] == "columnar@example.com"
+    assert rows[0]["company_name"] == "Columnar Corp"
+    assert rows[0]["company_industry"] == "SaaS"
+    assert rows[0]["total_score"] == 65.0
+    assert rows[0]["icp_industry"] == 20
+    assert rows[0]["heat_recency"] == 25
+
+    listed = client.get("/api/v1/admin/exports/jobs", auth=("admin", "secret")).json()
+    assert [item["id"] for item in listed["items"]] == [job_id]
+
+
+def test_export_job_validation_and_pending_download(client, db_session):
+    bad_format = client.post(
+        "/api/v1/admin/exports/jobs",
+        json={"format": "xlsx"},
+        auth=("admin", "secret"),
+    )
+    assert bad_format.status_code == 422
+
+    if not export_service.parquet_engine_available():
+        parquet = client.post(
+            "/api/v1/admin/exports/jobs",
+            json={"format": "parquet"},
+            auth=("admin", "secret"),
+        )
+        assert parquet.status_code == 422
+
+    db_session.add(DBExportJob(id="export-pending", entity="leads", format="jsonl.gz", status="pending"))
+    db_session.commit()
+    pending = client.get("/api/v1/admin/exports/jobs/export-pending/download", auth=("admin", "secret"))
+    assert pending.status_code == 409
+    assert client.get("/api/v1/admin/exports/jobs/missing", auth=("admin", "secret")).status_code == 404
+
+
+def test_parquet_and_csv_exports_are_written_in_batches(db_session, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(export_service, "EXPORT_WRITE_BATCH_ROWS", 2)
+    for index in range(5):
+        breakdown = {"industry": 10 + index} if index % 2 else {"industry": 1.5, "note": "hot"}
+        db_session.add(DBLead(id=f"lead-{index}", email=f"lead-{index}@example.com", icp_breakdown=breakdown))
+    db_session.commit()
+
+    parquet_job = export_service.execute_export_job(
+        db_session, export_service.create_export_job(db_session, export_format="parquet")
+    )
+    csv_job = export_service.execute_export_job(
+        db_session, export_service.create_export_job(db_session, export_format="csv")
+    )
+
+    parquet_file = pq.ParquetFile(parquet_job.file_path)
+    assert (parquet_job.row_count, parquet_file.metadata.num_row_groups) == (5, 3)
+    table = parquet_file.read()
+    assert str(table.schema.field("icp_industry").type) == "double"
+    assert sorted(value for value in table.column("icp_note").to_pylist() if value) == ["hot", "hot", "hot"]
+    lines = open(csv_job.file_path, encoding="utf-8").read().splitlines()
+    assert csv_job.row_count == 5 and len(lines) == 6
+    assert lines[0].endswith(",icp_industry,icp_note")
+
+
+def test_csv_report_schedule_writes_export_artifact(client, db_session):
+    _seed_scored_lead(db_session)
+    created = client.post(
+        "/api/v1/admin/reports/schedules",
+        json={"name": "Weekly leads", "format": "csv"},
+        auth=("admin", "secret"),
+    )
+    assert created.status_code == 200
+
+    row = db_session.query(DBReportSchedule).filter(DBReportSchedule.id == created.json()["id"]).first()
+    row.next_run_at = datetime.now() - timedelta(minutes=1)
+    db_session.commit()
+
+    queued = client.post("/api/v1/admin/reports/schedules/run-due", auth=("admin", "secret")).json()
+    result = client.get(f"/api/v1/admin/jobs/{queued['id']}", auth=("admin", "secret")).json()["result"]
+    assert result["items"][0]["status"] == "success"
+
+    job = db_session.query(DBExportJob).filter(DBExportJob.source == "report_schedule").one()
+    assert job.status == "completed"
+    assert job.row_count == 1
+    download = client.get(f"/api/v1/admin/exports/jobs/{job.id}/download", auth=("admin", "secret"))
+    assert download.text.splitlines()[0].startswith("id,email,")
@@ -1,5 +1,21 @@
 from __future__ import annotations
 
+import io
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+
+from src.admin import import_service, job_queue
+from src.admin.import_service import commit_csv_import
+from src.core.db_models import DBCompany, DBImportCheckpoint, DBLead, DBProject, DBTask
+
 
 def test_csv_import_preview_leads(client):
     csv_payload = (
@@ -34,8 +50,10 @@ def test_csv_import_commit_leads(client):
         files={"file": ("leads.csv", csv_payload, "text/csv")},
         data={"table": "leads"},
     )
-    assert commit_response.status_code == 200
-    commit_payload = commit_response.json()
+    assert commit_response.status_code == 202
+    job_response = client.get(f"/api/v1/admin/jobs/{commit_response.json()['id']}", auth=("admin", "secret"))
+    assert job_response.json()["status"] == "succeeded"
+    commit_payload = job_response.json()["result"]
     assert commit_payload["table"] == "leads"
     assert commit_payload["created"] == 2
     assert commit_payload["skipped"] == 0
@@ -48,3 +66,276 @@ def test_csv_import_commit_leads(client):
     emails = {item["email"] for item in leads_response.json()["items"]}
     assert "nina@example.com" in emails
     assert "rene@example.com" in emails
+
+
+def test_csv_import_streams_in_chunks(db_session):
+    rows = "".join(f"Prenom{index};Nom{index};p{index}@example.com;Société {index % 3}\n" for index in range(25))
+    content = ("prenom;nom;email;entreprise\n" + rows).encode("latin-1")
+    progress = []
+
+    result = commit_csv_import(db=db_session, content=io.BytesIO(content), chunk_size=10, progress=progress.append)
+
+    assert result["table"] == "leads"
+    assert (result["processed_rows"], result["created"], result["skipped"]) == (25, 25, 0)
+    assert progress == [10, 20, 25]
+    assert db_session.query(DBCompany).filter(DBCompany.name == "Société 1").count() == 1
+
+
+def test_csv_import_commit_spools_upload_and_enforces_size_limit(client, monkeypatch, tmp_path):
+    upload_dir = tmp_path / "imports"
+    monkeypatch.setenv("ADMIN_IMPORT_UPLOAD_DIR", str(upload_dir))
+    csv_payload = "first_name,last_name,email\nNina,Lopez,nina@example.com\n"
+
+    accepted = client.post(
+        "/api/v1/admin/import/csv/commit",
+        auth=("admin", "secret"),
+        files={"file": ("leads.csv", csv_payload, "text/csv")},
+    )
+    assert accepted.status_code == 202
+    job = client.get(f"/api/v1/admin/jobs/{accepted.json()['id']}", auth=("admin", "secret")).json()
+    assert job["result"]["created"] == 1
+    assert list(upload_dir.iterdir()) == []
+
+    monkeypatch.setenv("ADMIN_IMPORT_MAX_BYTES", "10")
+    rejected = client.post(
+        "/api/v1/admin/import/csv/commit",
+        auth=("admin", "secret"),
+        files={"file": ("leads.csv", csv_payload, "text/csv")},
+    )
+    assert rejected.status_code == 413
+    assert list(upload_dir.iterdir()) == []
+
+
+def test_csv_import_upserts_a_chunk_with_a_few_queries(db_session):
+    db_session.add(DBCompany(id=1, name="Acme"))
+    db_session.add(DBLead(id="lead-a", first_name="Ana", last_name="Diaz", email="ana@example.com", company_id=1))
+    db_session.add(DBLead(id="lead-b", first_name="Ben", last_name="Roy", email=None, company_id=1))
+    db_session.commit()
+    rows = "".join(f"New{index},Lead{index},new{index}@example.com,Globex\n" for index in range(100))
+    content = (
+        "first_name,last_name,email,company\n"
+        "Ana,Diaz-Lopez,ana@example.com,Acme\n"
+        "Ben,Roy,ben@example.com,acme\n"
+        "Dup,First,dup@example.com,Initech\n"
+        "Dup,Second,dup@example.com,Initech\n" + rows
+    ).encode()
+    statements = []
+    engine = db_session.get_bind()
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = commit_csv_import(db=db_session, content=content, chunk_size=500)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert (result["created"], result["updated"], result["skipped"]) == (101, 3, 0)
+    assert len(statements) < 20
+    assert db_session.get(DBLead, "lead-a").last_name == "Diaz-Lopez"
+    assert db_session.get(DBLead, "lead-b").email == "ben@example.com"
+    assert db_session.query(DBLead).filter(DBLead.email == "dup@example.com").one().last_name == "Second"
+    assert db_session.query(DBCompany).count() == 3
+
+
+def test_csv_import_bulk_tasks_report_missing_leads_per_row(db_session):
+    db_session.add(DBLead(id="lead-1", first_name="Ana", email="ana@example.com"))
+    db_session.commit()
+    content = b"id,title,lead_id\nt-1,Call,lead-1\nt-2,Email,lead-404\nt-1,Call again,lead-1\n"
+
+    result = commit_csv_import(db=db_session, content=content, table="tasks")
+
+    assert (result["created"], result["updated"], result["skipped"]) == (1, 1, 1)
+    assert result["errors"] == [{"row": 3, "message": "Referenced lead_id 'lead-404' does not exist."}]
+    assert db_session.get(DBTask, "t-1").title == "Call again"
+
+
+def test_csv_import_falls_back_to_row_by_row_when_a_chunk_fails(db_session, monkeypatch):
+    def _failing_bulk(_db, _rows):
+        raise IntegrityError("INSERT", {}, Exception("duplicate"))
+
+    monkeypatch.setitem(import_service.BULK_UPSERTS, "projects", _failing_bulk)
+    content = b"name,status\nAlpha,Planning\nBeta,In Progress\n"
+
+    result = commit_csv_import(db=db_session, content=content, table="projects")
+
+    assert (result["created"], result["skipped"]) == (2, 0)
+    assert {project.name for project in db_session.query(DBProject)} == {"Alpha", "Beta"}
+
+
+def _projects_csv(count: int, *, bad_every: int = 0) -> bytes:
+    lines = ["id,name,status"]
+    for index in range(count):
+        status = "Nope" if bad_every and index % bad_every == 0 else "Planning"
+        lines.append(f"p-{index},Project {index},{status}")
+    return ("\n".join(lines) + "\n").encode()
+
+
+def test_interrupted_csv_import_resumes_from_its_last_chunk(db_session, tmp_path, monkeypatch):
+    monkeypatch.setenv("ADMIN_IMPORT_UPLOAD_DIR", str(tmp_path))
+    db_session.add(DBProject(id="p-1", name="Old name", status="Planning"))
+    db_session.commit()
+    upload = tmp_path / "upload.csv"
+    upload.write_bytes(_projects_csv(25, bad_every=4))
+
+    def _crash_after_first_chunk(checkpoint, _fraction):
+        if checkpoint.chunks_done == 1:
+            raise RuntimeError("worker died")
+
+    with pytest.raises(RuntimeError):
+        import_service.run_csv_import_job(
+            db_session,
+            job_id="job-1",
+            upload_path=upload,
+            table="projects",
+            chunk_size=10,
+            progress=_crash_after_first_chunk,
+        )
+    checkpoint = db_session.get(DBImportCheckpoint, "job-1")
+    assert (checkpoint.rows_done, checkpoint.updated, checkpoint.failed) == (10, 1, 3)
+    assert upload.exists()
+
+    result = import_service.run_csv_import_job(
+        db_session, job_id="job-1", upload_path=upload, table="projects", chunk_size=10
+    )
+
+    assert result["resumed_from_row"] == 10
+    assert (result["processed_rows"], result["created"], result["updated"], result["skipped"]) == (25, 17, 1, 7)
+    assert result["progress"]["validated"] == 18
+    assert [error["row"] for error in result["errors"]] == [2, 6, 10, 14, 18, 22, 26]
+    assert db_session.query(DBProject).count() == 18
+    assert db_session.get(DBProject, "p-1").name == "Project 1"
+    assert not upload.exists()
+
+
+def test_csv_import_job_progress_tracks_the_bytes_read(db_session, tmp_path, monkeypatch):
+    monkeypatch.setenv("ADMIN_IMPORT_UPLOAD_DIR", str(tmp_path))
+    upload = tmp_path / "upload.csv"
+    upload.write_bytes(_projects_csv(5000))
+    fractions = []
+
+    import_service.run_csv_import_job(
+        db_session,
+        job_id="job-2",
+        upload_path=upload,
+        table="projects",
+        progress=lambda _checkpoint, fraction: fractions.append(fraction),
+    )
+
+    assert len(fractions) == 10
+    assert fractions == sorted(fractions)
+    assert fractions[0] < 0.5 and fractions[-1] == 1.0
+
+
+def test_csv_import_job_error_report_lists_every_failed_row(client, tmp_path, monkeypatch):
+    monkeypatch.setenv("ADMIN_IMPORT_UPLOAD_DIR", str(tmp_path))
+    accepted = client.post(
+        "/api/v1/admin/import/csv/commit",
+        auth=("admin", "secret"),
+        files={"file": ("projects.csv", _projects_csv(120, bad_every=2), "text/csv")},
+        data={"table": "projects"},
+    )
+    job_id = accepted.json()["id"]
+
+    progress = client.get(f"/api/v1/admin/import/csv/jobs/{job_id}/progress", auth=("admin", "secret")).json()
+    assert progress["job"]["status"] == "succeeded"
+    assert (progress["progress"]["validated"], progress["progress"]["failed"]) == (60, 60)
+    assert len(progress["job"]["result"]["errors"]) == 50
+
+    report = client.get(f"/api/v1/admin/import/csv/jobs/{job_id}/errors", auth=("admin", "secret"))
+    assert report.status_code == 200
+    assert report.headers["content-type"].startswith("text/csv")
+    lines = report.text.strip().splitlines()
+    assert lines[0] == "row,message"
+    assert len(lines) == 61
+    assert lines[1] == "2,Unsupported project status: Nope"
+
+
+
+def test_cancelled_csv_import_job_removes_its_upload(client, tmp_path, monkeypatch):
+    upload_dir = tmp_path / "imports"
+    monkeypatch.setenv("ADMIN_IMPORT_UPLOAD_DIR", str(upload_dir))
+    monkeypatch.setenv("ADMIN_JOB_INLINE_DISPATCH", "false")
+    accepted = client.post(
+        "/api/v1/admin/import/csv/commit",
+        auth=("admin", "secret"),
+        files={"file": ("projects.csv", _projects_csv(3), "text/csv")},
+        data={"table": "projects"},
+    )
+    assert len(list(upload_dir.iterdir())) == 1
+
+    cancelled = client.post(f"/api/v1/admin/jobs/{accepted.json()['id']}/cancel", auth=("admin", "secret"))
+
+    assert cancelled.json()["status"] == "cancelled"
+    assert list(upload_dir.iterdir()) == []
+
+
+def test_csv_import_job_fails_fast_when_the_upload_is_not_on_this_worker(client, db_session, tmp_path, monkeypatch):
+    upload_dir = tmp_path / "imports"
+    monkeypatch.setenv("ADMIN_IMPORT_UPLOAD_DIR", str(upload_dir))
+    monkeypatch.setenv("ADMIN_JOB_INLINE_DISPATCH", "false")
+    accepted = client.post(
+        "/api/v1/admin/import/csv/commit",
+        auth=("admin", "secret"),
+        files={"file": ("projects.csv", _projects_csv(3), "text/csv")},
+        data={"table": "projects"},
+    )
+    for path in upload_dir.iterdir():
+        path.unlink()
+
+    assert job_queue.JobWorker(db_session.get_bind(), kinds=["csv_import"]).run_once() is True
+
+    job = client.get(f"/api/v1/admin/jobs/{accepted.json()['id']}", auth=("admin", "secret")).json()
+    assert job["status"] == "failed"
+    assert job["attempts"] == 1
+    assert "ADMIN_IMPORT_UPLOAD_DIR" in job["error_message"]
+
+
+def test_csv_import_validates_chunks_in_a_process_pool():
+    rows = [{"name": f"Project {index}", "status": "Nope" if index == 7 else "Planning"} for index in range(30)]
+
+    mapping = {"name": "name", "status": "status"}
+
+    chunks = list(
+        import_service._validated_chunks(rows, table="projects", mapping=mapping, chunk_size=8, first_index=2, workers=2)
+    )
+
+    assert [row_count for row_count, _valid, _errors in chunks] == [8, 8, 8, 6]
+    assert [index for _count, valid, _errors in chunks for index, _row in valid] == [
+        index + 2 for index in range(30) if index != 7
+    ]
+    assert chunks[0][2] == [{"row": 9, "message": "Unsupported project status: Nope"}]
+
+
+def test_spawned_validation_workers_of_the_job_worker_script_skip_the_admin_app(tmp_path):
+    # A spawn child re-runs the parent's main script as __mp_main__; run one shaped like job_worker.py.
+    root = Path(__file__).resolve().parents[1]
+    worker_script = (root / "scripts" / "ops" / "job_worker.py").read_text(encoding="utf-8")
+    module_level, _main_guard = worker_script.split('if __name__ == "__main__":')
+    script = tmp_path / "job_worker.py"
+    script.write_text(
+        module_level
+        + textwrap.dedent(
+            """
+            def _admin_app_loaded(_):
+                return "src.admin.app" in sys.modules
+
+
+            if __name__ == "__main__":
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                    print(pool.submit(_admin_app_loaded, None).result())
+            """
+        ),
+        encoding="utf-8",
+    )
+
+    result = subprocess.run(
+        [sys.executable, str(script)],
+        capture_output=True,
+        text=True,
+        timeout=120,
+        env={**os.environ, "PYTHONPATH": str(root)},
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.admin import job_queue
+from src.core.concurrency import remaining_seconds, set_deadline
+from src.core.db_models import DBJob, DBLead
+
+
+@pytest.fixture
+def flaky_handler():
+    calls: list[int] = []
+
+    @job_queue.job_handler("test_flaky")
+    def _flaky(db, ctx):
+        calls.append(ctx.attempt)
+        if ctx.payload.get("fail_until", 0) >= ctx.attempt:
+            raise RuntimeError(f"boom {ctx.attempt}")
+        return {"attempt": ctx.attempt}
+
+    yield calls
+    job_queue._handlers.pop("test_flaky", None)
+
+
+def test_rescore_endpoint_returns_job_and_runs_it(client, db_session):
+    db_session.add(DBLead(id="lead-1", first_name="Ana", last_name="Roy", email="ana@example.com"))
+    db_session.commit()
+
+    response = client.post("/api/v1/admin/rescore", auth=("admin", "secret"))
+    assert response.status_code == 202
+    queued = response.json()
+    assert queued["kind"] == "rescore"
+    assert queued["status"] == "queued"
+
+    job = client.get(f"/api/v1/admin/jobs/{queued['id']}", auth=("admin", "secret")).json()
+    assert job["status"] == "succeeded"
+    assert job["progress"] == 1.0
+    assert job["result"]["updated"] == 1
+
+    listing = client.get("/api/v1/admin/jobs?kind=rescore", auth=("admin", "secret")).json()
+    assert [item["id"] for item in listing["items"]] == [queued["id"]]
+    assert "csv_import" in listing["kinds"]
+
+
+def test_claim_is_exclusive_between_workers(db_session, flaky_handler):
+    bind = db_session.get_bind()
+    row = job_queue.enqueue_job(db_session, "test_flaky", {})
+
+    first = job_queue.claim_job(db_session, worker_id="worker-a", job_id=row.id)
+    second = job_queue.claim_job(db_session, worker_id="worker-b", job_id=row.id)
+
+    assert first is not None and first.lease_owner == "worker-a"
+    assert second is None
+    job_queue.execute_claimed_job(bind, first, worker_id="worker-a", lease_seconds=60)
+    db_session.expire_all()
+    assert db_session.get(DBJob, row.id).status == "succeeded"
+
+
+def test_failed_attempts_retry_with_backoff_then_fail(db_session, flaky_handler, monkeypatch):
+    monkeypatch.setenv("ADMIN_JOB_RETRY_BASE_SECONDS", "0")
+    worker = job_queue.JobWorker(db_session.get_bind(), kinds=["test_flaky"])
+    row = job_queue.enqueue_job(db_session, "test_flaky", {"fail_until": 5}, max_attempts=2)
+
+    assert worker.run_once() is True
+    db_session.expire_all()
+    retried = db_session.get(DBJob, row.id)
+    assert retried.status == "queued"
+    assert retried.error_message == "boom 1"
+
+    assert worker.run_once() is True
+    assert worker.run_once() is False
+    db_session.expire_all()
+    failed = db_session.get(DBJob, row.id)
+    assert failed.status == "failed"
+    assert failed.attempts == 2
+    assert flaky_handler == [1, 2]
+
+
+def test_retry_waits_for_backoff(db_session, flaky_handler, monkeypatch):
+    monkeypatch.setenv("ADMIN_JOB_RETRY_BASE_SECONDS", "60")
+    worker = job_queue.JobWorker(db_session.get_bind(), kinds=["test_flaky"])
+    row = job_queue.enqueue_job(db_session, "test_flaky", {"fail_until": 1})
+
+    assert worker.run_once() is True
+    assert worker.run_once() is False
+    db_session.expire_all()
+    assert db_session.get(DBJob, row.id).run_after > datetime.now() + timedelta(seconds=30)
+
+
+def test_expired_lease_is_reclaimed(db_session, flaky_handler):
+    row = job_queue.enqueue_job(db_session, "test_flaky", {})
+    assert job_queue.claim_job(db_session, worker_id="crashed", job_id=row.id) is not None
+    db_session.expire_all()
+    db_session.get(DBJob, row.id).lease_expires_at = datetime.now() - timedelta(seconds=1)
+    db_session.commit()
+
+    worker = job_queue.JobWorker(db_session.get_bind(), kinds=["test_flaky"])
+    assert worker.run_once() is True
+    db_session.expire_all()
+    reclaimed = db_session.get(DBJob, row.id)
+    assert reclaimed.status == "succeeded"
+    assert reclaimed.result_json == {"attempt": 2}
+
+
+def test_cancel_queued_and_running_jobs(client, db_session):
+    calls: list[str] = []
+
+    @job_queue.job_handler("test_slow")
+    def _slow(db, ctx):
+        calls.append(ctx.job_id)
+        ctx.report_progress(1, 10, "step 1")
+        return {"finished": True}
+
+    try:
+        queued = job_queue.enqueue_job(db_session, "test_slow", {})
+        response = client.post(f"/api/v1/admin/jobs/{queued.id}/cancel", auth=("admin", "secret"))
+        assert response.status_code == 200
+        assert response.json()["status"] == "cancelled"
+        again = client.post(f"/api/v1/admin/jobs/{queued.id}/cancel", auth=("admin", "secret"))
+        assert again.status_code == 409
+
+        running = job_queue.enqueue_job(db_session, "test_slow", {})
+        claimed = job_queue.claim_job(db_session, worker_id="worker-a", job_id=running.id)
+        db_session.expunge(claimed)
+        assert client.post(f"/api/v1/admin/jobs/{running.id}/cancel", auth=("admin", "secret")).json()[
+            "cancel_requested"
+        ]
+        job_queue.execute_claimed_job(db_session.get_bind(), claimed, worker_id="worker-a", lease_seconds=60)
+        db_session.expire_all()
+        stopped = db_session.get(DBJob, running.id)
+        assert stopped.status == "cancelled"
+        assert stopped.progress == pytest.approx(0.1)
+        assert calls == [running.id]
+    finally:
+        job_queue._handlers.pop("test_slow", None)
+
+
+def test_running_job_keeps_its_lease_without_reporting_progress(db_session):
+    other_claims = []
+
+    @job_queue.job_handler("test_slow")
+    def _slow(db, ctx):
+        time.sleep(1.5)
+        with Session(bind=ctx.bind) as other_db:
+            other_claims.append(job_queue.claim_job(other_db, worker_id="worker-b", job_id=ctx.job_id))
+        return {}
+
+    try:
+        row = job_queue.enqueue_job(db_session, "test_slow", {})
+        claimed = job_queue.claim_job(db_session, worker_id="worker-a", job_id=row.id, lease_seconds=1)
+        job_queue.execute_claimed_job(db_session.get_bind(), claimed, worker_id="worker-a", lease_seconds=1)
+    finally:
+        job_queue._handlers.pop("test_slow", None)
+
+    assert other_claims == [None]
+    db_session.expire_all()
+    finished = db_session.get(DBJob, row.id)
+    assert (finished.status, finished.attempts) == ("succeeded", 1)
+
+
+def test_inline_jobs_do_not_inherit_the_request_deadline(db_session):
+    seen: list[float | None] = []
+
+    @job_queue.job_handler("test_deadline")
+    def _deadline(db, ctx):
+        seen.append(remaining_seconds())
+
+    try:
+        row = job_queue.enqueue_job(db_session, "test_deadline", {})
+        # What a bulkhead guard leaves in the request context that BackgroundTasks run in.
+        set_deadline(0.5)
+        try:
+            job_queue.run_job_now(row.id, bind=db_session.get_bind())
+        finally:
+            set_deadline(None)
+    finally:
+        job_queue._handlers.pop("test_deadline", None)
+
+    assert seen == [None]
+    db_session.expire_all()
+    assert db_session.get(DBJob, row.id).status == "succeeded"
+
+
+def test_claims_respect_the_per_kind_concurrency_limit(db_session, monkeypatch):
+    @job_queue.job_handler("test_limited", max_concurrency=1)
+    def _limited(db, ctx):
+        return {}
+
+    try:
+        first = job_queue.enqueue_job(db_session, "test_limited", {})
+        second = job_queue.enqueue_job(db_session, "test_limited", {})
+
+        claimed = job_queue.claim_job(db_session, worker_id="worker-a", kinds=["test_limited"])
+        assert claimed is not None and claimed.id == first.id
+        assert job_queue.claim_job(db_session, worker_id="worker-b", kinds=["test_limited"]) is None
+
+        monkeypatch.setenv("ADMIN_JOB_TEST_LIMITED_CONCURRENCY", "0")
+        assert job_queue.claim_job(db_session, worker_id="worker-b", job_id=second.id) is not None
+        monkeypatch.delenv("ADMIN_JOB_TEST_LIMITED_CONCURRENCY")
+
+        third = job_queue.enqueue_job(db_session, "test_limited", {})
+        job_queue.execute_claimed_job(db_session.get_bind(), claimed, worker_id="worker-a", lease_seconds=60)
+        assert job_queue.claim_job(db_session, worker_id="worker-a", job_id=third.id) is None
+    finally:
+        job_queue._handlers.pop("test_limited", None)
+        job_queue._max_concurrency.pop("test_limited", None)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import sys
+import uuid
+from datetime import datetime
+
+from src.core.db_models import DBLead
+from src.core.models import LeadStage, LeadStatus
+from src.core.serialization import dumps_json
+
+
+def test_dumps_json_handles_native_types():
+    identifier = uuid.uuid4()
+    moment = datetime(2025, 3, 4, 10, 30, 15, 120000)
+    payload = json.loads(
+        dumps_json({"at": moment, "status": LeadStatus.CONTACTED, "id": identifier, "name": "Éloïse"})
+    )
+    assert payload == {
+        "at": moment.isoformat(),
+        "status": LeadStatus.CONTACTED.value,
+        "id": str(identifier),
+        "name": "Éloïse",
+    }
+
+
+def test_leads_list_renders_native_datetimes_as_iso_strings(client, db_session):
+    created_at = datetime(2025, 1, 2, 8, 15, 0, 500)
+    db_session.add(
+        DBLead(
+            id="json.lead@example.com",
+            email="json.lead@example.com",
+            first_name="Json",
+            last_name="Lead",
+            status=LeadStatus.NEW,
+            stage=LeadStage.NEW,
+            tags=["vip"],
+            created_at=created_at,
+            last_scored_at=created_at,
+        )
+    )
+    db_session.commit()
+
+    response = client.get("/api/v1/admin/leads?page_size=100", auth=("admin", "secret"))
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"].startswith('W/"')
+    item = response.json()["items"][0]
+    assert item["created_at"] == created_at.isoformat()
+    assert item["last_scored_at"] == created_at.isoformat()
+    assert item["status"] == "NEW"
+    assert item["tags"] == ["vip"]
+
+
+def test_rag_documents_are_served_with_fast_json(client, monkeypatch):
+    rag_service = sys.modules["src.admin.app"].rag_service
+    monkeypatch.setattr(rag_service, "vector_store", [{"id": "doc-1", "embedding": [0.25, -0.5]}])
+    response = client.get("/api/v1/admin/rag/documents", auth=("admin", "secret"))
+    assert response.status_code == 200
+    assert response.json() == {"items": [{"id": "doc-1", "embedding": [0.25, -0.5]}], "total": 1}
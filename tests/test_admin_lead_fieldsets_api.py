@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import event
+
+from src.core.db_models import DBAdminUser, DBCompany, DBInteraction, DBLead, DBTask
+from src.core.models import InteractionType, LeadStage, LeadStatus
+
+
+def _seed(db_session) -> None:
+    company = DBCompany(name="Sparse Corp", domain="sparse.example", industry="SaaS", location="Nantes")
+    db_session.add(company)
+    db_session.add(DBAdminUser(id="owner-1", email="owner@example.com", display_name="Olivia Owner"))
+    db_session.flush()
+    db_session.add(
+        DBLead(
+            id="sparse@example.com",
+            email="sparse@example.com",
+            first_name="Sparse",
+            last_name="Lead",
+            company_id=company.id,
+            lead_owner_user_id="owner-1",
+            status=LeadStatus.CONTACTED,
+            stage=LeadStage.CONTACTED,
+            total_score=81.0,
+            details={"notes": "x" * 500},
+            created_at=datetime.now(),
+        )
+    )
+    db_session.add_all(
+        [
+            DBTask(id="sparse-open", title="Call", status="To Do", lead_id="sparse@example.com"),
+            DBTask(id="sparse-done", title="Mail", status="Done", lead_id="sparse@example.com"),
+            DBInteraction(
+                lead_id="sparse@example.com",
+                type=InteractionType.EMAIL_OPENED,
+                timestamp=datetime(2025, 5, 1, 9, 0),
+            ),
+            DBInteraction(
+                lead_id="sparse@example.com",
+                type=InteractionType.EMAIL_REPLIED,
+                timestamp=datetime(2025, 5, 2, 9, 0),
+            ),
+        ]
+    )
+    db_session.commit()
+
+
+def test_leads_list_sparse_fields_limit_select_and_payload(client, db_session):
+    _seed(db_session)
+    statements: list[str] = []
+
+    def _capture(_conn, _cursor, statement, _params, _context, _executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        response = client.get(
+            "/api/v1/admin/leads?fields=id,first_name,total_score,company_name",
+            auth=("admin", "secret"),
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert item == {
+        "id": "sparse@example.com",
+        "first_name": "Sparse",
+        "total_score": 81.0,
+        "company_name": "Sparse Corp",
+    }
+    select_sql = next(sql for sql in statements if "LIMIT" in sql and "FROM leads" in sql)
+    assert "leads.details" not in select_sql
+    assert "leads.icp_breakdown" not in select_sql
+    assert "companies_1.name" in select_sql
+    assert "tech_stack" not in select_sql
+
+
+def test_leads_list_includes_and_default_shape(client, db_session):
+    _seed(db_session)
+    default_item = client.get("/api/v1/admin/leads", auth=("admin", "secret")).json()["items"][0]
+    assert default_item["company_name"] == "Sparse Corp"
+    assert "details" not in default_item
+    assert "owner" not in default_item
+
+    response = client.get(
+        "/api/v1/admin/leads?fields=id&include=company,owner,open_tasks_count,last_interaction",
+        auth=("admin", "secret"),
+    )
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert item["company"]["domain"] == "sparse.example"
+    assert item["owner"] == {"id": "owner-1", "email": "owner@example.com", "display_name": "Olivia Owner"}
+    assert item["open_tasks_count"] == 1
+    assert item["last_interaction"]["type"] == InteractionType.EMAIL_REPLIED.value
+    assert item["last_interaction"]["timestamp"] == "2025-05-02T09:00:00"
+
+
+def test_lead_detail_sparse_fields_and_validation(client, db_session):
+    _seed(db_session)
+    sparse = client.get(
+        "/api/v1/admin/leads/sparse@example.com?fields=id,status,details&include=open_tasks_count",
+        auth=("admin", "secret"),
+    )
+    assert sparse.status_code == 200
+    assert sparse.json() == {
+        "id": "sparse@example.com",
+        "status": "CONTACTED",
+        "details": {"notes": "x" * 500},
+        "open_tasks_count": 1,
+    }
+    assert client.get(
+        "/api/v1/admin/leads/missing@example.com?fields=id", auth=("admin", "secret")
+    ).status_code == 404
+
+    invalid = client.get("/api/v1/admin/leads?fields=id,password_hash", auth=("admin", "secret"))
+    assert invalid.status_code == 422
+    assert client.get("/api/v1/admin/leads?include=everything", auth=("admin", "secret")).status_code == 422
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+
+from src.core.db_models import DBInteraction, DBProject, DBTask
+from src.core.models import InteractionType
+
+
+def _seed_workspace(client, db_session) -> str:
+    response = client.post(
+        "/api/v1/admin/leads",
+        auth=("admin", "secret"),
+        json={
+            "first_name": "Work",
+            "last_name": "Space",
+            "email": "workspace@example.com",
+            "company_name": "Acme Clinic",
+            "status": "NEW",
+            "segment": "SMB",
+        },
+    )
+    assert response.status_code == 200, response.text
+    lead_id = response.json()["id"]
+
+    client.put(
+        f"/api/v1/admin/leads/{lead_id}/notes",
+        auth=("admin", "secret"),
+        json={"items": [{"id": "note-1", "content": "Premier echange qualifie."}]},
+    )
+    client.post(
+        f"/api/v1/admin/leads/{lead_id}/opportunities",
+        auth=("admin", "secret"),
+        json={"name": "Pack annuel", "stage": "proposal", "amount": 4500, "probability": 55},
+    )
+    now = datetime.now()
+    db_session.add_all(
+        [
+            DBInteraction(lead_id=lead_id, type=InteractionType.EMAIL_SENT, timestamp=now - timedelta(days=2)),
+            DBInteraction(lead_id=lead_id, type=InteractionType.EMAIL_OPENED, timestamp=now - timedelta(days=1)),
+            DBInteraction(lead_id=lead_id, type=InteractionType.EMAIL_REPLIED, timestamp=now - timedelta(days=90)),
+            DBTask(id="ws-task-1", title="Relance", status="To Do", lead_id=lead_id, created_at=now),
+            DBTask(id="ws-task-2", title="Ancienne", status="Done", lead_id=lead_id, created_at=now - timedelta(days=60)),
+            DBProject(id="ws-project", name="Onboarding", status="Planning", lead_id=lead_id, created_at=now),
+        ]
+    )
+    db_session.commit()
+    return lead_id
+
+
+def _without_clock_fields(payload: dict) -> dict:
+    return {key: value for key, value in payload.items() if key not in {"from", "to", "generated_at"}}
+
+
+def test_lead_workspace_matches_individual_endpoints(client, db_session):
+    lead_id = _seed_workspace(client, db_session)
+
+    workspace = client.get(f"/api/v1/admin/leads/{lead_id}/workspace", auth=("admin", "secret"))
+    assert workspace.status_code == 200, workspace.text
+    body = workspace.json()
+
+    def _get(path: str):
+        return client.get(f"/api/v1/admin/leads/{lead_id}{path}", auth=("admin", "secret")).json()
+
+    assert body["lead"] == _get("")
+    assert body["interactions"] == _get("/interactions")
+    assert body["opportunities"] == _get("/opportunities")
+    assert body["tasks"] == _get("/tasks")
+    assert body["projects"] == _get("/projects")
+    assert body["notes"] == _get("/notes")
+    assert _without_clock_fields(body["communication_plan"]) == _without_clock_fields(_get("/communication-plan"))
+    assert _without_clock_fields(body["history"]) == _without_clock_fields(_get("/history?window=30d"))
+
+    event_types = [item["event_type"] for item in body["history"]["items"]]
+    assert "task_created" in event_types
+    assert "lead_notes_updated" in event_types
+    assert event_types.count("interaction") == 2
+
+
+def test_lead_workspace_uses_a_fixed_number_of_queries(client, db_session):
+    lead_id = _seed_workspace(client, db_session)
+    statements: list[str] = []
+
+    def _capture(_conn, _cursor, statement, _params, _context, _executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        response = client.get(
+            f"/api/v1/admin/leads/{lead_id}/workspace?window=7d&channels=email,call",
+            auth=("admin", "secret"),
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+
+    assert response.status_code == 200
+    assert response.json()["history"]["window"] == "7d"
+    selects = [sql for sql in statements if sql.lstrip().upper().startswith("SELECT")]
+    assert len(selects) <= 6
+
+    missing = client.get("/api/v1/admin/leads/missing@example.com/workspace", auth=("admin", "secret"))
+    assert missing.status_code == 404
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import update
+
+from src.admin import notification_counters
+
+from src.core.db_models import DBNotification, DBNotificationCounter
+
+
+def _create(client, event_key: str, channel: str = "in_app") -> str:
+    response = client.post(
+        "/api/v1/admin/notifications",
+        auth=("admin", "secret"),
+        json={"event_key": event_key, "title": "Titre", "message": "Message", "channel": channel},
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["items"][0]["id"]
+
+
+def _unread(client, query: str = "") -> dict:
+    response = client.get(f"/api/v1/admin/notifications/unread-count{query}", auth=("admin", "secret"))
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_unread_counters_follow_create_and_mark_read(client):
+    first = _create(client, "report_ready")
+    _create(client, "report_ready")
+    _create(client, "lead_created")
+
+    counts = _unread(client)
+    assert counts == {
+        "unread_count": 3,
+        "by_channel": {"in_app": 3},
+        "by_event_key": {"report_ready": 2, "lead_created": 1},
+    }
+    assert _unread(client, "?event_key=lead_created")["unread_count"] == 1
+
+    client.post("/api/v1/admin/notifications/mark-read", auth=("admin", "secret"), json={"ids": [first, first]})
+    assert _unread(client)["by_event_key"] == {"report_ready": 1, "lead_created": 1}
+    listed = client.get("/api/v1/admin/notifications?limit=5", auth=("admin", "secret")).json()
+    assert listed["unread_count"] == 2
+
+    client.post("/api/v1/admin/notifications/mark-all-read", auth=("admin", "secret"))
+    assert _unread(client)["unread_count"] == 0
+
+
+def test_unread_count_supports_conditional_get(client):
+    _create(client, "report_ready")
+    first = client.get("/api/v1/admin/notifications/unread-count", auth=("admin", "secret"))
+    etag = first.headers["etag"]
+
+    cached = client.get(
+        "/api/v1/admin/notifications/unread-count",
+        auth=("admin", "secret"),
+        headers={"If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+
+    _create(client, "report_ready")
+    changed = client.get(
+        "/api/v1/admin/notifications/unread-count",
+        auth=("admin", "secret"),
+        headers={"If-None-Match": etag},
+    )
+    assert changed.status_code == 200
+    assert changed.json()["unread_count"] == 2
+
+
+def test_rolled_back_notifications_leave_counters_untouched(db_session):
+    db_session.add(DBNotification(id="n-1", event_key="report_ready", title="t", message="m"))
+    db_session.flush()
+    db_session.rollback()
+
+    assert db_session.query(DBNotificationCounter).count() == 0
+
+
+def test_reconcile_job_fixes_drifted_counters(client, db_session):
+    _create(client, "report_ready")
+    _create(client, "report_ready")
+    # A write that bypasses the ORM hook.
+    db_session.execute(update(DBNotification).values(is_read=True))
+    db_session.commit()
+    assert _unread(client)["unread_count"] == 2
+
+    response = client.post("/api/v1/admin/notifications/unread-count/reconcile", auth=("admin", "secret"))
+    assert response.status_code == 202
+    job = client.get(f"/api/v1/admin/jobs/{response.json()['id']}", auth=("admin", "secret")).json()
+    assert job["status"] == "succeeded"
+    assert job["result"] == {"checked": 1, "corrected": 1, "unread_count": 0}
+    assert _unread(client)["unread_count"] == 0
+
+
+@pytest.mark.parametrize("upsert", [True, False], ids=["upsert", "savepoint"])
+def test_counter_writes_merge_into_a_row_created_concurrently(db_session, monkeypatch, upsert):
+    if not upsert:
+        monkeypatch.setattr(notification_counters, "_UPSERT_DIALECTS", {})
+    connection = db_session.connection()
+    # The UPDATE of a racing flush saw no row; its INSERT must not fail on the one another flush created.
+    monkeypatch.setattr(connection, "execute", _first_update_misses(connection.execute))
+    db_session.add(DBNotificationCounter(channel="in_app", event_key="report_ready", unread_count=2))
+    db_session.flush()
+
+    db_session.add(DBNotification(id="n-1", event_key="report_ready", title="t", message="m"))
+    db_session.commit()
+
+    counter = db_session.get(DBNotificationCounter, ("in_app", "report_ready"))
+    assert counter.unread_count == 3
+
+
+def _first_update_misses(execute):
+    missed = []
+
+    def _execute(statement, *args, **kwargs):
+        if getattr(statement, "is_update", False) and statement.table is DBNotificationCounter.__table__ and not missed:
+            missed.append(statement)
+            return SimpleNamespace(rowcount=0)
+        return execute(statement, *args, **kwargs)
+
+    return _execute
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import smtplib
+import sys
+from datetime import datetime, timedelta
+
+from src.admin import notification_outbox as _outbox
+from src.admin.notification_outbox import SmtpSender, SmtpSettings, dispatch_outbox, enqueue_email
+from src.core.db_models import DBNotification, DBNotificationOutbox
+
+
+admin_app_module = sys.modules["src.admin.app"]
+
+SETTINGS = SmtpSettings(host="smtp.test", port=587, username="bot", password="pw", sender="bot@test", use_tls=True)
+
+
+class FakeSMTP:
+    opened: list["FakeSMTP"] = []
+    fail_with: Exception | None = None
+
+    def __init__(self, host, port, timeout=None):
+        self.sent = []
+        FakeSMTP.opened.append(self)
+
+    def starttls(self):
+        pass
+
+    def login(self, username, password):
+        pass
+
+    def send_message(self, message):
+        if FakeSMTP.fail_with is not None:
+            raise FakeSMTP.fail_with
+        self.sent.append(message)
+
+    def quit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _fake_sender() -> SmtpSender:
+    FakeSMTP.opened = []
+    FakeSMTP.fail_with = None
+    return SmtpSender(smtp_factory=FakeSMTP)
+
+
+def test_email_notification_is_queued_not_sent_inline(client, db_session, monkeypatch):
+    monkeypatch.setenv("ADMIN_NOTIFICATION_DIGEST_WINDOW_SECONDS", "0")
+    sender = _fake_sender()
+    monkeypatch.setattr(admin_app_module, "smtp_sender", sender)
+    monkeypatch.setenv("SMTP_HOST", "smtp.test")
+
+    response = client.post(
+        "/api/v1/admin/notifications",
+        auth=("admin", "secret"),
+        json={"event_key": "report_ready", "title": "Rapport", "message": "Pret", "channel": "email"},
+    )
+    assert response.status_code == 200, response.text
+    item = response.json()["items"][0]
+    assert item["sent_at"] is None
+    assert FakeSMTP.opened == []
+
+    queued = db_session.query(DBNotificationOutbox).one()
+    assert (queued.notification_id, queued.status, queued.subject) == (item["id"], "pending", "Rapport")
+
+    dispatched = client.post("/api/v1/admin/notifications/outbox/dispatch", auth=("admin", "secret"))
+    assert dispatched.status_code == 200
+    assert dispatched.json() == {"claimed": 1, "sent": 1, "messages": 1, "retried": 0, "failed": 0, "skipped": 0}
+    db_session.expire_all()
+    assert db_session.get(DBNotification, item["id"]).sent_at is not None
+
+    stats = client.get("/api/v1/admin/notifications/outbox", auth=("admin", "secret")).json()
+    assert stats["by_status"]["sent"] == 1
+    assert stats["smtp"]["messages_sent"] == 1
+
+
+def test_dispatch_digests_per_recipient_over_one_connection(db_session, monkeypatch):
+    monkeypatch.setenv("ADMIN_NOTIFICATION_DIGEST_WINDOW_SECONDS", "0")
+    sender = _fake_sender()
+    for index in range(3):
+        enqueue_email(db_session, recipient="ops@test", subject=f"Alerte {index}", body="corps")
+    enqueue_email(db_session, recipient="sales@test", subject="Lead", body="corps")
+    db_session.commit()
+
+    result = dispatch_outbox(db_session, sender, SETTINGS, dispatcher_id="t")
+
+    assert result == {"claimed": 4, "sent": 4, "messages": 2, "retried": 0, "failed": 0, "skipped": 0}
+    assert len(FakeSMTP.opened) == 1
+    subjects = sorted(message["Subject"] for message in FakeSMTP.opened[0].sent)
+    assert subjects == ["3 nouvelles notifications", "Lead"]
+    assert {row.digest_size for row in db_session.query(DBNotificationOutbox)} == {1, 3}
+
+
+def test_failed_delivery_backs_off_then_gives_up(db_session, monkeypatch):
+    monkeypatch.setenv("ADMIN_NOTIFICATION_DIGEST_WINDOW_SECONDS", "0")
+    sender = _fake_sender()
+    FakeSMTP.fail_with = smtplib.SMTPRecipientsRefused({"ops@test": (550, b"no")})
+    row = enqueue_email(db_session, recipient="ops@test", subject="Alerte", body="corps")
+    db_session.commit()
+
+    first = dispatch_outbox(db_session, sender, SETTINGS, dispatcher_id="t", max_attempts=2)
+    assert first["retried"] == 1
+    assert row.status == "pending" and row.next_attempt_at > datetime.now()
+    assert dispatch_outbox(db_session, sender, SETTINGS, dispatcher_id="t", max_attempts=2)["claimed"] == 0
+
+    row.next_attempt_at = datetime.now() - timedelta(seconds=1)
+    db_session.commit()
+    second = dispatch_outbox(db_session, sender, SETTINGS, dispatcher_id="t", max_attempts=2)
+    assert second["failed"] == 1
+    assert (row.status, row.attempts) == ("failed", 2)
+
+
+def test_dispatch_without_smtp_settings_skips_rows(db_session, monkeypatch):
+    monkeypatch.setenv("ADMIN_NOTIFICATION_DIGEST_WINDOW_SECONDS", "0")
+    row = enqueue_email(db_session, recipient="ops@test", subject="Alerte", body="corps")
+    db_session.commit()
+
+    result = dispatch_outbox(db_session, _fake_sender(), None, dispatcher_id="t")
+
+    assert result["skipped"] == 1
+    assert row.status == "skipped"
+    assert FakeSMTP.opened == []
+
+
+def test_rows_claimed_by_an_earlier_call_are_not_sent_again(db_session, monkeypatch):
+    monkeypatch.setenv("ADMIN_NOTIFICATION_DIGEST_WINDOW_SECONDS", "0")
+    sender = _fake_sender()
+    enqueue_email(db_session, recipient="ops@test", subject="Alerte", body="corps")
+    db_session.commit()
+    in_flight = _outbox._claim_batch(db_session, "api:outbox", batch_size=10, lease_seconds=300)
+    assert len(in_flight) == 1
+
+    result = dispatch_outbox(db_session, sender, SETTINGS, dispatcher_id="api:outbox")
+
+    assert result["claimed"] == 0
+    assert FakeSMTP.opened == []
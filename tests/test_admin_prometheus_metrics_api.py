@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import random
+import sys
+
+from src.core.metrics import StreamingHistogram, track_external_call
+
+
+def test_streaming_histogram_quantiles_use_fixed_memory():
+    histogram = StreamingHistogram()
+    bucket_count = len(histogram._counts)
+    generator = random.Random(42)
+    values = sorted(generator.uniform(1, 1_000) for _ in range(20_000))
+    for value in values:
+        histogram.record(value)
+
+    assert len(histogram._counts) == bucket_count
+    assert histogram.count == 20_000
+    for quantile in (0.5, 0.95, 0.99):
+        exact = values[int(quantile * len(values)) - 1]
+        assert abs(histogram.quantile(quantile) - exact) / exact < 0.07
+
+    histogram.record(10**7)
+    assert histogram.quantile(1.0) == 10**7
+
+
+def test_prometheus_endpoint_exposes_latency_db_and_external_metrics(client):
+    assert client.get("/api/v1/admin/stats", auth=("admin", "secret")).status_code == 200
+    request_metrics = sys.modules["src.admin.app"].request_metrics
+    with track_external_call("llm"):
+        pass
+
+    response = client.get("/metrics", auth=("admin", "secret"))
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert "# TYPE admin_http_request_duration_seconds histogram" in lines
+    assert any(
+        line.startswith('admin_http_request_duration_seconds_bucket{path="/api/v1/admin/stats",le="+Inf"}')
+        for line in lines
+    )
+    assert any(
+        line.startswith('admin_http_request_duration_quantile_seconds{path="/api/v1/admin/stats",quantile="0.99"}')
+        for line in lines
+    )
+    db_queries = next(line for line in lines if line.startswith('admin_db_queries_total{path="/api/v1/admin/stats"}'))
+    assert int(db_queries.rsplit(" ", 1)[1]) > 0
+    assert any(line.startswith('admin_external_calls_total{service="llm",outcome="ok"}') for line in lines)
+
+    snapshot = request_metrics.snapshot()
+    stats_entry = next(item for item in snapshot["endpoints"] if item["path"] == "/api/v1/admin/stats")
+    assert {"p50_ms", "p95_ms", "p99_ms", "db_time_ms", "response_bytes"} <= set(stats_entry)
+    assert stats_entry["db_queries"] > 0
+    assert snapshot["external_calls"]["llm"]["calls"] >= 1
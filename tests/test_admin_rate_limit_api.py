@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import sys
+
+from src.core.rate_limit import InMemoryRateLimiter, SQLiteRateLimiter
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_sliding_window_counter_weights_the_previous_window():
+    clock = _Clock(1_000.0)
+    limiter = InMemoryRateLimiter(clock=clock)
+
+    assert [limiter.allow("ip:/leads", limit=10, window_seconds=60) for _ in range(11)] == [True] * 10 + [False]
+    blocked = limiter.check("ip:/leads", limit=10, window_seconds=60)
+    assert blocked.retry_after_seconds >= 1
+
+    # Half of the next window has elapsed: the 10 previous hits count as ~5.
+    clock.now = 1_050.0
+    assert [limiter.allow("ip:/leads", limit=10, window_seconds=60) for _ in range(6)] == [True] * 5 + [False]
+
+    clock.now = 1_200.0
+    assert limiter.check("ip:/leads", limit=10, window_seconds=60).remaining == 9
+
+
+def test_in_memory_limiter_keeps_bounded_state():
+    clock = _Clock(5_000.0)
+    limiter = InMemoryRateLimiter(max_keys=100, clock=clock)
+    for index in range(1_000):
+        limiter.allow(f"10.0.0.{index}:/api", limit=5, window_seconds=60)
+    assert len(limiter) == 100
+
+    # Idle keys expire after two windows even below the size cap.
+    clock.now += 180
+    limiter.allow("fresh:/api", limit=5, window_seconds=60)
+    assert len(limiter) == 1
+
+
+def test_sqlite_backend_shares_counters_between_workers(tmp_path):
+    clock = _Clock(2_000.0)
+    path = tmp_path / "rate_limits.sqlite3"
+    worker_a = SQLiteRateLimiter(path, clock=clock)
+    worker_b = SQLiteRateLimiter(path, clock=clock)
+    try:
+        outcomes = [
+            (worker_a if index % 2 else worker_b).allow("ip:/leads", limit=6, window_seconds=60)
+            for index in range(8)
+        ]
+        assert outcomes == [True] * 6 + [False, False]
+        assert worker_a.allow("other:/leads", limit=6, window_seconds=60)
+    finally:
+        worker_a.close()
+        worker_b.close()
+
+
+def test_rate_limited_request_returns_retry_after(client, monkeypatch):
+    monkeypatch.setenv("ADMIN_RATE_LIMIT_PER_MINUTE", "2")
+    monkeypatch.setattr(sys.modules["src.admin.app"], "rate_limiter", InMemoryRateLimiter())
+
+    statuses = [
+        client.get("/api/v1/admin/stats", auth=("admin", "secret")).status_code for _ in range(2)
+    ]
+    assert statuses == [200, 200]
+    limited = client.get("/api/v1/admin/stats", auth=("admin", "secret"))
+    assert limited.status_code == 429
+    assert int(limited.headers["retry-after"]) >= 1
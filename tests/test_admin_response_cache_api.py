@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+from src.core.cache import ResponseCache
+from src.core.db_models import DBLead, DBOpportunity
+from src.core.models import LeadStage, LeadStatus
+
+
+def _add_lead(db_session, lead_id: str) -> None:
+    db_session.add(
+        DBLead(
+            id=lead_id,
+            email=lead_id,
+            first_name="Cache",
+            last_name="Lead",
+            status=LeadStatus.NEW,
+            stage=LeadStage.NEW,
+            created_at=datetime.now(),
+        )
+    )
+    db_session.commit()
+
+
+def test_stats_are_served_from_cache_until_a_lead_write_commits(client, db_session):
+    _add_lead(db_session, "cache-1@example.com")
+
+    first = client.get("/api/v1/admin/stats", auth=("admin", "secret"))
+    assert first.status_code == 200
+    assert first.json()["total_leads"] == 1
+
+    second = client.get("/api/v1/admin/stats", auth=("admin", "secret"))
+    assert second.json() == first.json()
+    cache_stats = client.get("/api/v1/admin/metrics", auth=("admin", "secret")).json()["response_cache"]
+    assert cache_stats["hits"] >= 1
+
+    _add_lead(db_session, "cache-2@example.com")
+    third = client.get("/api/v1/admin/stats", auth=("admin", "secret"))
+    assert third.json()["total_leads"] == 2
+
+
+def test_api_writes_invalidate_cached_stats(client):
+    before = client.get("/api/v1/admin/stats", auth=("admin", "secret")).json()
+
+    created = client.post(
+        "/api/v1/admin/tasks",
+        json={"title": "Relancer le prospect", "status": "To Do"},
+        auth=("admin", "secret"),
+    )
+    assert created.status_code == 200
+
+    after = client.get("/api/v1/admin/stats", auth=("admin", "secret")).json()
+    assert after["pending_tasks"] == before["pending_tasks"] + 1
+
+
+def test_opportunities_forecast_is_routed_and_invalidated(client, db_session):
+    _add_lead(db_session, "forecast@example.com")
+    empty = client.get("/api/v1/admin/opportunities/forecast", auth=("admin", "secret"))
+    assert empty.status_code == 200
+    assert empty.json() == {"forecast_monthly": []}
+
+    db_session.add(
+        DBOpportunity(
+            id="opp-forecast",
+            lead_id="forecast@example.com",
+            name="Forecast deal",
+            stage="qualification",
+            status="open",
+            amount=1000.0,
+            probability=50,
+            expected_close_date=datetime.now() + timedelta(days=10),
+        )
+    )
+    db_session.commit()
+
+    payload = client.get("/api/v1/admin/opportunities/forecast", auth=("admin", "secret")).json()
+    assert payload["forecast_monthly"][0]["count"] == 1
+    assert payload["forecast_monthly"][0]["weighted_revenue"] == 500.0
+
+
+def test_concurrent_misses_are_computed_once():
+    cache = ResponseCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"value": 42}
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("stats", compute, ttl_seconds=30)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"value": 42}] * 8
+
+
+def test_tag_invalidation_and_ttl_expiry():
+    cache = ResponseCache()
+    counter = iter(range(100))
+
+    assert cache.get_or_compute("k", lambda: next(counter), ttl_seconds=30, tags=("leads",)) == 0
+    assert cache.get_or_compute("k", lambda: next(counter), ttl_seconds=30, tags=("leads",)) == 0
+    cache.invalidate("tasks")
+    assert cache.get_or_compute("k", lambda: next(counter), ttl_seconds=30, tags=("leads",)) == 0
+    cache.invalidate("leads")
+    assert cache.get_or_compute("k", lambda: next(counter), ttl_seconds=30, tags=("leads",)) == 1
+
+    assert cache.get_or_compute("short", lambda: next(counter), ttl_seconds=0.01) == 2
+    time.sleep(0.02)
+    assert cache.get_or_compute("short", lambda: next(counter), ttl_seconds=0.01) == 3
+
+
+def test_savepoint_rollback_keeps_earlier_invalidations(client, db_session):
+    before = client.get("/api/v1/admin/stats", auth=("admin", "secret")).json()
+
+    db_session.add(
+        DBLead(id="kept@example.com", email="kept@example.com", first_name="Kept", status=LeadStatus.NEW)
+    )
+    db_session.flush()
+    savepoint = db_session.begin_nested()
+    db_session.add(DBLead(id="dropped@example.com", email="dropped@example.com", first_name="Dropped"))
+    db_session.flush()
+    savepoint.rollback()
+    db_session.commit()
+
+    after = client.get("/api/v1/admin/stats", auth=("admin", "secret")).json()
+    assert after["total_leads"] == before["total_leads"] + 1
@@ -9,7 +9,7 @@ def test_settings_defaults_and_persistence(client):
     assert "support_email" in defaults
     assert defaults["default_page_size"] >= 5
     assert defaults["theme"] in {"light", "dark", "system"}
-    assert defaults["default_refresh_mode"] in {"manual", "polling"}
+    assert defaults["default_refresh_mode"] in {"manual", "polling", "push"}
     assert isinstance(defaults["notifications"], dict)
 
     update_payload = {
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import logging
+import sys
+
+from sqlalchemy import select
+
+import src.core.metrics as metrics
+from src.core.db_models import DBLead
+from src.core.metrics import statement_shape, track_request_usage
+
+
+def test_statement_shape_ignores_values():
+    first = statement_shape("SELECT * FROM leads WHERE id = 5 AND email = 'a@example.com' AND stage IN (?, ?, ?)")
+    second = statement_shape("SELECT *\n  FROM leads WHERE id = 77 AND email = 'b@example.com' AND stage IN (?, ?)")
+    assert first == second == "SELECT * FROM leads WHERE id = ? AND email = ? AND stage IN (?)"
+
+
+def test_repeated_statement_shapes_are_reported(db_session):
+    with track_request_usage() as usage:
+        for index in range(6):
+            db_session.execute(select(DBLead).where(DBLead.id == index)).all()
+        db_session.execute(select(DBLead.email)).all()
+
+    assert usage.db_queries == 7
+    repeated = usage.repeated_statements(5)
+    assert len(repeated) == 1
+    assert repeated[0][1] == 6
+    assert "FROM leads" in repeated[0][0]
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(level=logging.WARNING)
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def test_slow_query_log_redacts_bound_values(db_session, monkeypatch):
+    monkeypatch.setattr(metrics, "_slow_query_threshold_ms", 1e-6)
+    handler = _ListHandler()
+    metrics.logger.addHandler(handler)
+    try:
+        db_session.execute(select(DBLead).where(DBLead.email == "private@example.com")).all()
+    finally:
+        metrics.logger.removeHandler(handler)
+
+    records = [record for record in handler.records if record.getMessage() == "slow_query"]
+    assert records
+    assert records[0].parameters == "<1 redacted>"
+    assert all("private@example.com" not in str(record.__dict__) for record in records)
+
+
+def test_responses_carry_db_headers_and_feed_endpoint_metrics(client, monkeypatch):
+    monkeypatch.setenv("ADMIN_N_PLUS_ONE_THRESHOLD", "1")
+    response = client.get("/api/v1/admin/leads", auth=("admin", "secret"))
+    assert response.status_code == 200
+    assert int(response.headers["x-db-query-count"]) >= 1
+    assert float(response.headers["x-db-time-ms"]) >= 0
+    assert int(response.headers["x-db-repeated-statements"]) >= 1
+
+    snapshot = sys.modules["src.admin.app"].request_metrics.snapshot()
+    endpoint = next(item for item in snapshot["endpoints"] if item["path"] == "/api/v1/admin/leads")
+    assert endpoint["db_queries_per_request"] >= 1
+    assert endpoint["n_plus_one_requests"] >= 1
+
+
+def test_db_headers_are_hidden_in_production(client, monkeypatch):
+    monkeypatch.setenv("APP_ENV", "production")
+    response = client.get("/api/v1/admin/leads", auth=("admin", "secret"))
+    assert response.status_code == 200
+    assert "x-db-query-count" not in response.headers
+    assert "x-db-time-ms" not in response.headers
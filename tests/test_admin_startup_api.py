@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+from src.core.startup import LazySingleton, StartupProfiler, warm_up_in_background
+
+
+class _Service:
+    instances = 0
+
+    def __init__(self) -> None:
+        type(self).instances += 1
+        self.value = "ready"
+
+    def ping(self) -> str:
+        return f"pong:{self.value}"
+
+
+def test_lazy_singleton_builds_on_first_use_and_forwards_attributes():
+    _Service.instances = 0
+    profiler = StartupProfiler()
+    service = LazySingleton("service", _Service, profiler=profiler)
+
+    assert not service.initialized
+    assert _Service.instances == 0
+
+    assert service.ping() == "pong:ready"
+    service.value = "patched"
+    assert service.get().value == "patched"
+    assert service.ping() == "pong:patched"
+    assert _Service.instances == 1
+
+    report = profiler.report()
+    assert [entry["name"] for entry in report["subsystems"]] == ["service"]
+    assert report["by_phase"]["init"] >= 0
+
+
+def test_background_warm_up_is_not_counted_as_blocking_time():
+    profiler = StartupProfiler()
+    first = LazySingleton("first", _Service, profiler=profiler)
+    second = LazySingleton("second", _Service, profiler=profiler)
+    first.get()
+
+    warm_up_in_background([first, second]).join(timeout=5)
+
+    assert second.initialized
+    report = profiler.report()
+    flags = {entry["name"]: entry["background"] for entry in report["subsystems"]}
+    assert flags == {"first": False, "second": True}
+    assert report["blocking_ms"] == report["by_phase"]["init"]
+
+
+def test_startup_profile_endpoint_reports_subsystems(client):
+    response = client.get("/api/v1/admin/diagnostics/startup", auth=("admin", "secret"))
+    assert response.status_code == 200
+    body = response.json()
+    names = {entry["name"] for entry in body["subsystems"]}
+    assert {"src.admin.app", "create_app"} <= names
+    assert set(body["lazy_subsystems"]) == {"scoring_engine", "message_generator", "rag_service"}
+    assert body["blocking_ms"] > 0
+
+
+def test_importing_the_app_does_not_load_heavy_dependencies():
+    script = (
+        "import sys; import src.admin.app; "
+        "print('loaded=' + ','.join(name for name in ('openai', 'pandas', 'pypdf') if name in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).resolve().parents[1],
+        env={"PATH": ""},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert "loaded=\n" in result.stdout
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+
+from src.core.http import HttpRequestConfig, request_with_retries
+from src.core.tracing import TraceStore, span, start_trace
+
+
+class _Response:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class _FlakySession:
+    def __init__(self, statuses: list[int]) -> None:
+        self._statuses = list(statuses)
+
+    def request(self, method, url, timeout=None, **kwargs):
+        return _Response(self._statuses.pop(0))
+
+
+def test_http_retries_and_backoff_are_traced():
+    store = TraceStore()
+    config = HttpRequestConfig(max_retries=3, backoff_base_seconds=0.0)
+    with start_trace(store, "req-http", "GET /research"):
+        response = request_with_retries(
+            _FlakySession([503, 200]),
+            "GET",
+            "https://api.example.com/search?api_key=secret",
+            config=config,
+        )
+    assert response.status_code == 200
+
+    spans = {item["name"]: item for item in store.get("req-http")}
+    names = [item["name"] for item in store.get("req-http")]
+    assert names.count("http.attempt") == 2
+    assert names.count("http.backoff") == 1
+    request_span = spans["http.request"]
+    assert request_span["parent_id"] == spans["GET /research"]["span_id"]
+    assert request_span["attributes"]["http.url"] == "https://api.example.com/search"
+    assert request_span["attributes"]["http.status_code"] == 200
+    assert spans["http.backoff"]["parent_id"] == request_span["span_id"]
+
+
+def test_spans_are_noops_outside_a_trace():
+    with span("orphan") as current:
+        assert current is None
+
+
+def test_trace_store_exports_jsonl_and_reads_back_evicted_traces(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    store = TraceStore(max_traces=1, path=path)
+    with start_trace(store, "req-1", "first"):
+        with span("work", kind="internal", step=1):
+            pass
+    with start_trace(store, "req-2", "second"):
+        pass
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [line["trace_id"] for line in lines] == ["req-1", "req-1", "req-2"]
+    assert [item["name"] for item in store.get("req-1")] == ["first", "work"]
+
+
+def test_trace_viewer_shows_request_spans(client):
+    response = client.get("/api/v1/admin/leads", auth=("admin", "secret"), headers={"x-request-id": "trace-leads-1"})
+    assert response.status_code == 200
+
+    trace = client.get("/api/v1/admin/traces/trace-leads-1", auth=("admin", "secret"))
+    assert trace.status_code == 200
+    body = trace.json()
+    assert body["name"] == "GET /api/v1/admin/leads"
+    assert body["spans"][0]["attributes"]["http.status_code"] == 200
+    assert body["time_by_span_name"]["db.query"]["count"] >= 1
+    db_spans = [item for item in body["spans"] if item["name"] == "db.query"]
+    assert all(item["depth"] == 1 for item in db_spans)
+
+    missing = client.get("/api/v1/admin/traces/unknown-request", auth=("admin", "secret"))
+    assert missing.status_code == 404